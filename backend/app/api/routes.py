@@ -1,12 +1,54 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict
-from ..core.simulator import Task, Priority
+import json
+import queue
+import threading
+from functools import lru_cache
+from pathlib import Path
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Dict, Optional, Any
+from ..core.simulator import Task, Priority, Scheduler, fresh_tasks
 from ..core.algorithms import get_all_algorithms, DPE_Scheduler
+from ..core.intervals import ScheduleIndex
+from ..core.timelines import TimelineRecorder
+from ..core.sketches import LatencyRecorder
+from ..core.windows import TumblingWindowAggregator, SlidingWindowAggregator
 from ..core.scenarios import get_all_scenarios
+from ..core.rendering import GanttRenderer, RENDER_FORMATS
+from ..core.runner import load_schedules, load_results
+from ..core.pareto import DEFAULT_OBJECTIVES, pareto_frontier
 from ..models import schemas
 
 router = APIRouter()
 
+# Schedules saved by the experiment runner, served by GET /gantt
+SCHEDULES_CSV = 'results/comprehensive_results_schedules.csv'
+
+# Results saved by the experiment runner, the default input of /pareto
+RESULTS_CSV = 'results/comprehensive_results.csv'
+
+# Dedicated render process and image cache shared by all Gantt requests
+gantt_renderer = GanttRenderer()
+
+# Most windows one /simulate/windows stream may produce
+MAX_STREAM_WINDOWS = 10_000
+
+# Most buckets per timeline curve /simulate may return
+MAX_TIMELINE_BUCKETS = 10_000
+
+# Windows buffered ahead of a slow client before the simulation waits
+STREAM_BUFFER = 256
+
+
+class _StreamClosed(Exception):
+    """The client went away; raised inside the simulation to stop it."""
+
+
+def _horizon_bound(request: schemas.SimulationRequest) -> float:
+    """Upper bound on the makespan: every task finishes by the last arrival plus the total work."""
+    return (max((t.arrival_time for t in request.tasks), default=0.0)
+            + sum(t.processing_time for t in request.tasks))
+
 @router.get("/algorithms", response_model=List[schemas.AlgorithmInfo])
 def get_algorithms():
     """Get list of available scheduling algorithms."""
@@ -46,10 +88,8 @@ def get_scenarios():
         ))
     return result
 
-@router.post("/simulate", response_model=schemas.SimulationResult)
-def run_simulation(request: schemas.SimulationRequest):
-    """Run a simulation with provided configuration."""
-    
+def _build_scheduler(request: schemas.SimulationRequest) -> Scheduler:
+    """Convert a simulation request into a ready-to-run scheduler."""
     # Convert input tasks to internal Task objects
     tasks = []
     for t in request.tasks:
@@ -84,6 +124,38 @@ def run_simulation(request: schemas.SimulationRequest):
         scheduler = SchedulerClass(tasks, request.num_machines)
     else:
         raise HTTPException(status_code=404, detail=f"Algorithm '{request.algorithm}' not found")
+
+    return scheduler
+
+
+def _task_result(t: Dict) -> schemas.TaskResult:
+    """Convert a task record from Scheduler.get_results() to the API schema."""
+    return schemas.TaskResult(
+        id=t["id"],
+        priority=t["priority"],
+        arrival_time=t["arrival_time"],
+        start_time=t["start_time"],
+        completion_time=t["completion_time"],
+        deadline=t["deadline"],
+        meets_deadline=t["meets_deadline"],
+        cpu_required=t["cpu_required"],
+        ram_required=t["ram_required"],
+        machine_id=t["machine_id"]
+    )
+
+
+@router.post("/simulate", response_model=schemas.SimulationResult)
+def run_simulation(request: schemas.SimulationRequest):
+    """Run a simulation with provided configuration."""
+    width = request.timeline_bucket_width
+    if request.timelines and width is not None and _horizon_bound(request) / width > MAX_TIMELINE_BUCKETS:
+        raise HTTPException(status_code=422,
+                            detail=f"Timeline buckets too narrow: at most {MAX_TIMELINE_BUCKETS} buckets per curve")
+
+    scheduler = _build_scheduler(request)
+    scheduler.attach(LatencyRecorder())
+    if request.timelines:
+        scheduler.attach(TimelineRecorder(bucket_width=request.timeline_bucket_width))
     
     # Run simulation
     logs = scheduler.run()
@@ -101,19 +173,7 @@ def run_simulation(request: schemas.SimulationRequest):
         ) for l in logs
     ]
     
-    response_tasks = [
-        schemas.TaskResult(
-            id=t["id"],
-            priority=t["priority"],
-            arrival_time=t["arrival_time"],
-            start_time=t["start_time"],
-            completion_time=t["completion_time"],
-            deadline=t["deadline"],
-            meets_deadline=t["meets_deadline"],
-            cpu_required=t["cpu_required"],
-            ram_required=t["ram_required"]
-        ) for t in results["tasks"]
-    ]
+    response_tasks = [_task_result(t) for t in results["tasks"]]
     
     return schemas.SimulationResult(
         makespan=results["makespan"],
@@ -121,5 +181,226 @@ def run_simulation(request: schemas.SimulationRequest):
         high_priority_stats=schemas.PriorityStats(**results["high_priority_stats"]),
         low_priority_stats=schemas.PriorityStats(**results["low_priority_stats"]),
         tasks=response_tasks,
-        logs=response_logs
+        logs=response_logs,
+        timelines=results.get("timelines"),
+        latency_percentiles=results.get("latency_percentiles")
     )
+
+
+@router.post("/timeline", response_model=schemas.TimelineWindow)
+def get_timeline_window(request: schemas.TimelineRequest):
+    """
+    Run a simulation and return the slice of its schedule inside a time window.
+
+    Backs the dashboard's zoomable timeline: tasks overlapping [start, end)
+    (optionally on one machine) plus a bucketed utilization curve, answered
+    from an interval index instead of scanning every task.
+    """
+    scheduler = _build_scheduler(request)
+    scheduler.run()
+    index = ScheduleIndex.from_scheduler(scheduler)
+
+    start = index.horizon[0] if request.start is None else request.start
+    end = index.horizon[1] if request.end is None else request.end
+    if end < start:
+        raise HTTPException(status_code=422, detail="Window end must not precede start")
+
+    records = {t["id"]: t for t in scheduler.get_results()["tasks"]}
+    window_tasks = index.window(start, end, request.machine_id)
+
+    return schemas.TimelineWindow(
+        start=start,
+        end=end,
+        num_machines=index.num_machines,
+        tasks=[_task_result(records[t.id]) for t in window_tasks],
+        utilization=[schemas.UtilizationBucket(**b)
+                     for b in index.utilization_curve(start, end, request.buckets)]
+    )
+
+
+@router.post("/simulate/windows")
+def stream_windowed_metrics(request: schemas.WindowedMetricsRequest):
+    """
+    Stream windowed throughput, deadline-hit and lateness metrics.
+
+    The simulation runs in a background thread and each window is sent as
+    one line of newline-delimited JSON as soon as it closes. If the
+    simulation fails, the last line is {"error": "..."}; if the client
+    disconnects, the simulation stops.
+    """
+    if request.window_width <= 0 or (request.step is not None and request.step <= 0):
+        raise HTTPException(status_code=422, detail="Window width and step must be positive")
+
+    horizon = _horizon_bound(request)
+    if request.mode == schemas.WindowMode.SLIDING:
+        interval = request.step if request.step is not None else request.window_width / 4
+    else:
+        interval = request.window_width
+    if horizon / interval > MAX_STREAM_WINDOWS:
+        raise HTTPException(status_code=422,
+                            detail=f"Windows too narrow: at most {MAX_STREAM_WINDOWS} windows per stream")
+
+    scheduler = _build_scheduler(request)
+    rows: "queue.Queue" = queue.Queue(maxsize=STREAM_BUFFER)
+    closed = threading.Event()
+
+    def publish(row: Optional[Dict[str, Any]]) -> None:
+        # Block while the buffer is full, but give up once the client is gone
+        while not closed.is_set():
+            try:
+                rows.put(row, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+        raise _StreamClosed()
+
+    if request.mode == schemas.WindowMode.SLIDING:
+        scheduler.attach(SlidingWindowAggregator(request.window_width, request.step,
+                                                 on_window=publish))
+    else:
+        scheduler.attach(TumblingWindowAggregator(request.window_width, on_window=publish))
+
+    def simulate():
+        try:
+            scheduler.run()
+        except _StreamClosed:
+            return
+        except Exception as e:
+            try:
+                publish({"error": str(e)})
+            except _StreamClosed:
+                return
+        try:
+            publish(None)  # End-of-stream marker
+        except _StreamClosed:
+            pass
+
+    threading.Thread(target=simulate, daemon=True).start()
+
+    def stream():
+        try:
+            while True:
+                row = rows.get()
+                if row is None:
+                    break
+                yield json.dumps(row) + "\n"
+        finally:
+            closed.set()  # Stops the simulation if the client disconnected
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@lru_cache(maxsize=1)
+def _load_stored_schedules(path: str, mtime_ns: int) -> Dict:
+    """Parse the schedule file once per modification."""
+    return load_schedules(path)
+
+
+def _stored_schedule(scenario: str, algorithm: str) -> Optional[Dict[str, Any]]:
+    """Schedule for a pair from the runner's schedule file, if present."""
+    path = Path(SCHEDULES_CSV)
+    if not path.exists():
+        return None
+    return _load_stored_schedules(str(path), path.stat().st_mtime_ns).get((scenario, algorithm))
+
+
+def _makespan(tasks: List[Task]) -> float:
+    """Latest completion time of a schedule (0 if nothing completed)."""
+    return max((t.completion_time for t in tasks if t.completion_time), default=0.0)
+
+
+async def _gantt_response(tasks: List[Task], num_machines: int, algorithm: str, scenario: str,
+                          fmt: schemas.GanttFormat, mode: schemas.GanttMode,
+                          profile: schemas.RenderProfileName,
+                          start: Optional[float], end: Optional[float]) -> Response:
+    """Render through the shared renderer and wrap the image in a response."""
+    options: Dict[str, Any] = {'mode': mode.value, 'profile': profile.value}
+    if start is not None or end is not None:
+        start = 0.0 if start is None else start
+        if end is None:
+            end = await run_in_threadpool(_makespan, tasks)
+        if end <= start:
+            raise HTTPException(status_code=422, detail="Window end must be after start")
+        options['time_window'] = (start, end)
+
+    image, cached = await gantt_renderer.render(tasks, num_machines, algorithm, scenario,
+                                                fmt.value, options)
+    return Response(content=image, media_type=RENDER_FORMATS[fmt.value],
+                    headers={"X-Render-Cache": "hit" if cached else "miss"})
+
+
+@router.get("/gantt")
+async def get_gantt_chart(scenario: str, algorithm: str,
+                          format: schemas.GanttFormat = schemas.GanttFormat.PNG,
+                          mode: schemas.GanttMode = schemas.GanttMode.AUTO,
+                          profile: schemas.RenderProfileName = schemas.RenderProfileName.PUBLICATION,
+                          start: Optional[float] = Query(None),
+                          end: Optional[float] = Query(None)):
+    """
+    Gantt chart image for a built-in scenario × algorithm pair.
+
+    Uses the schedule stored by the experiment runner when available and
+    simulates the built-in scenario otherwise.
+    """
+    stored = await run_in_threadpool(_stored_schedule, scenario, algorithm)
+    if stored is not None:
+        tasks, num_machines = stored['tasks'], stored['num_machines']
+    else:
+        match = next((s for s in get_all_scenarios() if s['name'] == scenario), None)
+        algos = get_all_algorithms()
+        if match is None or algorithm not in algos:
+            raise HTTPException(status_code=404, detail=f"No schedule for '{scenario}' / '{algorithm}'")
+        tasks, num_machines = fresh_tasks(match['tasks']), match['num_machines']
+        await run_in_threadpool(algos[algorithm](tasks, num_machines).run)
+
+    return await _gantt_response(tasks, num_machines, algorithm, scenario, format, mode,
+                                 profile, start, end)
+
+
+@router.post("/gantt")
+async def render_gantt_chart(request: schemas.GanttRequest):
+    """
+    Simulate the request and return its Gantt chart as PNG, SVG or PDF.
+
+    Rendering happens in a dedicated worker process and identical
+    schedule + option combinations are answered from an in-memory cache.
+    """
+    scheduler = await run_in_threadpool(_build_scheduler, request)
+    await run_in_threadpool(scheduler.run)
+    return await _gantt_response(scheduler.all_tasks, request.num_machines, request.algorithm,
+                                 request.title, request.format, request.mode,
+                                 request.profile, request.start, request.end)
+
+
+@lru_cache(maxsize=1)
+def _load_stored_results(path: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """Parse the results file once per modification."""
+    return load_results(path)
+
+
+@router.post("/pareto", response_model=schemas.ParetoResult)
+def get_pareto_frontier(request: schemas.ParetoRequest):
+    """
+    Result rows on the multi-objective Pareto frontier.
+
+    Filters the rows in the request, or the runner's stored results when
+    none are given.
+    """
+    if request.rows is not None:
+        rows = request.rows
+    else:
+        path = Path(RESULTS_CSV)
+        if not path.exists():
+            raise HTTPException(status_code=404, detail="No stored results; run the experiments first")
+        rows = _load_stored_results(str(path), path.stat().st_mtime_ns)
+
+    objectives = ({c: sense.value for c, sense in request.objectives.items()}
+                  if request.objectives else DEFAULT_OBJECTIVES)
+    try:
+        frontier = pareto_frontier(rows, objectives)
+    except KeyError as e:
+        raise HTTPException(status_code=422, detail=f"Rows lack objective column {e}")
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=422, detail="Objective values must be numeric")
+
+    return schemas.ParetoResult(objectives=objectives, total=len(rows), frontier=frontier)
@@ -0,0 +1,181 @@
+"""
+Aggregate Result Tables
+=======================
+
+One-pass aggregation of experiment results for the analysis charts.
+
+Every aggregate chart is a mean (or standard deviation) of a few result
+columns over some grouping of scenario and algorithm: category × algorithm,
+scenario × algorithm, alpha, algorithm alone. All of them can be derived
+exactly from per-(Scenario, Algorithm) counts, sums and sums of squares, so
+the results CSV is read once, in chunks, with explicit dtypes and only the
+needed columns, and reduced to that small table. The table is cached on disk
+next to the CSV, keyed by the CSV's content hash, so charts redrawn from an
+unchanged results file skip the CSV entirely.
+"""
+
+import glob
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .manifest import file_digest
+
+# Numeric result columns the charts aggregate
+AGGREGATE_COLUMNS = [
+    'Composite Performance Score (%)',
+    'Total Success Rate (%)',
+    'High Success Rate (%)',
+    'Low Success Rate (%)',
+    'Makespan',
+]
+
+KEY_COLUMNS = ['Scenario', 'Algorithm']
+
+# Explicit dtypes so chunks parse without inference (and strings stay compact)
+RESULT_DTYPES = {
+    'Scenario': 'category',
+    'Algorithm': 'category',
+    **{column: 'float64' for column in AGGREGATE_COLUMNS},
+}
+
+CATEGORIES = ['Basic', 'Challenge', 'Extreme', 'Advanced', 'New']
+
+# Bump when the cached table layout changes
+CACHE_VERSION = 1
+
+PathLike = Union[str, Path]
+
+
+def categorize_scenario(scenario_name):
+    """Categorize scenarios by type"""
+    if any(x in scenario_name for x in ['Light', 'Heavy', 'Batch', 'Starvation Test']):
+        return 'Basic'
+    elif 'Challenge' in scenario_name:
+        return 'Challenge'
+    elif 'Extreme' in scenario_name:
+        return 'Extreme'
+    elif 'Advanced' in scenario_name:
+        return 'Advanced'
+    elif 'New' in scenario_name:
+        return 'New'
+    return 'Other'
+
+
+def _partial_sums(frame: pd.DataFrame) -> pd.DataFrame:
+    """Count, sum and sum of squares per (Scenario, Algorithm) for one chunk."""
+    values = frame[AGGREGATE_COLUMNS]
+    squares = values.pow(2).add_suffix(' sumsq')
+    grouped = pd.concat([frame[KEY_COLUMNS], values.add_suffix(' sum'), squares], axis=1)
+    grouped['count'] = 1
+    partial = grouped.groupby(KEY_COLUMNS, observed=True, sort=False).sum()
+    # Category codes differ between chunks; plain strings merge cleanly
+    partial.index = partial.index.set_levels(
+        [level.astype(str) for level in partial.index.levels])
+    return partial
+
+
+class ResultAggregates:
+    """
+    Per-(Scenario, Algorithm) counts, sums and sums of squares.
+
+    Usage:
+        agg = ResultAggregates.from_csv('results/comprehensive_results.csv')
+        agg.mean(['Algorithm', 'Category'], 'Composite Performance Score (%)')
+
+    Attributes:
+        table: One row per (Scenario, Algorithm) in first-seen order, with
+            'count', '<column> sum' and '<column> sumsq' for every
+            AGGREGATE_COLUMNS entry plus derived 'Category' and 'Alpha'
+        from_cache: Whether the table was loaded from the on-disk cache
+    """
+
+    def __init__(self, table: pd.DataFrame, from_cache: bool = False) -> None:
+        self.table = table.reset_index() if 'Scenario' not in table.columns else table
+        self.table['Category'] = self.table['Scenario'].map(categorize_scenario)
+        self.table['Alpha'] = self.table['Algorithm'].str.extract(r'α=(\d+(?:\.\d+)?)')[0].astype(float)
+        self.from_cache = from_cache
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'ResultAggregates':
+        """Aggregate an in-memory results DataFrame."""
+        return cls(_partial_sums(df))
+
+    @classmethod
+    def from_csv(cls, csv_path: PathLike, cache_dir: Optional[PathLike] = None,
+                 chunksize: int = 250_000, use_cache: bool = True) -> 'ResultAggregates':
+        """
+        Aggregate a results CSV in chunks, reusing a cached table when possible.
+
+        Args:
+            csv_path: Results CSV written by the experiment runner
+            cache_dir: Where cached tables live (default: '.aggregates' next to the CSV)
+            chunksize: Rows parsed per chunk
+            use_cache: Read and write the on-disk cache
+        """
+        csv_path = Path(csv_path)
+        cache_dir = Path(cache_dir) if cache_dir is not None else csv_path.parent / '.aggregates'
+        prefix = f"{csv_path.stem}.v{CACHE_VERSION}."
+        cache_path = cache_dir / f"{prefix}{file_digest(csv_path)[:16]}.csv"
+
+        if use_cache and cache_path.exists():
+            table = pd.read_csv(cache_path, dtype={'Scenario': str, 'Algorithm': str})
+            return cls(table, from_cache=True)
+
+        partials: List[pd.DataFrame] = []
+        for chunk in pd.read_csv(csv_path, usecols=list(RESULT_DTYPES), dtype=RESULT_DTYPES,
+                                 chunksize=chunksize):
+            partials.append(_partial_sums(chunk))
+        if partials:
+            table = pd.concat(partials).groupby(level=[0, 1], sort=False).sum()
+        else:
+            table = _partial_sums(pd.DataFrame({c: pd.Series(dtype=d) for c, d in RESULT_DTYPES.items()}))
+        table = table.reset_index()
+
+        if use_cache:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_name(cache_path.name + '.tmp')
+            table.to_csv(tmp, index=False)
+            os.replace(tmp, cache_path)
+            # Tables for earlier revisions of this CSV will not be read again
+            for stale in cache_dir.glob(f"{glob.escape(prefix)}*.csv"):
+                if stale != cache_path and len(stale.name) == len(cache_path.name):
+                    stale.unlink(missing_ok=True)
+        return cls(table)
+
+    @classmethod
+    def coerce(cls, data: Union['ResultAggregates', pd.DataFrame]) -> 'ResultAggregates':
+        """Accept either aggregates or a raw results DataFrame."""
+        return data if isinstance(data, cls) else cls.from_frame(data)
+
+    @property
+    def algorithms(self) -> List[str]:
+        """Algorithms in order of first appearance in the results."""
+        return list(dict.fromkeys(self.table['Algorithm']))
+
+    @property
+    def total_rows(self) -> int:
+        """Number of result rows aggregated."""
+        return int(self.table['count'].sum())
+
+    def where(self, mask: Iterable[bool]) -> 'ResultAggregates':
+        """Aggregates restricted to the (Scenario, Algorithm) groups in mask."""
+        subset = ResultAggregates.__new__(ResultAggregates)
+        subset.table = self.table[np.asarray(mask, dtype=bool)]
+        subset.from_cache = self.from_cache
+        return subset
+
+    def mean(self, by: List[str], column: str) -> pd.Series:
+        """Row-weighted mean of a column grouped by any of Scenario, Algorithm, Category, Alpha."""
+        sums = self.table.groupby(by)[[f'{column} sum', 'count']].sum()
+        return (sums[f'{column} sum'] / sums['count']).rename(column)
+
+    def std(self, by: List[str], column: str) -> pd.Series:
+        """Sample standard deviation (ddof=1) of a column per group; NaN for single rows."""
+        sums = self.table.groupby(by)[[f'{column} sum', f'{column} sumsq', 'count']].sum()
+        n = sums['count']
+        var = (sums[f'{column} sumsq'] - sums[f'{column} sum'] ** 2 / n) / (n - 1)
+        return np.sqrt(var.clip(lower=0).where(n > 1)).rename(column)
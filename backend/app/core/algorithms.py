@@ -9,7 +9,9 @@ All scheduling algorithms consolidated in one file:
 - DPE (Dynamic Priority Elevation with configurable α threshold)
 """
 
-from typing import List, Optional, Dict, Type
+import functools
+import inspect
+from typing import Any, Callable, List, Optional, Dict, Tuple, Type
 from .simulator import Scheduler, Priority, Task
 
 
@@ -218,3 +220,85 @@ def get_all_algorithms() -> Dict[str, Type[Scheduler]]:
         dict: Algorithm name → Scheduler class or factory function
     """
     return AVAILABLE_ALGORITHMS.copy()
+
+
+# Base algorithms by name, for building variants with explicit parameters
+ALGORITHM_CLASSES: Dict[str, Type[Scheduler]] = {
+    'SPT': SPT_Scheduler,
+    'EDF': EDF_Scheduler,
+    'Priority-First': PriorityFirst_Scheduler,
+    'Max-Min (Cloud)': MaxMin_Scheduler,
+    'DPE': DPE_Scheduler,
+    'FCFS': FCFS_Scheduler,
+    'HRRN': HRRN_Scheduler,
+    'MLF': MLF_Scheduler,
+}
+
+# Short labels for parameters in generated algorithm names
+PARAM_SYMBOLS = {'alpha': 'α'}
+
+
+def make_algorithm(name: str, **params: Any) -> Callable[..., Scheduler]:
+    """
+    Factory for a base algorithm with the given constructor parameters.
+
+    The factory is a functools.partial, so it can be sent to worker processes
+    (unlike the lambdas in AVAILABLE_ALGORITHMS).
+
+    Args:
+        name (str): Key of ALGORITHM_CLASSES (e.g. 'DPE')
+        **params: Constructor keyword arguments (e.g. alpha=0.35)
+
+    Returns:
+        callable: (tasks, num_machines) → Scheduler
+
+    Raises:
+        KeyError: For an unknown algorithm
+        ValueError: For a parameter the algorithm does not take
+    """
+    cls = ALGORITHM_CLASSES[name]
+    accepted = set(inspect.signature(cls.__init__).parameters) - {'self', 'tasks', 'num_machines'}
+    unknown = sorted(set(params) - accepted)
+    if unknown:
+        raise ValueError(f"{name} does not take parameter(s): {', '.join(unknown)}"
+                         f" (accepts: {', '.join(sorted(accepted)) or 'none'})")
+    return functools.partial(cls, **params)
+
+
+def algorithm_label(name: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Display name of a parameterised algorithm, in the registry's style.
+
+    >>> algorithm_label('DPE', {'alpha': 0.35})
+    'DPE (α=0.35)'
+    """
+    if not params:
+        return name
+    args = ', '.join(f"{PARAM_SYMBOLS.get(k, k)}={v:g}" if isinstance(v, float)
+                     else f"{PARAM_SYMBOLS.get(k, k)}={v}"
+                     for k, v in sorted(params.items()))
+    return f"{name} ({args})"
+
+
+def parse_algorithm_label(label: str) -> Tuple[str, Dict[str, float]]:
+    """
+    Inverse of algorithm_label(): base name and numeric parameters.
+
+    Labels without 'key=value' parameters (e.g. 'Max-Min (Cloud)') are
+    returned whole with no parameters.
+
+    >>> parse_algorithm_label('DPE (α=0.35)')
+    ('DPE', {'alpha': 0.35})
+    """
+    names = {symbol: name for name, symbol in PARAM_SYMBOLS.items()}
+    if label.endswith(')') and ' (' in label:
+        base, args = label[:-1].split(' (', 1)
+        params = {}
+        for arg in args.split(', '):
+            key, _, value = arg.partition('=')
+            try:
+                params[names.get(key, key)] = float(value)
+            except ValueError:
+                return label, {}
+        return base, params
+    return label, {}
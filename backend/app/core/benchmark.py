@@ -0,0 +1,483 @@
+"""
+Engine Throughput Benchmarks
+============================
+
+Times the discrete-event engine under every registered algorithm on
+synthetic workloads, and compares the numbers with saved baselines.
+
+- synthetic_workload() builds a reproducible Poisson-arrival workload whose
+  offered load (work arriving per unit time / machines) is fixed, so larger
+  sizes mean longer runs rather than ever-growing queues.
+- run_case() measures one (algorithm, tasks, machines) combination: best of
+  several repeats for time, peak resident memory of the process.
+- run_suite() runs each case in a fresh spawned interpreter by default, so
+  peak RSS belongs to that case alone and earlier cases cannot warm caches.
+- measure_memory() uses tracemalloc around workload construction,
+  Scheduler.run() and get_results() to report bytes per Task, per Event,
+  per log entry and per result row, with logging on and off.
+- Baselines are JSON files; compare() flags cases whose events/sec dropped
+  by more than a tolerance, compare_memory() cases whose per-object
+  footprint grew by more than one.
+
+Only the standard library is used, so the numbers measure the engine, not
+the import of the scientific stack.
+"""
+
+import gc
+import json
+import math
+import multiprocessing
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .simulator import Task, Priority
+from .algorithms import get_all_algorithms
+
+BENCH_SIZES = (1_000, 10_000, 100_000)
+BENCH_MACHINES = (4, 16)
+
+# Memory mode is deterministic, and tracemalloc slows runs down, so one size suffices
+MEMORY_SIZES = (10_000,)
+MEMORY_MACHINES = (4,)
+
+# Per-object footprints compared against memory baselines
+MEMORY_METRICS = ('task_bytes', 'event_bytes', 'log_entry_bytes', 'result_row_bytes')
+
+# Bump when the workload generator or the result layout changes
+BASELINE_VERSION = 1
+
+
+def synthetic_workload(num_tasks: int, num_machines: int, load: float = 0.8,
+                       high_fraction: float = 0.3, seed: int = 0) -> List[Task]:
+    """
+    Reproducible random workload with a fixed offered load.
+
+    Processing times are uniform on [1, 10] and arrivals Poisson with rate
+    load × num_machines / 5.5, so load < 1 keeps the ready queue bounded.
+    HIGH tasks get tighter deadlines (1.5-4× their processing time) than LOW
+    ones (2-8×). One task in ten needs a large (even-numbered) machine; the
+    rest fit anywhere.
+
+    Args:
+        num_tasks: Number of tasks
+        num_machines: Machines the workload is sized for
+        load: Offered load per machine (0.8 = 80% busy on average)
+        high_fraction: Share of HIGH priority tasks
+        seed: Random seed
+
+    Returns:
+        Tasks in arrival order
+    """
+    rng = random.Random(seed)
+    rate = load * num_machines / 5.5
+    tasks = []
+    now = 0.0
+    for i in range(num_tasks):
+        now += rng.expovariate(rate)
+        processing = round(rng.uniform(1.0, 10.0), 3)
+        high = rng.random() < high_fraction
+        slack = rng.uniform(1.5, 4.0) if high else rng.uniform(2.0, 8.0)
+        if rng.random() < 0.1:
+            cpu, ram = rng.randint(5, 8), rng.choice((16, 32))
+        else:
+            cpu, ram = rng.randint(1, 4), rng.choice((1, 2, 4, 8))
+        arrival = round(now, 3)
+        tasks.append(Task(
+            id=i,
+            arrival_time=arrival,
+            processing_time=processing,
+            priority=Priority.HIGH if high else Priority.LOW,
+            deadline=round(arrival + processing * slack, 3),
+            cpu_required=cpu,
+            ram_required=ram,
+        ))
+    return tasks
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KiB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # macOS reports bytes
+
+
+@dataclass
+class BenchResult:
+    """
+    Measurements for one (algorithm, tasks, machines) case.
+
+    Attributes:
+        algorithm: Registry name
+        tasks: Workload size
+        machines: Number of machines
+        seconds: Best wall time of Scheduler.run() over the repeats
+        events: Events processed (arrivals + completions)
+        dispatches: Tasks started on a machine
+        peak_rss_kb: Peak resident memory of the measuring process
+    """
+    algorithm: str
+    tasks: int
+    machines: int
+    seconds: float
+    events: int
+    dispatches: int
+    peak_rss_kb: Optional[int] = None
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.seconds if self.seconds > 0 else float('inf')
+
+    @property
+    def us_per_dispatch(self) -> float:
+        return self.seconds * 1e6 / self.dispatches if self.dispatches else 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.algorithm}|{self.tasks}|{self.machines}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        row = asdict(self)
+        row['events_per_sec'] = round(self.events_per_sec, 1)
+        row['us_per_dispatch'] = round(self.us_per_dispatch, 3)
+        return row
+
+
+def run_case(algorithm: str, num_tasks: int, num_machines: int, repeat: int = 3,
+             load: float = 0.8, seed: int = 0, collect_garbage: bool = True) -> BenchResult:
+    """
+    Time one algorithm on one synthetic workload in this process.
+
+    The workload is rebuilt (untimed) before every repeat because the
+    simulation mutates its tasks; the fastest repeat is reported. With
+    collect_garbage=False the cyclic GC is paused while timing, which
+    removes collection pauses from the measurement (for scaling fits).
+    """
+    factory = get_all_algorithms()[algorithm]
+    best = float('inf')
+    scheduler = None
+    for _ in range(max(1, repeat)):
+        tasks = synthetic_workload(num_tasks, num_machines, load=load, seed=seed)
+        scheduler = factory(tasks, num_machines)
+        gc.collect()
+        pause = not collect_garbage and gc.isenabled()
+        if pause:
+            gc.disable()
+        try:
+            start = time.perf_counter()
+            scheduler.run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            if pause:
+                gc.enable()
+
+    completed = len(scheduler.completed_tasks)
+    return BenchResult(
+        algorithm=algorithm,
+        tasks=num_tasks,
+        machines=num_machines,
+        seconds=best,
+        events=num_tasks + completed,
+        dispatches=sum(1 for t in scheduler.all_tasks if t.start_time is not None),
+        peak_rss_kb=peak_rss_kb(),
+    )
+
+
+@dataclass
+class MemoryResult:
+    """
+    Traced allocations for one (algorithm, tasks, machines, logging) case.
+
+    Attributes:
+        algorithm: Registry name
+        tasks: Workload size
+        machines: Number of machines
+        record_logs: Whether Scheduler.run() built its event log
+        task_bytes: Bytes per Task, from building the workload
+        event_bytes: Bytes per queued Event, from initialize()
+        log_entry_bytes: Bytes per entry of the list run() returns
+        result_row_bytes: Bytes per task row of get_results()
+        run_peak_bytes: Peak traced memory during run() above its starting level
+        log_entries: Length of the log run() returned
+    """
+    algorithm: str
+    tasks: int
+    machines: int
+    record_logs: bool
+    task_bytes: float
+    event_bytes: float
+    log_entry_bytes: float
+    result_row_bytes: float
+    run_peak_bytes: int
+    log_entries: int
+
+    @property
+    def key(self) -> str:
+        logs = 'logs' if self.record_logs else 'nologs'
+        return f"{self.algorithm}|{self.tasks}|{self.machines}|{logs}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        row = asdict(self)
+        for metric in MEMORY_METRICS:
+            row[metric] = round(row[metric], 1)
+        row['key'] = self.key
+        return row
+
+
+def _traced() -> int:
+    """Bytes currently allocated under tracemalloc, after collecting cycles."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure_memory(algorithm: str, num_tasks: int, num_machines: int, load: float = 0.8,
+                   seed: int = 0, record_logs: bool = True) -> MemoryResult:
+    """
+    Footprint of one algorithm on one synthetic workload, via tracemalloc.
+
+    Each figure is the growth in traced memory across one phase divided by
+    the number of objects that phase creates, so it includes the containers
+    holding them (list slots, heap entries).
+    """
+    factory = get_all_algorithms()[algorithm]
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = _traced()
+        tasks = synthetic_workload(num_tasks, num_machines, load=load, seed=seed)
+        task_bytes = (_traced() - before) / num_tasks
+
+        scheduler = factory(tasks, num_machines)
+        scheduler.record_logs = record_logs
+
+        # initialize() queues exactly one ARRIVAL Event per task; run() redoes it
+        before = _traced()
+        scheduler.initialize()
+        event_bytes = (_traced() - before) / num_tasks
+        scheduler.event_queue.clear()
+
+        before = _traced()
+        tracemalloc.reset_peak()
+        logs = scheduler.run()
+        run_peak = tracemalloc.get_traced_memory()[1] - before
+        log_entries = len(logs)
+        with_logs = _traced()
+        del logs
+        log_entry_bytes = (with_logs - _traced()) / log_entries if log_entries else 0.0
+
+        before = _traced()
+        results = scheduler.get_results()
+        rows = len(results['tasks'])
+        result_row_bytes = (_traced() - before) / rows if rows else 0.0
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return MemoryResult(
+        algorithm=algorithm,
+        tasks=num_tasks,
+        machines=num_machines,
+        record_logs=record_logs,
+        task_bytes=task_bytes,
+        event_bytes=event_bytes,
+        log_entry_bytes=log_entry_bytes,
+        result_row_bytes=result_row_bytes,
+        run_peak_bytes=run_peak,
+        log_entries=log_entries,
+    )
+
+
+def growth_exponent(sizes: List[float], costs: List[float]) -> float:
+    """
+    Least-squares slope of log(cost) against log(size).
+
+    A cost growing like n^k gives k; n log n over a range of sizes gives
+    slightly more than 1 (use the same fit on the bound itself to compare).
+
+    Raises:
+        ValueError: With fewer than two distinct sizes
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(c) for c in costs]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        raise ValueError("Need at least two distinct sizes")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def _run_case_job(args: tuple) -> BenchResult:
+    """Pool entry point (module-level so it can be sent to a spawned process)."""
+    return run_case(*args)
+
+
+def _measure_memory_job(args: tuple) -> MemoryResult:
+    """Pool entry point for memory mode."""
+    return measure_memory(*args)
+
+
+def run_suite(algorithms: Optional[Iterable[str]] = None,
+              sizes: Iterable[int] = BENCH_SIZES,
+              machines: Iterable[int] = BENCH_MACHINES,
+              repeat: int = 3, load: float = 0.8, seed: int = 0, isolate: bool = True,
+              on_result: Optional[Callable[[Any], None]] = None,
+              memory: bool = False) -> List[Any]:
+    """
+    Benchmark every algorithm × size × machine count, one case at a time.
+
+    Args:
+        algorithms: Registry names (default: all of get_all_algorithms())
+        sizes: Workload sizes in tasks
+        machines: Machine counts
+        repeat: Timed repeats per case (best is kept)
+        load: Offered load per machine
+        seed: Workload seed
+        isolate: Run each case in a fresh spawned interpreter
+        on_result: Called with each result as soon as it is measured
+        memory: Measure footprints (MemoryResult, logging on and off)
+            instead of throughput (BenchResult)
+
+    Raises:
+        KeyError: For an unknown algorithm name
+    """
+    registry = get_all_algorithms()
+    algorithms = list(algorithms) if algorithms else list(registry)
+    for name in algorithms:
+        if name not in registry:
+            raise KeyError(name)
+    if memory:
+        job_fn = _measure_memory_job
+        jobs = [(name, n, m, load, seed, logs) for n in sizes for m in machines
+                for name in algorithms for logs in (True, False)]
+    else:
+        job_fn = _run_case_job
+        jobs = [(name, n, m, repeat, load, seed) for n in sizes for m in machines
+                for name in algorithms]
+
+    results = []
+    if isolate:
+        with multiprocessing.get_context('spawn').Pool(1, maxtasksperchild=1) as pool:
+            for result in pool.imap(job_fn, jobs):
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    else:
+        for job in jobs:
+            result = job_fn(job)
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
+
+
+def save_baseline(results: List[Any], path: str, kind: str = 'throughput',
+                  **settings: Any) -> None:
+    """Write results plus the machine/interpreter they were measured on as JSON."""
+    payload = {
+        'version': BASELINE_VERSION,
+        'kind': kind,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'settings': settings,
+        'results': [r.to_dict() for r in results],
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_baseline(path: str, kind: str = 'throughput') -> Dict[str, Dict[str, Any]]:
+    """
+    Read a baseline file.
+
+    Args:
+        path: Baseline JSON written by save_baseline()
+        kind: 'throughput' or 'memory'; must match the file
+
+    Returns:
+        dict: Case key ('algorithm|tasks|machines[|logs]') → stored result row
+
+    Raises:
+        ValueError: If the file was written by an incompatible version or
+            holds the other kind of results
+    """
+    with open(path) as f:
+        payload = json.load(f)
+    if payload.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Baseline {path} has version {payload.get('version')}, "
+                         f"expected {BASELINE_VERSION}")
+    if payload.get('kind', 'throughput') != kind:
+        raise ValueError(f"Baseline {path} holds {payload.get('kind')} results, not {kind}")
+    return {r.get('key', f"{r['algorithm']}|{r['tasks']}|{r['machines']}"): r
+            for r in payload['results']}
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, Dict[str, Any]],
+            tolerance: float = 0.15) -> List[Dict[str, Any]]:
+    """
+    Cases whose throughput fell by more than tolerance versus the baseline.
+
+    Cases missing from the baseline are ignored.
+
+    Returns:
+        list: {'algorithm', 'tasks', 'machines', 'baseline', 'current', 'change'}
+            with events/sec values and change as a signed fraction
+    """
+    regressions = []
+    for result in results:
+        old = baseline.get(result.key)
+        if old is None:
+            continue
+        change = result.events_per_sec / old['events_per_sec'] - 1.0
+        if change < -tolerance:
+            regressions.append({
+                'algorithm': result.algorithm,
+                'tasks': result.tasks,
+                'machines': result.machines,
+                'baseline': old['events_per_sec'],
+                'current': round(result.events_per_sec, 1),
+                'change': round(change, 4),
+            })
+    return regressions
+
+
+def compare_memory(results: List[MemoryResult], baseline: Dict[str, Dict[str, Any]],
+                   tolerance: float = 0.15) -> List[Dict[str, Any]]:
+    """
+    Per-object footprints that grew by more than tolerance versus the baseline.
+
+    Returns:
+        list: {'algorithm', 'tasks', 'machines', 'record_logs', 'metric',
+            'baseline', 'current', 'change'}, one entry per grown metric
+    """
+    regressions = []
+    for result in results:
+        old = baseline.get(result.key)
+        if old is None:
+            continue
+        for metric in MEMORY_METRICS:
+            current, previous = getattr(result, metric), old[metric]
+            if previous <= 0:
+                continue
+            change = current / previous - 1.0
+            if change > tolerance:
+                regressions.append({
+                    'algorithm': result.algorithm,
+                    'tasks': result.tasks,
+                    'machines': result.machines,
+                    'record_logs': result.record_logs,
+                    'metric': metric,
+                    'baseline': previous,
+                    'current': round(current, 1),
+                    'change': round(change, 4),
+                })
+    return regressions
@@ -0,0 +1,279 @@
+"""
+Run Configuration
+=================
+
+Loads and validates config.yaml (see config.example.yaml), the execution
+profile shared by the CLI, the experiment runner and the visualizer:
+
+- experiment: output directory, results file, worker processes and the
+  results database (see results_db)
+- algorithms / scenarios: which registry algorithms and scenario categories
+  `run --all` covers
+- visualization: whether `run` renders charts afterwards, where, in which
+  formats and resolution, and which chart types
+- analysis: composite scores, comparison tables, paired significance tests
+- logging: level, optional log file, console output and how experiment
+  progress is reported (see progress.py)
+
+Missing sections and keys keep the built-in defaults, which reproduce the
+behavior without a config file. Unknown keys and invalid values raise
+ValueError so a typo cannot silently fall back to a default.
+"""
+
+import logging
+import os
+import sys
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Tuple
+
+from .algorithms import get_all_algorithms
+from .scenarios import SCENARIO_CATEGORIES
+from .progress import PROGRESS_LEVELS
+
+# Looked up in the working directory when no path is given
+DEFAULT_CONFIG_FILE = 'config.yaml'
+
+# Algorithms `run --all` covers by default
+DEFAULT_ALGORITHMS = (
+    'SPT', 'EDF', 'Priority-First',
+    'DPE (α=0.3)', 'DPE (α=0.5)', 'DPE (α=0.7)', 'DPE (α=0.9)',
+)
+
+CHART_FORMATS = ('png', 'svg', 'pdf')
+CHART_TYPES = ('gantt', 'performance_comparison', 'pareto_frontier', 'heatmap', 'alpha_sensitivity')
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+# Logger of the core package; every module logs below it
+PACKAGE_LOGGER = __name__.rsplit('.', 1)[0]
+
+
+@dataclass(frozen=True)
+class ExperimentSettings:
+    output_dir: str = 'results'
+    results_file: str = 'comprehensive_results.csv'
+    # 0 = one per CPU
+    parallel_workers: int = 0
+    # SQLite results database in output_dir; None disables it
+    database: Optional[str] = 'results.db'
+
+    @property
+    def results_path(self) -> str:
+        return os.path.join(self.output_dir, self.results_file)
+
+    @property
+    def database_path(self) -> Optional[str]:
+        return os.path.join(self.output_dir, self.database) if self.database else None
+
+    @property
+    def workers(self) -> int:
+        """Worker processes to use (parallel_workers, or the CPU count for 0)."""
+        return self.parallel_workers or os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class VisualizationSettings:
+    # Render charts after `run` (the visualize command always renders)
+    enabled: bool = False
+    output_dir: str = 'visualizations'
+    # Applied to the publication profile only; None keeps its own formats / resolution
+    formats: Optional[Tuple[str, ...]] = None
+    dpi: Optional[int] = None
+    charts: Tuple[str, ...] = CHART_TYPES
+
+
+@dataclass(frozen=True)
+class AnalysisSettings:
+    composite_scores: bool = True
+    comparison_tables: bool = True
+    statistical_tests: bool = False
+
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    level: str = 'INFO'
+    file: Optional[str] = None
+    console: bool = True
+    # silent, bar (throttled, with ETA) or verbose (per-experiment summaries)
+    progress: str = 'bar'
+
+
+@dataclass(frozen=True)
+class Config:
+    """
+    Validated configuration.
+
+    Attributes:
+        experiment, visualization, analysis, logging: Section settings
+        algorithms: Registry names `run --all` covers
+        scenarios: Scenario categories `run --all` covers
+        source: File the configuration was read from (None for defaults)
+    """
+    experiment: ExperimentSettings = field(default_factory=ExperimentSettings)
+    algorithms: Tuple[str, ...] = DEFAULT_ALGORITHMS
+    scenarios: Tuple[str, ...] = tuple(SCENARIO_CATEGORIES)
+    visualization: VisualizationSettings = field(default_factory=VisualizationSettings)
+    analysis: AnalysisSettings = field(default_factory=AnalysisSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
+    source: Optional[str] = None
+
+
+def _check_keys(section: str, values: Any, allowed) -> Dict[str, Any]:
+    if values is None:
+        return {}
+    if not isinstance(values, dict):
+        raise ValueError(f"'{section}' must be a mapping")
+    unknown = sorted(set(values) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown key(s) in '{section}': {', '.join(unknown)} "
+                         f"(expected: {', '.join(allowed)})")
+    return values
+
+
+def _check_type(name: str, value: Any, kind: type) -> Any:
+    # bool is an int subclass; 'workers: true' is still a mistake
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise ValueError(f"'{name}' must be {kind.__name__}, got {value!r}")
+    return value
+
+
+def _section(section: str, cls: type, values: Any, checks: Dict[str, type]) -> Any:
+    """Build a settings section from scalar keys; null values keep the default."""
+    values = _check_keys(section, values, checks)
+    return cls(**{key: _check_type(f"{section}.{key}", value, checks[key])
+                  for key, value in values.items() if value is not None})
+
+
+def parse_config(data: Optional[Dict[str, Any]], source: Optional[str] = None) -> Config:
+    """
+    Validate a parsed config mapping.
+
+    Raises:
+        ValueError: For unknown keys, names or invalid values
+    """
+    data = _check_keys('config', data, ('experiment', 'algorithms', 'scenarios',
+                                        'visualization', 'analysis', 'logging'))
+
+    exp = _check_keys('experiment', data.get('experiment'),
+                      ('output_dir', 'results_file', 'parallel_workers', 'database'))
+    experiment = _section('experiment', ExperimentSettings,
+                          {k: v for k, v in exp.items() if k != 'database'},
+                          {'output_dir': str, 'results_file': str, 'parallel_workers': int})
+    if experiment.parallel_workers < 0:
+        raise ValueError("'experiment.parallel_workers' must be >= 0 (0 = CPU count)")
+    if 'database' in exp:
+        # null (unlike other keys) means no database rather than the default
+        database = exp['database']
+        if database is not None:
+            _check_type('experiment.database', database, str)
+        experiment = replace(experiment, database=database or None)
+
+    algorithms = DEFAULT_ALGORITHMS
+    if data.get('algorithms') is not None:
+        algorithms = tuple(_check_type('algorithms', data['algorithms'], list))
+        registry = get_all_algorithms()
+        unknown = [a for a in algorithms if a not in registry]
+        if unknown:
+            raise ValueError(f"Unknown algorithm(s): {', '.join(map(str, unknown))} "
+                             f"(available: {', '.join(registry)})")
+        if not algorithms:
+            raise ValueError("'algorithms' lists no algorithms")
+
+    categories = _check_keys('scenarios', data.get('scenarios'), tuple(SCENARIO_CATEGORIES))
+    scenarios = tuple(c for c in SCENARIO_CATEGORIES
+                      if _check_type(f"scenarios.{c}", categories.get(c, True), bool))
+    if not scenarios:
+        raise ValueError("'scenarios' disables every category")
+
+    viz = _check_keys('visualization', data.get('visualization'),
+                      ('enabled', 'output_dir', 'formats', 'dpi', 'charts'))
+    visualization = _section('visualization', VisualizationSettings,
+                             {k: v for k, v in viz.items() if k in ('enabled', 'output_dir')},
+                             {'enabled': bool, 'output_dir': str})
+    if viz.get('formats') is not None:
+        formats = _check_type('visualization.formats', viz['formats'], list)
+        if not formats or any(f not in CHART_FORMATS for f in formats):
+            raise ValueError(f"'visualization.formats' must list some of: {', '.join(CHART_FORMATS)}")
+        visualization = replace(visualization, formats=tuple(formats))
+    if viz.get('dpi') is not None:
+        if _check_type('visualization.dpi', viz['dpi'], int) <= 0:
+            raise ValueError("'visualization.dpi' must be positive")
+        visualization = replace(visualization, dpi=viz['dpi'])
+    if viz.get('charts') is not None:
+        charts = _check_keys('visualization.charts', viz['charts'], CHART_TYPES)
+        visualization = replace(visualization, charts=tuple(
+            c for c in CHART_TYPES
+            if _check_type(f"visualization.charts.{c}", charts.get(c, True), bool)))
+
+    analysis = _section('analysis', AnalysisSettings, data.get('analysis'),
+                        {'composite_scores': bool, 'comparison_tables': bool,
+                         'statistical_tests': bool})
+
+    log = _section('logging', LoggingSettings, data.get('logging'),
+                   {'level': str, 'file': str, 'console': bool, 'progress': str})
+    log = replace(log, level=log.level.upper())
+    if log.level not in LOG_LEVELS:
+        raise ValueError(f"'logging.level' must be one of: {', '.join(LOG_LEVELS)}")
+    if log.progress not in PROGRESS_LEVELS:
+        raise ValueError(f"'logging.progress' must be one of: {', '.join(PROGRESS_LEVELS)}")
+
+    return Config(experiment, algorithms, scenarios, visualization, analysis, log, source)
+
+
+def load_config(path: Optional[str] = None) -> Config:
+    """
+    Load a YAML config file.
+
+    Args:
+        path: Config file; if None, DEFAULT_CONFIG_FILE in the working
+            directory is used when present, otherwise the defaults
+
+    Raises:
+        OSError: If an explicitly given file cannot be read
+        ValueError: For invalid YAML or settings
+    """
+    if path is None:
+        if not os.path.exists(DEFAULT_CONFIG_FILE):
+            return Config()
+        path = DEFAULT_CONFIG_FILE
+
+    import yaml
+    with open(path) as f:
+        try:
+            data = yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path} is not valid YAML: {e}")
+    try:
+        return parse_config(data, source=path)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}")
+
+
+def configure_logging(settings: LoggingSettings) -> logging.Logger:
+    """
+    Route the core package's log records to the console and/or a file.
+
+    Console output is the bare message (it replaces the runner's former
+    prints); the file gets timestamps and levels. Calling it again replaces
+    the handlers installed before.
+
+    Returns:
+        The package logger
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(settings.level)
+    logger.propagate = False
+    if settings.console:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(console)
+    if settings.file:
+        os.makedirs(os.path.dirname(settings.file) or '.', exist_ok=True)
+        file_handler = logging.FileHandler(settings.file, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+        logger.addHandler(file_handler)
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
@@ -0,0 +1,173 @@
+"""
+Interval Index over Finished Schedules
+======================================
+
+Answers time-range questions about a completed schedule without scanning
+every task:
+
+- which tasks were running on machine m between t0 and t1?
+- which tasks (and how many machines) were busy at time t?
+- what was cluster utilization over [t0, t1], bucketed for plotting?
+
+A machine runs one task at a time, so each machine's intervals are disjoint.
+Sorting them by start time therefore also sorts them by end time, and two
+binary searches over the per-machine start/end arrays bound every window
+query: O(M log n + k) for M machines and k matching tasks.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from .simulator import Task, Scheduler
+
+
+class ScheduleIndex:
+    """
+    Per-machine sorted start/end arrays built once from scheduled tasks.
+
+    Tasks that never started (no start/completion time or machine) are ignored.
+
+    Attributes:
+        num_machines: Number of machines in the schedule
+        horizon: (earliest start, latest completion) of the schedule
+    """
+
+    def __init__(self, tasks: List[Task], num_machines: Optional[int] = None) -> None:
+        scheduled = [t for t in tasks
+                     if t.start_time is not None and t.completion_time is not None
+                     and t.machine_id is not None]
+        if num_machines is None:
+            num_machines = max((t.machine_id for t in scheduled), default=-1) + 1
+        self.num_machines = num_machines
+
+        self._tasks: Dict[int, List[Task]] = {m: [] for m in range(num_machines)}
+        for task in scheduled:
+            self._tasks.setdefault(task.machine_id, []).append(task)
+
+        self._starts: Dict[int, List[float]] = {}
+        self._ends: Dict[int, List[float]] = {}
+        self._busy_prefix: Dict[int, List[float]] = {}
+        for machine_id, machine_tasks in self._tasks.items():
+            machine_tasks.sort(key=lambda t: (t.start_time, t.completion_time))
+            self._starts[machine_id] = [t.start_time for t in machine_tasks]
+            self._ends[machine_id] = [t.completion_time for t in machine_tasks]
+            prefix = [0.0]
+            for t in machine_tasks:
+                prefix.append(prefix[-1] + (t.completion_time - t.start_time))
+            self._busy_prefix[machine_id] = prefix
+
+        self.horizon: Tuple[float, float] = (
+            min((t.start_time for t in scheduled), default=0.0),
+            max((t.completion_time for t in scheduled), default=0.0),
+        )
+
+    @classmethod
+    def from_scheduler(cls, scheduler: Scheduler) -> 'ScheduleIndex':
+        """Build an index from a scheduler after run()."""
+        return cls(scheduler.completed_tasks, scheduler.num_machines)
+
+    @property
+    def machine_ids(self) -> List[int]:
+        """Machine ids present in the index, in ascending order."""
+        return sorted(self._tasks)
+
+    def window(self, start: float, end: float,
+               machine_id: Optional[int] = None) -> List[Task]:
+        """
+        Tasks whose execution overlaps the half-open window [start, end).
+
+        Args:
+            start: Window start time
+            end: Window end time
+            machine_id: Restrict to one machine (all machines if None)
+
+        Returns:
+            Matching tasks, ordered by machine then start time
+        """
+        machines = self.machine_ids if machine_id is None else [machine_id]
+        result = []
+        for m in machines:
+            if m not in self._tasks:
+                continue
+            # First interval ending after start, last interval starting before end
+            lo = bisect_right(self._ends[m], start)
+            hi = bisect_left(self._starts[m], end)
+            result.extend(self._tasks[m][lo:hi])
+        return result
+
+    def running_at(self, time: float) -> List[Task]:
+        """Tasks executing at the given instant (start <= time < completion)."""
+        running = []
+        for m in self.machine_ids:
+            i = bisect_right(self._starts[m], time) - 1
+            if i >= 0 and self._ends[m][i] > time:
+                running.append(self._tasks[m][i])
+        return running
+
+    def busy_machines_at(self, time: float) -> int:
+        """Number of machines busy at the given instant."""
+        return len(self.running_at(time))
+
+    def utilization_at(self, time: float) -> float:
+        """Fraction of machines busy at the given instant (0.0 to 1.0)."""
+        if self.num_machines == 0:
+            return 0.0
+        return self.busy_machines_at(time) / self.num_machines
+
+    def busy_time(self, start: float, end: float,
+                  machine_id: Optional[int] = None) -> float:
+        """
+        Total machine-time spent executing tasks within [start, end).
+
+        Args:
+            start: Window start time
+            end: Window end time
+            machine_id: Restrict to one machine (all machines if None)
+        """
+        machines = self.machine_ids if machine_id is None else [machine_id]
+        return sum(self._cumulative_busy(m, end) - self._cumulative_busy(m, start)
+                   for m in machines if m in self._tasks)
+
+    def utilization_curve(self, start: Optional[float] = None,
+                          end: Optional[float] = None,
+                          buckets: int = 100) -> List[Dict[str, float]]:
+        """
+        Average cluster utilization over equal-width time buckets.
+
+        Args:
+            start: Curve start (default: schedule start)
+            end: Curve end (default: makespan)
+            buckets: Number of buckets
+
+        Returns:
+            List of {'start', 'end', 'utilization'} dicts, utilization in [0, 1]
+        """
+        start = self.horizon[0] if start is None else start
+        end = self.horizon[1] if end is None else end
+        if end <= start or buckets <= 0 or self.num_machines == 0:
+            return []
+
+        width = (end - start) / buckets
+        edges = [start + i * width for i in range(buckets)] + [end]
+        cumulative = [sum(self._cumulative_busy(m, edge) for m in self.machine_ids)
+                      for edge in edges]
+        capacity = width * self.num_machines
+        return [
+            {
+                'start': edges[i],
+                'end': edges[i + 1],
+                'utilization': (cumulative[i + 1] - cumulative[i]) / capacity,
+            }
+            for i in range(buckets)
+        ]
+
+    def _cumulative_busy(self, machine_id: int, time: float) -> float:
+        """Busy time on a machine from the beginning of the schedule up to time."""
+        starts = self._starts[machine_id]
+        i = bisect_right(starts, time)
+        busy = self._busy_prefix[machine_id][i]
+        if i > 0:
+            overshoot = self._ends[machine_id][i - 1] - time
+            if overshoot > 0:
+                busy -= overshoot
+        return busy
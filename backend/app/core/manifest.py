@@ -0,0 +1,120 @@
+"""
+Chart Fingerprint Manifest
+==========================
+
+Lets batch chart generation skip charts whose inputs have not changed.
+
+Each chart is identified by its file name and fingerprinted from everything
+that determines its pixels: the schedule inputs (tasks, machines, algorithm
+parameters) or the source data file, the plotting code version, and the
+output DPI/format. Fingerprints are stored in a JSON manifest inside the
+output directory; a chart is regenerated only when its fingerprint differs
+from the recorded one or the file is missing.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .simulator import Task, Scheduler
+
+MANIFEST_NAME = '.manifest.json'
+
+PathLike = Union[str, Path]
+
+
+def fingerprint(*parts: Any) -> str:
+    """SHA-256 over a canonical JSON encoding of the given parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def task_signature(tasks: List[Task]) -> List[List[Any]]:
+    """Input fields of each task (scheduling state is ignored)."""
+    return [[t.id, t.arrival_time, t.processing_time, t.priority.name, t.deadline,
+             t.cpu_required, t.ram_required] for t in tasks]
+
+
+def schedule_signature(tasks: List[Task]) -> List[List[Any]]:
+    """Task inputs plus the recorded machine, start and completion times."""
+    return [row + [t.machine_id, t.start_time, t.completion_time]
+            for row, t in zip(task_signature(tasks), tasks)]
+
+
+def scheduler_signature(scheduler: Scheduler) -> Dict[str, Any]:
+    """
+    Algorithm class, scalar parameters and machine configuration.
+
+    Works on a scheduler that has not run yet, so callers can build one
+    with an empty task list just to describe it.
+    """
+    params = {name: value for name, value in vars(scheduler).items()
+              if isinstance(value, (bool, int, float, str))
+              and name not in ('current_time', 'num_machines')}
+    return {
+        'algorithm': type(scheduler).__name__,
+        'params': params,
+        'machines': [[m.id, m.cpu_capacity, m.ram_capacity] for m in scheduler.machines],
+    }
+
+
+def file_digest(path: PathLike, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ChartManifest:
+    """
+    Recorded fingerprints for the charts in one output directory.
+
+    Usage:
+        manifest = ChartManifest('visualizations')
+        if not manifest.is_current('chart.png', fp):
+            draw_chart()
+            manifest.record('chart.png', fp)
+        manifest.save()
+
+    Attributes:
+        output_dir: Directory holding the charts and the manifest
+        path: Manifest file path
+        entries: {chart file name: fingerprint}
+    """
+
+    def __init__(self, output_dir: PathLike, name: str = MANIFEST_NAME) -> None:
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / name
+        self.entries: Dict[str, str] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8'))
+            except (ValueError, OSError):
+                # A corrupt manifest only costs a full regeneration
+                self.entries = {}
+
+    def is_current(self, chart: str, fp: str) -> bool:
+        """True if the chart exists and was rendered from the same fingerprint."""
+        return self.entries.get(chart) == fp and (self.output_dir / chart).exists()
+
+    def record(self, chart: str, fp: str) -> None:
+        """Remember the fingerprint a chart was just rendered from."""
+        self.entries[chart] = fp
+
+    def forget(self, chart: Optional[str] = None) -> None:
+        """Drop one chart's entry, or every entry when chart is None."""
+        if chart is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(chart, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        tmp.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, self.path)
@@ -0,0 +1,192 @@
+"""
+Multi-Objective Pareto Frontiers
+================================
+
+Non-dominated sets over experiment results, e.g. success rate vs makespan
+vs high-priority success vs p99 latency across a large parameter sweep.
+
+A point dominates another if it is at least as good in every objective and
+strictly better in at least one. Identical points never dominate each other,
+so duplicates are either all on the frontier or all off it.
+
+Algorithms (all objectives are converted to minimization first):
+
+- 1-D: the minimum
+- 2-D: sort by the first objective, sweep keeping the running best second
+  objective (O(n log n))
+- 3-D: sort by the first objective, sweep while keeping the 2-D staircase of
+  the remaining objectives in a sorted list; each point is one binary search
+  plus a contiguous splice (O(n log n) comparisons)
+- 4-D and up: block-nested-loop over points presorted by coordinate sum
+  (sort-filter-skyline). The presort guarantees a point can only be
+  dominated by points before it, so the window of frontier points never
+  shrinks, and each point is tested against the whole window in one
+  vectorized comparison.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import math
+
+MAXIMIZE = 'max'
+MINIMIZE = 'min'
+
+# Default sweep objectives: column name → direction
+DEFAULT_OBJECTIVES: Dict[str, str] = {
+    'Total Success Rate (%)': MAXIMIZE,
+    'Makespan': MINIMIZE,
+    'High Success Rate (%)': MAXIMIZE,
+    'P99 Response Time': MINIMIZE,
+}
+
+# Points compared per vectorized step in the 4+-objective filter
+BNL_BLOCK = 256
+
+
+def parse_objectives(specs: Sequence[str]) -> Dict[str, str]:
+    """
+    Parse 'column:max' / 'column:min' strings (direction defaults to max).
+
+    Raises:
+        ValueError: For an unknown direction
+    """
+    objectives: Dict[str, str] = {}
+    for spec in specs:
+        column, _, sense = spec.rpartition(':')
+        if not column:
+            column, sense = sense, MAXIMIZE
+        sense = sense.strip().lower()
+        if sense not in (MAXIMIZE, MINIMIZE):
+            raise ValueError(f"Objective direction must be 'max' or 'min': {spec}")
+        objectives[column.strip()] = sense
+    return objectives
+
+
+def pareto_front(points: Sequence[Sequence[float]],
+                 senses: Optional[Sequence[str]] = None) -> List[int]:
+    """
+    Indices of the non-dominated points, in input order.
+
+    Args:
+        points: One tuple of objective values per point (all the same length)
+        senses: 'max' or 'min' per objective (default: all 'min')
+
+    Raises:
+        ValueError: If points have inconsistent dimensions
+    """
+    if not points:
+        return []
+    dims = len(points[0])
+    senses = list(senses) if senses is not None else [MINIMIZE] * dims
+    if len(senses) != dims or any(len(p) != dims for p in points):
+        raise ValueError("Every point needs one value per objective")
+    signs = [-1.0 if s == MAXIMIZE else 1.0 for s in senses]
+
+    # Minimization form; exact duplicates share one representative
+    groups: Dict[tuple, List[int]] = {}
+    for i, p in enumerate(points):
+        key = tuple(sign * float(v) for sign, v in zip(signs, p))
+        if any(math.isnan(v) for v in key):
+            continue  # Missing values never reach the frontier
+        groups.setdefault(key, []).append(i)
+    unique = sorted(groups)
+
+    if dims == 1:
+        front = unique[:1]
+    elif dims == 2:
+        front = _front_2d(unique)
+    elif dims == 3:
+        front = _front_3d(unique)
+    else:
+        front = _front_bnl(unique)
+
+    return sorted(i for key in front for i in groups[key])
+
+
+def _front_2d(points: List[tuple]) -> List[tuple]:
+    """Sweep over lexicographically sorted, distinct points."""
+    front = []
+    best = math.inf
+    for p in points:
+        if p[1] < best:
+            front.append(p)
+            best = p[1]
+    return front
+
+
+def _front_3d(points: List[tuple]) -> List[tuple]:
+    """
+    Sweep over lexicographically sorted, distinct points.
+
+    Every earlier point is no worse in the first objective, so a point is
+    dominated iff some earlier frontier point is no worse in the other two.
+    The staircase holds the (y, z) projections of the frontier so far, with
+    y ascending and z strictly descending; the candidate with the smallest z
+    among y' <= y is the one just left of y.
+    """
+    stair_y: List[float] = []
+    stair_z: List[float] = []
+    front = []
+    for p in points:
+        _, y, z = p
+        pos = bisect_right(stair_y, y)
+        if pos and stair_z[pos - 1] <= z:
+            continue
+        front.append(p)
+        # Drop staircase steps the new point covers (y' >= y and z' >= z)
+        end = pos
+        while end < len(stair_y) and stair_z[end] >= z:
+            end += 1
+        stair_y[pos:end] = [y]
+        stair_z[pos:end] = [z]
+    return front
+
+
+def _front_bnl(points: List[tuple], block: int = BNL_BLOCK) -> List[tuple]:
+    """
+    Sort-filter block-nested-loop for four or more objectives.
+
+    For distinct points ordered by coordinate sum, p <= q componentwise
+    already means p dominates q, and only earlier points can do so. Because
+    dominance is transitive, a point is on the frontier iff no earlier point
+    (frontier or not) is <= it, so each block is tested against the window
+    and against itself in two broadcast comparisons.
+    """
+    import numpy as np
+
+    ordered = np.array(sorted(points, key=sum), dtype=float)
+    window = ordered[:0]
+    keep = np.zeros(len(ordered), dtype=bool)
+    for start in range(0, len(ordered), block):
+        chunk = ordered[start:start + block]
+        # Prune against the frontier so far first; survivors are usually few
+        alive = ~np.all(window[:, None, :] <= chunk[None, :, :], axis=2).any(axis=0)
+        candidates = chunk[alive]
+        within = np.all(candidates[:, None, :] <= candidates[None, :, :], axis=2)
+        np.fill_diagonal(within, False)
+        survivors = np.flatnonzero(alive)[~within.any(axis=0)]
+        keep[start + survivors] = True
+        window = np.concatenate([window, chunk[survivors]])
+    return [tuple(row) for row in ordered[keep].tolist()]
+
+
+def pareto_frontier(rows: Sequence[Mapping[str, Any]],
+                    objectives: Optional[Mapping[str, str]] = None) -> List[Mapping[str, Any]]:
+    """
+    Frontier rows of a result table (e.g. ExperimentRunner.results).
+
+    Args:
+        rows: Result dictionaries containing every objective column
+        objectives: Column → 'max' or 'min' (default: DEFAULT_OBJECTIVES)
+
+    Returns:
+        The non-dominated rows, in input order
+
+    Raises:
+        KeyError: If a row lacks an objective column
+    """
+    objectives = dict(objectives or DEFAULT_OBJECTIVES)
+    columns = list(objectives)
+    points = [tuple(row[c] for c in columns) for row in rows]
+    return [rows[i] for i in pareto_front(points, [objectives[c] for c in columns])]
@@ -0,0 +1,173 @@
+"""
+Simulation Profiling
+====================
+
+Runs a simulation under cProfile and folds the result into the engine's
+phases:
+
+- event pop: Scheduler._pop_events (heap pops, clock advance)
+- arrival handling / completion handling: _handle_arrival, _handle_completion
+  (including listener notifications)
+- compatibility filtering: _compatible_tasks (resource fit scan per machine)
+- select_task: the algorithm's selection, including everything it calls
+- logging: _log_entry (building run()'s event log)
+- result building: get_results
+- engine loop: the rest of run() and schedule_ready_tasks (event sorting,
+  idle-machine scan, ready-queue removal, completion pushes)
+
+Also writes collapsed stacks ("a;b;c <µs>" lines) that flamegraph.pl,
+speedscope or inferno render directly. cProfile records caller → callee
+edges rather than full stacks, so stacks are rebuilt from the call graph:
+time of a function reached from several callers is split between them in
+proportion to the time each edge accounts for.
+"""
+
+import cProfile
+import pstats
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .simulator import Scheduler
+
+# Phase → engine functions whose inclusive time belongs to it
+PHASES: List[Tuple[str, Tuple[str, ...]]] = [
+    ('event pop', ('_pop_events',)),
+    ('arrival handling', ('_handle_arrival',)),
+    ('completion handling', ('_handle_completion',)),
+    ('compatibility filtering', ('_compatible_tasks',)),
+    ('select_task', ('select_task',)),
+    ('logging', ('_log_entry',)),
+    ('result building', ('get_results',)),
+]
+
+# Inclusive time minus the phases above
+ENGINE_LOOP = 'engine loop'
+
+FuncKey = Tuple[str, int, str]
+
+
+def frame_label(func: FuncKey) -> str:
+    """Readable frame name: 'module.function' or the built-in's description."""
+    filename, _, name = func
+    if filename == '~':
+        label = name.strip('{}')
+    else:
+        label = f"{Path(filename).stem}.{name}"
+    return label.replace(';', ',')
+
+
+class ProfileReport:
+    """
+    Profile of one simulation run plus result building.
+
+    Attributes:
+        stats: pstats.Stats of the run
+        total: Profiled seconds (run() + get_results())
+        phases: Phase name → seconds, in PHASES order plus ENGINE_LOOP
+    """
+
+    def __init__(self, profiler: cProfile.Profile) -> None:
+        self.stats = pstats.Stats(profiler)
+        self._raw = self.stats.stats
+        # Top-level frames: run() and get_results(), not the profiler's own disable()
+        self._roots = [f for f, entry in self._raw.items()
+                       if f[2] in ('run', 'get_results') and not entry[4]]
+        self.total = sum(self._raw[f][3] for f in self._roots)
+        self.phases = self._phase_times()
+
+    def _phase_times(self) -> Dict[str, float]:
+        phases: Dict[str, float] = {}
+        for phase, names in PHASES:
+            members = {f for f in self._raw if f[2] in names}
+            # Count time entering the phase from outside it, so a subclass
+            # calling super().select_task() is not counted twice
+            phases[phase] = sum(
+                edge[3]
+                for f in members
+                for caller, edge in self._raw[f][4].items()
+                if caller not in members
+            ) + sum(self._raw[f][3] for f in members if not self._raw[f][4])
+        phases[ENGINE_LOOP] = max(0.0, self.total - sum(phases.values()))
+        return phases
+
+    def top(self, n: int = 20, sort: str = 'tottime') -> List[Dict[str, Any]]:
+        """
+        The n most expensive functions.
+
+        Args:
+            n: Number of rows
+            sort: 'tottime' (self time) or 'cumtime' (inclusive time)
+        """
+        column = {'tottime': 2, 'cumtime': 3}[sort]
+        rows = sorted(self._raw.items(), key=lambda item: item[1][column], reverse=True)[:n]
+        return [{
+            'function': frame_label(func),
+            'location': f"{Path(func[0]).name}:{func[1]}" if func[0] != '~' else '',
+            'calls': entry[1],
+            'tottime': entry[2],
+            'cumtime': entry[3],
+        } for func, entry in rows]
+
+    def collapsed_stacks(self, min_seconds: float = 1e-6) -> Dict[str, float]:
+        """
+        Seconds of self time per reconstructed call stack.
+
+        Args:
+            min_seconds: Skip subtrees smaller than this
+        """
+        callees: Dict[FuncKey, Dict[FuncKey, float]] = defaultdict(dict)
+        for func, entry in self._raw.items():
+            for caller, edge in entry[4].items():
+                callees[caller][func] = edge[3]
+
+        stacks: Dict[str, float] = defaultdict(float)
+
+        def walk(func: FuncKey, path: List[str], on_path: set, seconds: float) -> None:
+            inclusive = self._raw[func][3]
+            if inclusive <= 0 or seconds < min_seconds:
+                return
+            share = min(1.0, seconds / inclusive)
+            stacks[';'.join(path)] += self._raw[func][2] * share
+            for callee, edge_seconds in callees[func].items():
+                if callee not in on_path:  # Recursion: charge it to the outer frame
+                    walk(callee, path + [frame_label(callee)], on_path | {callee},
+                         edge_seconds * share)
+
+        for func in self._roots:
+            walk(func, [frame_label(func)], {func}, self._raw[func][3])
+        return dict(stacks)
+
+    def write_collapsed(self, path: str) -> int:
+        """
+        Write collapsed stacks ('frame;frame;frame microseconds' per line).
+
+        Returns:
+            Number of stacks written
+        """
+        stacks = self.collapsed_stacks()
+        lines = [f"{stack} {round(seconds * 1e6)}"
+                 for stack, seconds in sorted(stacks.items()) if round(seconds * 1e6) > 0]
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text('\n'.join(lines) + '\n')
+        return len(lines)
+
+
+def profile_run(scheduler: Scheduler) -> ProfileReport:
+    """
+    Run a scheduler (and build its results) under cProfile.
+
+    Args:
+        scheduler: A scheduler that has not run yet
+
+    Returns:
+        ProfileReport of run() followed by get_results()
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        scheduler.run()
+        scheduler.get_results()
+    finally:
+        profiler.disable()
+    return ProfileReport(profiler)
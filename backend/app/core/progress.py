@@ -0,0 +1,211 @@
+"""
+Progress Reporting
+==================
+
+How the runner and sweeps report finished experiments:
+
+- silent: nothing
+- bar: one progress line with completion, experiments/sec and ETA,
+  redrawn at most a few times per second (in place on a terminal, as
+  separate lines at a slower rate when piped, e.g. into CI logs)
+- verbose: scenario banners and a metrics summary per experiment, through
+  the logging module like the rest of the runner's output
+
+Reporters are called from the process that collects results; worker
+processes return their outcomes and never write to the terminal, so
+parallel runs cannot interleave output. A lock serializes calls from
+several threads.
+"""
+
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_LEVELS = ('silent', 'bar', 'verbose')
+
+
+def format_duration(seconds: float) -> str:
+    """H:MM:SS (or M:SS under an hour)."""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class Progress:
+    """
+    Silent reporter; the base of the others.
+
+    Usage:
+        progress.start(total=168, label='Experiments')
+        progress.section('SCENARIO: Challenge 1', ['Tasks: 10, Machines: 2'])
+        progress.step('EDF on Challenge 1', metrics)
+        progress.finish()
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.total = 0
+        self.done = 0
+        self.label = ''
+        self._skipped = 0
+        self._started = clock()
+
+    def start(self, total: int, label: str = '') -> None:
+        """Begin counting towards total experiments."""
+        with self._lock:
+            self.total, self.done, self.label, self._skipped = total, 0, label, 0
+            self._started = self._clock()
+            self._on_start()
+
+    def section(self, title: str, lines: List[str] = ()) -> None:
+        """A group of experiments begins (e.g. a scenario)."""
+        with self._lock:
+            self._on_section(title, list(lines))
+
+    def step(self, label: str, metrics: Optional[Dict[str, Any]] = None,
+             skipped: bool = False) -> None:
+        """
+        One experiment finished.
+
+        Args:
+            label: What ran, e.g. 'EDF on Challenge 1'
+            metrics: Its metrics row, summarized by the verbose reporter
+            skipped: Restored from an earlier run rather than simulated
+                (not counted towards the rate)
+        """
+        with self._lock:
+            self.done += 1
+            self._skipped += skipped
+            self._on_step(label, metrics, skipped)
+
+    def finish(self) -> None:
+        """All experiments finished (or the run stopped)."""
+        with self._lock:
+            self._on_finish()
+
+    @property
+    def rate(self) -> float:
+        """Simulated experiments per second so far."""
+        elapsed = self._clock() - self._started
+        return (self.done - self._skipped) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds until total is reached at the current rate (None before any rate)."""
+        rate = self.rate
+        return (self.total - self.done) / rate if rate > 0 else None
+
+    def _on_start(self) -> None:
+        pass
+
+    def _on_section(self, title: str, lines: List[str]) -> None:
+        pass
+
+    def _on_step(self, label: str, metrics: Optional[Dict[str, Any]], skipped: bool) -> None:
+        pass
+
+    def _on_finish(self) -> None:
+        pass
+
+
+class BarProgress(Progress):
+    """
+    Throttled progress bar.
+
+    Args:
+        stream: Where to draw (default: stderr, keeping stdout for results)
+        min_interval: Seconds between redraws (default: 0.25 on a terminal,
+            5 when the stream is not one)
+        width: Bar width in characters
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, min_interval: Optional[float] = None,
+                 width: int = 30, clock: Callable[[], float] = time.monotonic) -> None:
+        super().__init__(clock)
+        self.stream = stream or sys.stderr
+        isatty = getattr(self.stream, 'isatty', None)
+        self._inline = bool(isatty and isatty())
+        self.min_interval = min_interval if min_interval is not None else (0.25 if self._inline else 5.0)
+        self.width = width
+        self._last_draw: Optional[float] = None
+
+    def render(self) -> str:
+        """The progress line for the current state."""
+        if self.total:
+            fraction = self.done / self.total
+            filled = int(self.width * fraction)
+            eta = self.eta
+            line = (f"[{'█' * filled}{'░' * (self.width - filled)}] {self.done}/{self.total} "
+                    f"{fraction:4.0%} | {self.rate:.1f} exp/s | "
+                    f"ETA {format_duration(eta) if eta is not None else '--:--'}")
+        else:
+            # Experiments run one at a time, without start()
+            line = f"{self.done} done | {self.rate:.1f} exp/s"
+        return f"{self.label} {line}" if self.label else line
+
+    def _draw(self, final: bool = False) -> None:
+        now = self._clock()
+        if not final and self._last_draw is not None and now - self._last_draw < self.min_interval:
+            return
+        self._last_draw = now
+        if self._inline:
+            self.stream.write('\r' + self.render() + ('\n' if final else ''))
+        else:
+            self.stream.write(self.render() + '\n')
+        self.stream.flush()
+
+    def _on_start(self) -> None:
+        self._last_draw = None
+        self._draw()
+
+    def _on_step(self, label: str, metrics: Optional[Dict[str, Any]], skipped: bool) -> None:
+        self._draw(final=bool(self.total) and self.done >= self.total)
+
+    def _on_finish(self) -> None:
+        if self.done < self.total:
+            self._draw(final=True)
+        elapsed = self._clock() - self._started
+        self.stream.write(f"{self.done} experiments in {format_duration(elapsed)}\n")
+        self.stream.flush()
+
+
+class VerboseProgress(Progress):
+    """Banners and a summary per experiment, logged at INFO."""
+
+    def _on_section(self, title: str, lines: List[str]) -> None:
+        logger.info(f"\n\n{'=' * 80}")
+        logger.info(title)
+        for line in lines:
+            logger.info(line)
+        logger.info('=' * 80)
+
+    def _on_step(self, label: str, metrics: Optional[Dict[str, Any]], skipped: bool) -> None:
+        prefix = f"[{self.done}/{self.total}] " if self.total else ''
+        logger.info(f"\n{prefix}{'⏭️  Recorded' if skipped else '🔬 Ran'}: {label}")
+        if metrics and not skipped:
+            logger.info(f"  ✓ Success Rate: {metrics['Total Success Rate (%)']:.1f}%")
+            logger.info(f"  ✓ High Priority: {metrics['High Success Rate (%)']:.1f}%")
+            logger.info(f"  ✓ Low Priority: {metrics['Low Success Rate (%)']:.1f}%")
+            logger.info(f"  ⏱ Makespan: {metrics['Makespan']:.1f}")
+
+
+def make_progress(level: str, stream: Optional[TextIO] = None) -> Progress:
+    """
+    Reporter for a level in PROGRESS_LEVELS.
+
+    Raises:
+        ValueError: For an unknown level
+    """
+    if level == 'silent':
+        return Progress()
+    if level == 'bar':
+        return BarProgress(stream)
+    if level == 'verbose':
+        return VerboseProgress()
+    raise ValueError(f"Unknown progress level '{level}' (available: {', '.join(PROGRESS_LEVELS)})")
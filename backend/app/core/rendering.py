@@ -0,0 +1,203 @@
+"""
+Server-Side Chart Rendering
+===========================
+
+Renders Gantt charts to PNG/SVG/PDF bytes for the API without blocking it:
+
+- GanttRenderer owns one dedicated worker process (Agg backend, one reused
+  figure) and exposes an async render() that awaits it via run_in_executor.
+  Hashing the schedule for the cache key runs in a thread, and a worker
+  that dies is replaced on the next render.
+- RenderCache keeps recently rendered images in memory, bounded by total
+  size and evicted least-recently-used first, keyed by a hash of the
+  schedule and the render options.
+
+Matplotlib is only imported inside the worker process, so the API process
+stays light.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from .simulator import Task
+from .manifest import fingerprint, schedule_signature
+
+# Media types for the supported output formats
+RENDER_FORMATS = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+}
+
+# Figure reused by every chart the render worker draws
+_worker_figure = None
+
+
+def _init_worker() -> None:
+    """Worker initializer: headless backend, imported once per process."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render_job(job: Dict[str, Any]) -> bytes:
+    """Render one Gantt chart inside the worker process."""
+    global _worker_figure
+    from .visualizer import SchedulingVisualizer
+    import matplotlib.pyplot as plt
+
+    if _worker_figure is None:
+        _worker_figure = plt.figure()
+    return SchedulingVisualizer(output_dir=None).render_gantt_image(
+        job['tasks'], job['algorithm'], job['scenario'],
+        num_machines=job['num_machines'], fmt=job['format'],
+        fig=_worker_figure, **job['options']
+    )
+
+
+def render_key(tasks: List[Task], num_machines: int, algorithm: str,
+               scenario: str, fmt: str, options: Dict[str, Any]) -> str:
+    """Cache key: hash of the schedule, chart labels and render options."""
+    return fingerprint(num_machines, schedule_signature(tasks), algorithm,
+                       scenario, fmt, options)
+
+
+class RenderCache:
+    """
+    Thread-safe LRU cache of rendered images, bounded by total bytes.
+
+    Attributes:
+        max_bytes: Size budget; an image larger than this is never cached
+        size: Bytes currently held
+        hits: Lookups answered from the cache
+        misses: Lookups that found nothing
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached image for key (marking it most recently used), or None."""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: str, image: bytes) -> None:
+        """Store an image, evicting least recently used entries to fit."""
+        if len(image) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = image
+            self.size += len(image)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class GanttRenderer:
+    """
+    Render Gantt charts in a dedicated worker process, with caching.
+
+    Usage:
+        renderer = GanttRenderer()
+        image, cached = await renderer.render(tasks, 2, 'EDF', 'My scenario')
+        renderer.shutdown()
+
+    Attributes:
+        cache: RenderCache shared by all requests
+    """
+
+    def __init__(self, cache_bytes: int = 64 * 1024 * 1024) -> None:
+        self.cache = RenderCache(cache_bytes)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        # Started on first use so importing the API never spawns a process
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=1, initializer=_init_worker)
+            return self._executor
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        # Concurrent renders may all see the same broken pool; replace it once
+        with self._executor_lock:
+            if self._executor is pool:
+                pool.shutdown(wait=False)
+                self._executor = None
+
+    async def render(self, tasks: List[Task], num_machines: int, algorithm: str,
+                     scenario: str, fmt: str = 'png',
+                     options: Optional[Dict[str, Any]] = None) -> Tuple[bytes, bool]:
+        """
+        Render (or fetch from cache) a Gantt chart of a finished schedule.
+
+        Args:
+            tasks: Scheduled tasks (start/completion/machine set)
+            num_machines: Number of machine rows
+            algorithm: Algorithm label for the title
+            scenario: Scenario label for the title
+            fmt: Key of RENDER_FORMATS
+            options: Extra render_gantt_image keyword arguments
+                (mode, time_window, profile, ...)
+
+        Returns:
+            (image bytes, whether the image came from the cache)
+        """
+        if fmt not in RENDER_FORMATS:
+            raise ValueError(f"Unsupported format '{fmt}'")
+        options = dict(options or {})
+        loop = asyncio.get_running_loop()
+        # Hashing a large schedule takes long enough to stall the event loop
+        key = await loop.run_in_executor(None, render_key, tasks, num_machines,
+                                         algorithm, scenario, fmt, options)
+        image = self.cache.get(key)
+        if image is not None:
+            return image, True
+
+        job = {'tasks': tasks, 'num_machines': num_machines, 'algorithm': algorithm,
+               'scenario': scenario, 'format': fmt, 'options': options}
+        pool = self._pool()
+        try:
+            image = await loop.run_in_executor(pool, _render_job, job)
+        except BrokenProcessPool:
+            # The worker died (e.g. killed for memory); retry once in a new one
+            self._discard_pool(pool)
+            image = await loop.run_in_executor(self._pool(), _render_job, job)
+        self.cache.put(key, image)
+        return image, False
+
+    def shutdown(self) -> None:
+        """Stop the worker process (a later render starts a new one)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
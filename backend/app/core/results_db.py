@@ -0,0 +1,411 @@
+"""
+Indexed Results Database
+========================
+
+SQLite store of experiment results, so analysis questions ("mean success
+rate of every DPE α on the challenge scenarios since Monday") run as
+indexed SQL instead of loading whole result CSVs.
+
+Layout:
+
+- results: one row per experiment with its source (the results file it
+  was exported to), recording time, scenario, algorithm label, base
+  algorithm, machine count (when known) and one REAL column per metric.
+  Metric columns keep their CSV names and are added as new metrics appear.
+- params: (result, name, value) rows of the algorithm's parameters, parsed
+  from labels like 'DPE (α=0.5)', plus a sweep's workload columns.
+
+Scenario, algorithm, base algorithm, source, recording time and
+(parameter name, value) are indexed. A source is written as a unit in one
+transaction with batched inserts; writing it again replaces its earlier
+rows, mirroring how the CSV itself is overwritten.
+"""
+
+import csv
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .algorithms import parse_algorithm_label
+from .store import write_atomic
+
+# Rows per executemany() call
+BATCH_SIZE = 1000
+
+# CSV column → column of the results table
+IDENTITY_COLUMNS = {
+    'Scenario': 'scenario',
+    'Algorithm': 'algorithm',
+    'Base Algorithm': 'base_algorithm',
+    'Machines': 'machines',
+    'Source': 'source',
+    'Recorded At': 'recorded_at',
+}
+
+# Aggregate name → SQL function
+AGGREGATES = {'count': 'COUNT', 'mean': 'AVG', 'min': 'MIN', 'max': 'MAX', 'sum': 'SUM'}
+
+OPERATORS = ('<=', '>=', '!=', '=', '<', '>')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    base_algorithm TEXT NOT NULL,
+    machines INTEGER
+);
+CREATE TABLE IF NOT EXISTS params (
+    result_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (result_id, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS param_names (name TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_scenario ON results (scenario);
+CREATE INDEX IF NOT EXISTS results_algorithm ON results (algorithm);
+CREATE INDEX IF NOT EXISTS results_base_algorithm ON results (base_algorithm);
+CREATE INDEX IF NOT EXISTS results_source ON results (source);
+CREATE INDEX IF NOT EXISTS results_recorded_at ON results (recorded_at);
+CREATE INDEX IF NOT EXISTS params_value ON params (name, value, result_id);
+"""
+
+
+def quote(name: str) -> str:
+    """SQL identifier for a column name such as 'Total Success Rate (%)'."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    """SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def parse_filter(expression: str) -> Tuple[str, str, Any]:
+    """
+    Split 'column<op>value' (op one of <=, >=, !=, =, <, >).
+
+    >>> parse_filter('Makespan<=120')
+    ('Makespan', '<=', 120.0)
+
+    Raises:
+        ValueError: Without an operator, column or value
+    """
+    for op in OPERATORS:
+        column, found, value = expression.partition(op)
+        if found:
+            column, value = column.strip(), value.strip()
+            if not column or not value:
+                break
+            try:
+                return column, op, float(value)
+            except ValueError:
+                return column, op, value
+    raise ValueError(f"Filter must look like 'column<op>value' with one of "
+                     f"{' '.join(OPERATORS)}: {expression!r}")
+
+
+def parse_aggregate(spec: str) -> Tuple[str, Optional[str]]:
+    """
+    Split 'function:column' ('count' alone counts rows).
+
+    Raises:
+        ValueError: For an unknown function or a missing column
+    """
+    function, _, column = spec.partition(':')
+    function = function.strip().lower()
+    if function not in AGGREGATES:
+        raise ValueError(f"Unknown aggregate '{function}' (available: {', '.join(AGGREGATES)})")
+    if function != 'count' and not column:
+        raise ValueError(f"Aggregate '{function}' needs a column, e.g. '{function}:Makespan'")
+    return function, column or None
+
+
+def _number(value: Any) -> Optional[float]:
+    """Metric value as a float; None for blanks and non-numeric values."""
+    if isinstance(value, bool) or value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ResultsDB:
+    """
+    SQLite results database.
+
+    Usage:
+        with ResultsDB('results/results.db') as db:
+            db.add_results('results/comprehensive_results.csv', runner.results)
+            columns, rows = db.query(group_by=['Algorithm'], aggregates=['mean:Makespan'])
+
+    Attributes:
+        path: Database file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        # WAL lets queries run while a run is writing
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._metrics = self._metric_columns()
+
+    def _metric_columns(self) -> List[str]:
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(results)')]
+        return [c for c in columns if c not in ('id', *IDENTITY_COLUMNS.values())]
+
+    @property
+    def metrics(self) -> List[str]:
+        """Metric columns, in the order they first appeared."""
+        return list(self._metrics)
+
+    def param_names(self) -> List[str]:
+        return [row[0] for row in self._conn.execute('SELECT name FROM param_names ORDER BY name')]
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def sources(self) -> List[Tuple[str, str, int]]:
+        """(source, last recorded at, experiments) per source, newest first."""
+        return self._conn.execute(
+            'SELECT source, MAX(recorded_at), COUNT(*) FROM results '
+            'GROUP BY source ORDER BY MAX(recorded_at) DESC').fetchall()
+
+    def add_results(self, source: str, rows: Iterable[Dict[str, Any]],
+                    param_columns: Sequence[str] = (), replace: bool = True) -> int:
+        """
+        Store result rows (ExperimentRunner.results or sweep rows).
+
+        Args:
+            source: Results file the rows belong to
+            rows: Dicts with 'Scenario' and 'Algorithm' plus metric columns
+            param_columns: Row columns to store as parameters, not metrics
+            replace: Drop the source's earlier rows first
+
+        Returns:
+            int: Rows stored
+        """
+        rows = list(rows)
+        recorded_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        params_set = set(param_columns)
+
+        new_metrics = []
+        for row in rows:
+            for column, value in row.items():
+                if (column not in IDENTITY_COLUMNS and column not in params_set
+                        and column not in self._metrics and column not in new_metrics
+                        and _number(value) is not None):
+                    new_metrics.append(column)
+
+        with self._conn:
+            for column in new_metrics:
+                self._conn.execute(f'ALTER TABLE results ADD COLUMN {quote(column)} REAL')
+            self._metrics.extend(new_metrics)
+            if replace:
+                self._conn.execute('DELETE FROM params WHERE result_id IN '
+                                   '(SELECT id FROM results WHERE source = ?)', (source,))
+                self._conn.execute('DELETE FROM results WHERE source = ?', (source,))
+
+            columns = ['id', 'source', 'recorded_at', 'scenario', 'algorithm', 'base_algorithm',
+                       'machines'] + self._metrics
+            insert = (f"INSERT INTO results ({', '.join(map(quote, columns))}) "
+                      f"VALUES ({', '.join('?' * len(columns))})")
+            next_id = self._conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM results').fetchone()[0]
+            names = set()
+            for start in range(0, len(rows), BATCH_SIZE):
+                result_rows, param_rows = [], []
+                for offset, row in enumerate(rows[start:start + BATCH_SIZE]):
+                    result_id = next_id + start + offset
+                    base, params = parse_algorithm_label(row['Algorithm'])
+                    for column in param_columns:
+                        if _number(row.get(column)) is not None:
+                            params[column] = _number(row[column])
+                    machines = _number(row.get('Machines'))
+                    result_rows.append([result_id, source, recorded_at, row['Scenario'],
+                                        row['Algorithm'], row.get('Base Algorithm') or base,
+                                        None if machines is None else int(machines)]
+                                       + [_number(row.get(m)) for m in self._metrics])
+                    param_rows.extend((result_id, name, value) for name, value in params.items())
+                    names.update(params)
+                self._conn.executemany(insert, result_rows)
+                self._conn.executemany('INSERT INTO params VALUES (?, ?, ?)', param_rows)
+            self._conn.executemany('INSERT OR IGNORE INTO param_names VALUES (?)',
+                                   [(n,) for n in sorted(names)])
+        return len(rows)
+
+    def import_csv(self, path: str, source: Optional[str] = None) -> int:
+        """
+        Store a results CSV (export_to_csv() output or a sweep CSV).
+
+        Args:
+            path: CSV file
+            source: Source name (default: the path)
+
+        Returns:
+            int: Rows stored
+        """
+        from .sweep import param_columns
+
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            header = reader.fieldnames or []
+        return self.add_results(source or path, rows, param_columns(header))
+
+    def _reference(self, name: str, joins: Dict[str, str]) -> Tuple[str, str]:
+        """
+        SQL expression and output label of a column name.
+
+        Names are looked up as identity columns (CSV or SQL name), then
+        metrics, then parameters (joined in as needed).
+        """
+        for label, column in IDENTITY_COLUMNS.items():
+            if name.lower() in (label.lower(), column):
+                return f'r.{column}', label
+        if name in self._metrics:
+            return f'r.{quote(name)}', name
+        folded = [m for m in self._metrics if m.lower() == name.lower()]
+        if len(folded) == 1:
+            return f'r.{quote(folded[0])}', folded[0]
+        if name in self.param_names():
+            if name not in joins:
+                alias = f'p{len(joins)}'
+                joins[name] = (f"LEFT JOIN params AS {alias} "
+                               f"ON {alias}.result_id = r.id AND {alias}.name = {quote_literal(name)}")
+            return f"p{list(joins).index(name)}.value", name
+        raise ValueError(f"Unknown column '{name}' (columns: "
+                         f"{', '.join(list(IDENTITY_COLUMNS) + self._metrics + self.param_names())})")
+
+    def build_query(self, filters: Sequence[Tuple[str, str, Any]] = (),
+                    group_by: Sequence[str] = (), aggregates: Sequence[str] = (),
+                    columns: Optional[Sequence[str]] = None, order_by: Optional[str] = None,
+                    descending: bool = False,
+                    limit: Optional[int] = None) -> Tuple[str, List[Any], List[str]]:
+        """
+        SQL for query(): (statement, arguments, output labels).
+
+        Raises:
+            ValueError: For unknown columns, aggregates or operators
+        """
+        joins: Dict[str, str] = {}
+        select, labels = [], []
+        if group_by or aggregates:
+            for name in group_by:
+                expression, label = self._reference(name, joins)
+                select.append(expression)
+                labels.append(label)
+            for spec in aggregates or ['count']:
+                function, column = parse_aggregate(spec)
+                if column is None:
+                    select.append('COUNT(*)')
+                    labels.append('count')
+                else:
+                    expression, label = self._reference(column, joins)
+                    select.append(f'{AGGREGATES[function]}({expression})')
+                    labels.append(f'{function}({label})')
+        else:
+            for name in columns or ['Scenario', 'Algorithm'] + self._metrics:
+                expression, label = self._reference(name, joins)
+                select.append(expression)
+                labels.append(label)
+
+        where, args = [], []
+        for column, op, value in filters:
+            if op not in OPERATORS and op != 'glob':
+                raise ValueError(f"Unknown operator '{op}'")
+            expression, _ = self._reference(column, joins)
+            where.append(f"{expression} {op.upper()} ?")
+            args.append(value)
+
+        order = None
+        if order_by:
+            if order_by in labels:
+                order = str(labels.index(order_by) + 1)
+            else:
+                order = self._reference(order_by, joins)[0]
+                if order not in select and (group_by or aggregates):
+                    raise ValueError(f"Cannot order grouped rows by '{order_by}'; "
+                                     f"use one of: {', '.join(labels)}")
+            order += ' DESC' if descending else ''
+        elif group_by:
+            order = ', '.join(str(i + 1) for i in range(len(group_by)))
+        elif not aggregates:
+            order = 'r.id'
+
+        # Assembled last: filters and ordering may have joined more parameters
+        sql = f"SELECT {', '.join(select)} FROM results AS r"
+        for join in joins.values():
+            sql += f" {join}"
+        if where:
+            sql += f" WHERE {' AND '.join(where)}"
+        if group_by:
+            sql += f" GROUP BY {', '.join(select[:len(group_by)])}"
+        if order:
+            sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+        return sql, args, labels
+
+    def query(self, filters: Sequence[Tuple[str, str, Any]] = (),
+              group_by: Sequence[str] = (), aggregates: Sequence[str] = (),
+              columns: Optional[Sequence[str]] = None, order_by: Optional[str] = None,
+              descending: bool = False,
+              limit: Optional[int] = None) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Filter, group and aggregate results in SQL.
+
+        Column names are CSV names ('Scenario', 'Makespan', ...) or
+        parameter names ('alpha'); matching is case-insensitive.
+
+        Args:
+            filters: (column, operator, value) conditions, all of which must
+                hold; operators are =, !=, <, <=, >, >= and 'glob' (* and ?
+                wildcards)
+            group_by: Columns to group by
+            aggregates: 'function:column' with function count, mean, min,
+                max or sum ('count' alone counts rows); without group_by
+                they aggregate every matching row
+            columns: Columns of ungrouped rows (default: scenario, algorithm
+                and every metric)
+            order_by: Output label or column to sort by (default: group
+                columns, or insertion order)
+            descending: Sort descending
+            limit: Maximum rows
+
+        Returns:
+            (labels, rows)
+
+        Raises:
+            ValueError: For unknown columns, aggregates or operators
+        """
+        sql, args, labels = self.build_query(filters, group_by, aggregates, columns,
+                                             order_by, descending, limit)
+        return labels, self._conn.execute(sql, args).fetchall()
+
+    def explain(self, sql: str, args: Sequence[Any] = ()) -> List[str]:
+        """SQLite's query plan steps for a statement."""
+        return [row[-1] for row in self._conn.execute(f'EXPLAIN QUERY PLAN {sql}', list(args))]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> 'ResultsDB':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def export_csv(path: str, labels: List[str], rows: List[Tuple[Any, ...]]) -> None:
+    """Write query() output as a CSV (atomically, like the runner's exports)."""
+    def write(f) -> None:
+        writer = csv.writer(f)
+        writer.writerow(labels)
+        writer.writerows(rows)
+    write_atomic(path, write)
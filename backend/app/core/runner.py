@@ -7,13 +7,130 @@ Runs scheduling experiments across all scenarios and algorithms,
 collecting comprehensive metrics for analysis.
 """
 
+import contextlib
 import csv
-import copy
+import logging
+import math
 import os
-from typing import List, Dict, Any, Type, Optional
-from simple_simulator import Task, Priority, Scheduler
-from algorithms import get_all_algorithms
-from scenarios import get_all_scenarios
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import List, Dict, Any, Type, Optional, Tuple
+from .simulator import Task, Priority, Scheduler, fresh_tasks
+from .algorithms import get_all_algorithms
+from .scenarios import get_scenarios
+from .sketches import LatencyRecorder
+from .pareto import pareto_frontier
+from .config import Config
+from .store import ResultStore, experiment_key, open_journal, write_atomic
+from .results_db import ResultsDB
+from .progress import Progress, make_progress
+
+logger = logging.getLogger(__name__)
+
+# Tail-latency columns added to every result row: (column label, metric key)
+LATENCY_COLUMNS = [
+    ('Response Time', 'response_time'),
+    ('Waiting Time', 'waiting_time'),
+    ('Lateness', 'lateness'),
+]
+
+# Per-task schedule columns written next to the metrics CSV
+SCHEDULE_COLUMNS = [
+    'Scenario', 'Algorithm', 'Machines', 'Task ID', 'Priority', 'Arrival',
+    'Processing Time', 'Deadline', 'CPU', 'RAM', 'Machine', 'Start', 'Completion',
+]
+
+
+def safe_filename(name: str) -> str:
+    """Turn a scenario or algorithm name into a filesystem-friendly token."""
+    for old, new in (('(', ''), (')', ''), ('=', ''), (' ', '_'), (':', ''), ('/', '_')):
+        name = name.replace(old, new)
+    return name
+
+
+def schedules_path(results_path: str) -> str:
+    """Schedule CSV stored alongside a metrics CSV (results.csv → results_schedules.csv)."""
+    root, ext = os.path.splitext(results_path)
+    return f"{root}_schedules{ext or '.csv'}"
+
+
+def load_schedules(filename: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Read schedules written by ExperimentRunner.export_to_csv().
+
+    Args:
+        filename (str): Schedule CSV path
+
+    Returns:
+        dict: (scenario, algorithm) → {'num_machines': int, 'tasks': [Task, ...]}
+            with start/completion times and machine assignments restored
+    """
+    schedules: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    with open(filename, newline='') as f:
+        for row in csv.DictReader(f):
+            key = (row['Scenario'], row['Algorithm'])
+            if key not in schedules:
+                schedules[key] = {'num_machines': int(row['Machines']), 'tasks': []}
+            task = Task(
+                id=int(row['Task ID']),
+                arrival_time=float(row['Arrival']),
+                processing_time=float(row['Processing Time']),
+                priority=Priority[row['Priority']],
+                deadline=float(row['Deadline']),
+                cpu_required=int(row['CPU']),
+                ram_required=int(row['RAM']),
+            )
+            if row['Machine']:
+                task.machine_id = int(row['Machine'])
+            if row['Start']:
+                task.start_time = float(row['Start'])
+            if row['Completion']:
+                task.completion_time = float(row['Completion'])
+            schedules[key]['tasks'].append(task)
+    return schedules
+
+
+def load_results(filename: str) -> List[Dict[str, Any]]:
+    """
+    Read a results CSV written by ExperimentRunner.export_to_csv().
+
+    Args:
+        filename (str): Results CSV path
+
+    Returns:
+        list: One dict per experiment; numeric columns parsed as floats
+    """
+    def parse(value: str) -> Any:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+    with open(filename, newline='') as f:
+        return [
+            {key: value if key in ('Scenario', 'Algorithm') else parse(value)
+             for key, value in row.items()}
+            for row in csv.DictReader(f)
+        ]
+
+
+def sign_test(wins: int, losses: int) -> float:
+    """
+    Two-sided exact sign test: probability of a split at least this uneven
+    if either algorithm were equally likely to win each scenario.
+    """
+    n = wins + losses
+    if n == 0:
+        return 1.0
+    tail = sum(math.comb(n, i) for i in range(min(wins, losses) + 1)) / 2 ** n
+    return min(1.0, 2 * tail)
+
+
+def _simulate_job(job: Tuple[Dict[str, Any], str, Optional[str]]):
+    """Process-pool entry point for ExperimentRunner.run_experiments()."""
+    scenario, algorithm_name, trace_dir = job
+    return ExperimentRunner(trace_dir=trace_dir).simulate(
+        scenario, algorithm_name, get_all_algorithms()[algorithm_name])
 
 
 class ExperimentRunner:
@@ -23,13 +140,34 @@ class ExperimentRunner:
     Responsibilities:
     - Execute experiments with different algorithms on scenarios
     - Calculate comprehensive metrics (success rates, makespan, response time, etc.)
-    - Export results to CSV for analysis
+    - Export results to CSV for analysis, with the per-task schedules
+      alongside so charts can be drawn without re-simulating
     - Generate comparison tables
+    - Optionally persist a binary schedule trace per experiment
+    - Optionally journal every finished experiment (see store.py) so an
+      interrupted batch resumes instead of starting over
+    - Report progress per experiment (see progress.py)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, trace_dir: Optional[str] = None,
+                 store: Optional[ResultStore] = None,
+                 progress: Optional[Progress] = None) -> None:
+        """
+        Args:
+            trace_dir (str): If set, write a binary trace (see trace.py) for
+                every experiment into this directory
+            store (ResultStore): If set, every recorded experiment is
+                appended to it, and run_experiments() reuses the experiments
+                it already holds
+            progress (Progress): Reporter of finished experiments (default:
+                silent)
+        """
         self.results: List[Dict[str, Any]] = []
-        self.best_makespan_per_scenario: Dict[str, float] = {}  # Track best makespan for normalization
+        self.trace_dir = trace_dir
+        self.store = store
+        self.progress = progress or Progress()
+        # Schedule rows per (scenario, algorithm); a repeated run replaces the earlier one
+        self.schedules: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
 
     def run_experiment(self, scenario: Dict[str, Any], algorithm_name: str,
                       SchedulerClass: Type[Scheduler], **kwargs: Any) -> Dict[str, Any]:
@@ -45,33 +183,135 @@ class ExperimentRunner:
         Returns:
             dict: Metrics dictionary with all performance measurements
         """
-        print(f"\n🔬 Running: {algorithm_name} on {scenario['name']}")
+        outcome = self.simulate(scenario, algorithm_name, SchedulerClass, **kwargs)
+        metrics = self.record(scenario, algorithm_name, *outcome)
+        self.progress.step(f"{algorithm_name} on {scenario['name']}", metrics)
+        return metrics
 
-        # Create fresh task copies to avoid state pollution
-        tasks = copy.deepcopy(scenario['tasks'])
+    def simulate(self, scenario: Dict[str, Any], algorithm_name: str,
+                 SchedulerClass: Type[Scheduler], **kwargs: Any
+                 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Run one experiment without recording it (see run_experiment()).
+
+        Returns:
+            tuple: (metrics, schedule rows)
+        """
+        # Fresh run records; the scenario's tasks are only read
+        tasks = fresh_tasks(scenario['tasks'])
 
         # Run scheduler
         scheduler = SchedulerClass(tasks, scenario['num_machines'], **kwargs)
-        scheduler.run()
+        scheduler.record_logs = False  # Metrics come from the tasks and listeners
+        latency = scheduler.attach(LatencyRecorder())
+        trace = contextlib.nullcontext()
+        if self.trace_dir:
+            from .trace import TraceWriter
+            trace_path = os.path.join(
+                self.trace_dir,
+                f"{safe_filename(scenario['name'])}_{safe_filename(algorithm_name)}.trace"
+            )
+            trace = scheduler.attach(TraceWriter(trace_path, metadata={
+                'scenario': scenario['name'],
+                'algorithm': algorithm_name,
+            }))
+        with trace:  # A failed run leaves no partial trace
+            scheduler.run()
 
         # Calculate metrics
         metrics = self.calculate_metrics(
             tasks,
             scenario['name'],
             algorithm_name,
-            scheduler.current_time
+            scheduler.current_time,
+            latency
         )
+        return metrics, self.schedule_rows(tasks, scenario, algorithm_name)
+
+    def record(self, scenario: Dict[str, Any], algorithm_name: str, metrics: Dict[str, Any],
+               schedule: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Store the outcome of simulate() (possibly run in another process)."""
+        self.schedules[(scenario['name'], algorithm_name)] = schedule
 
         # Store results
         self.results.append(metrics)
+        if self.store is not None:
+            self.store.append(experiment_key(scenario, algorithm_name), metrics, schedule)
 
-        # Print summary
-        self.print_summary(metrics)
+        return metrics
 
+    def restore(self, scenario: Dict[str, Any], algorithm_name: str,
+                record: Dict[str, Any]) -> Dict[str, Any]:
+        """Add an experiment recorded in the store by an earlier run."""
+        metrics = dict(record['metrics'])
+        self.schedules[(scenario['name'], algorithm_name)] = record['schedule']
+        self.results.append(metrics)
         return metrics
 
+    def run_experiments(self, scenarios: List[Dict[str, Any]], algorithm_names: List[str],
+                        workers: int = 1) -> None:
+        """
+        Run every algorithm on every scenario.
+
+        Results are recorded in scenario-major order whatever the worker
+        count, so exports are identical to a serial run. With a store,
+        experiments it already holds are restored instead of simulated.
+
+        Args:
+            scenarios (list): Scenario definitions
+            algorithm_names (list): Names in the algorithm registry
+            workers (int): Processes to simulate in (1 = this process)
+
+        Raises:
+            KeyError: For an unknown algorithm name
+        """
+        registry = get_all_algorithms()
+        for name in algorithm_names:
+            if name not in registry:
+                raise KeyError(name)
+        jobs = [(scenario, name, self.trace_dir) for scenario in scenarios for name in algorithm_names]
+        if self.store is not None:
+            stored = [self.store.get(experiment_key(scenario, name)) for scenario, name, _ in jobs]
+        else:
+            stored = [None] * len(jobs)
+        pending = [job for job, record in zip(jobs, stored) if record is None]
+        if len(pending) < len(jobs):
+            logger.info(f"\n⏭️  {len(jobs) - len(pending)} of {len(jobs)} experiments already "
+                        f"recorded in {self.store.path}; running the other {len(pending)}")
+
+        def record_all(outcomes) -> None:
+            # Progress is reported here, in this process, as outcomes arrive
+            outcomes = iter(outcomes)
+            current = None
+            for (scenario, name, _), record in zip(jobs, stored):
+                if scenario['name'] != current:
+                    current = scenario['name']
+                    self.progress.section(f"SCENARIO: {scenario['name']}", [
+                        f"Description: {scenario.get('description', '')}",
+                        f"Tasks: {len(scenario['tasks'])}, Machines: {scenario['num_machines']}",
+                    ])
+                label = f"{name} on {scenario['name']}"
+                if record is not None:
+                    self.progress.step(label, self.restore(scenario, name, record), skipped=True)
+                else:
+                    self.progress.step(label, self.record(scenario, name, *next(outcomes)))
+
+        self.progress.start(len(jobs))
+        try:
+            if workers <= 1 or len(pending) <= 1:
+                record_all(self.simulate(scenario, name, registry[name])
+                           for scenario, name, _ in pending)
+                return
+            # Registry entries include lambdas, so workers look algorithms up by name
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+                record_all(pool.map(_simulate_job, pending,
+                                    chunksize=max(1, len(pending) // (workers * 4))))
+        finally:
+            self.progress.finish()
+
     def calculate_metrics(self, tasks: List[Task], scenario_name: str,
-                         algorithm_name: str, sim_time: float) -> Dict[str, Any]:
+                         algorithm_name: str, sim_time: float,
+                         latency: Optional[LatencyRecorder] = None) -> Dict[str, Any]:
         """
         Calculate comprehensive performance metrics.
 
@@ -80,12 +320,16 @@ class ExperimentRunner:
         - Makespan (total completion time)
         - Average response time (completion - arrival)
         - Average waiting time (start - arrival)
+        - p95/p99 response time, waiting time and lateness, overall and
+          per priority class (from streaming sketches)
 
         Args:
             tasks (list): List of Task objects after simulation
             scenario_name (str): Name of scenario
             algorithm_name (str): Name of algorithm
             sim_time (float): Final simulation time
+            latency (LatencyRecorder): Sketches recorded during the run;
+                built from the finished tasks if omitted
 
         Returns:
             dict: Complete metrics dictionary
@@ -117,18 +361,10 @@ class ExperimentRunner:
         low_success_rate = (low_met / len(low_priority) * 100) if low_priority else 0
         total_success_rate = (total_met / total_tasks * 100) if total_tasks else 0
 
-        # Track best makespan for this scenario (for later normalization)
-        if scenario_name not in self.best_makespan_per_scenario:
-            self.best_makespan_per_scenario[scenario_name] = makespan
-        else:
-            self.best_makespan_per_scenario[scenario_name] = min(
-                self.best_makespan_per_scenario[scenario_name], makespan
-            )
-
         # Placeholder for composite score (will be calculated after all experiments)
         composite_score = 0.0
 
-        return {
+        metrics = {
             'Scenario': scenario_name,
             'Algorithm': algorithm_name,
             'Total Tasks': total_tasks,
@@ -147,6 +383,61 @@ class ExperimentRunner:
             'Simulation Time': round(sim_time, 2)
         }
 
+        if latency is None:
+            latency = LatencyRecorder()
+            for t in tasks:
+                if t.start_time is not None:
+                    latency.on_event('START', t.start_time, t)
+                if t.completion_time is not None:
+                    latency.on_event('COMPLETION', t.completion_time, t)
+        metrics.update(self.latency_columns(latency))
+
+        return metrics
+
+    @staticmethod
+    def latency_columns(latency: LatencyRecorder) -> Dict[str, float]:
+        """
+        Flatten latency sketches into result-row columns.
+
+        Produces 'P95 <metric>' and 'P99 <metric>' over all tasks plus
+        'High P99 <metric>' and 'Low P99 <metric>' per priority class.
+        Empty classes report 0.
+        """
+        def rounded(value: Optional[float]) -> float:
+            return round(float(value), 2) if value is not None else 0.0
+
+        columns = {}
+        for label, metric in LATENCY_COLUMNS:
+            combined = latency.combined(metric)
+            columns[f'P95 {label}'] = rounded(combined.quantile(0.95))
+            columns[f'P99 {label}'] = rounded(combined.quantile(0.99))
+            columns[f'High P99 {label}'] = rounded(latency.quantile(metric, 0.99, 'HIGH'))
+            columns[f'Low P99 {label}'] = rounded(latency.quantile(metric, 0.99, 'LOW'))
+        return columns
+
+    @staticmethod
+    def schedule_rows(tasks: List[Task], scenario: Dict[str, Any],
+                      algorithm_name: str) -> List[Dict[str, Any]]:
+        """One SCHEDULE_COLUMNS row per task; unscheduled fields are left blank."""
+        def blank(value: Any) -> Any:
+            return '' if value is None else value
+
+        return [{
+            'Scenario': scenario['name'],
+            'Algorithm': algorithm_name,
+            'Machines': scenario['num_machines'],
+            'Task ID': t.id,
+            'Priority': t.priority.name,
+            'Arrival': t.arrival_time,
+            'Processing Time': t.processing_time,
+            'Deadline': t.deadline,
+            'CPU': t.cpu_required,
+            'RAM': t.ram_required,
+            'Machine': blank(t.machine_id),
+            'Start': blank(t.start_time),
+            'Completion': blank(t.completion_time),
+        } for t in tasks]
+
     def calculate_composite_scores(self) -> None:
         """
         Calculate composite performance scores after all experiments.
@@ -158,10 +449,19 @@ class ExperimentRunner:
 
         This approach (F-score) penalizes imbalanced performance and ensures
         algorithms cannot achieve high scores by excelling at just one metric.
+
+        Best makespans are taken from the result rows themselves, so scores
+        come out the same whether rows were simulated or restored.
         """
+        best_makespans: Dict[str, float] = {}
+        for result in self.results:
+            scenario = result['Scenario']
+            best_makespans[scenario] = min(best_makespans.get(scenario, result['Makespan']),
+                                           result['Makespan'])
+
         for result in self.results:
             scenario = result['Scenario']
-            best_makespan = self.best_makespan_per_scenario[scenario]
+            best_makespan = best_makespans[scenario]
             current_makespan = result['Makespan']
 
             # Normalize makespan to efficiency percentage (higher is better)
@@ -181,35 +481,80 @@ class ExperimentRunner:
 
             result['Composite Performance Score (%)'] = round(composite_score, 2)
 
-    def print_summary(self, metrics: Dict[str, Any]) -> None:
-        """Print concise metrics summary."""
-        print(f"  ✓ Success Rate: {metrics['Total Success Rate (%)']:.1f}%")
-        print(f"  ✓ High Priority: {metrics['High Success Rate (%)']:.1f}%")
-        print(f"  ✓ Low Priority: {metrics['Low Success Rate (%)']:.1f}%")
-        print(f"  ⏱ Makespan: {metrics['Makespan']:.1f}")
-
-    def export_to_csv(self, filename: str = 'results/experiment_results.csv') -> None:
+    def export_to_csv(self, filename: str = 'results/experiment_results.csv',
+                      schedules: bool = True) -> None:
         """
         Export all results to CSV.
 
         Args:
             filename (str): Output CSV path (default: results/experiment_results.csv)
+            schedules (bool): Also write every run's per-task schedule to
+                schedules_path(filename)
         """
         if not self.results:
-            print("No results to export!")
+            logger.warning("No results to export!")
             return
 
-        # Ensure results directory exists
-        os.makedirs('results', exist_ok=True)
-
         keys = self.results[0].keys()
 
-        with open(filename, 'w', newline='') as f:
+        def write(f) -> None:
             writer = csv.DictWriter(f, fieldnames=keys)
             writer.writeheader()
             writer.writerows(self.results)
 
-        print(f"\n📊 Results exported to: {filename}")
+        # Written to a temporary file and renamed, so readers never see half a CSV
+        write_atomic(filename, write)
+
+        logger.info(f"\n📊 Results exported to: {filename}")
+
+        if schedules and self.schedules:
+            self.export_schedules_to_csv(schedules_path(filename))
+
+    def export_to_db(self, path: str, source: str) -> None:
+        """
+        Store all results in the SQLite results database, in batches.
+
+        Args:
+            path (str): Database file
+            source (str): Results file the rows belong to; its earlier rows
+                in the database are replaced
+        """
+        if not self.results:
+            return
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with ResultsDB(path) as db:
+            count = db.add_results(source, self.results)
+        logger.info(f"🗄  {count} results stored in: {path}")
+
+    def export_schedules_to_csv(self, filename: str) -> None:
+        """
+        Export the per-task schedule of every run (see load_schedules()).
+
+        Args:
+            filename (str): Output CSV path
+        """
+        def write(f) -> None:
+            writer = csv.DictWriter(f, fieldnames=SCHEDULE_COLUMNS)
+            writer.writeheader()
+            for rows in self.schedules.values():
+                writer.writerows(rows)
+
+        write_atomic(filename, write)
+
+        logger.info(f"📅 Schedules exported to: {filename}")
+
+    def pareto_frontier(self, objectives: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Results no other result beats on every objective.
+
+        Args:
+            objectives (dict): Column → 'max' or 'min'
+                (default: pareto.DEFAULT_OBJECTIVES)
+
+        Returns:
+            list: Non-dominated result rows, in run order
+        """
+        return pareto_frontier(self.results, objectives)
 
     def compare_algorithms(self) -> None:
         """Print formatted comparison table across all scenarios."""
@@ -242,72 +587,139 @@ class ExperimentRunner:
                       f"{r['Low Success Rate (%)']:<10.1f} | "
                       f"{r['Makespan']:<10.1f}")
 
+    def paired_comparisons(self, metric: str = 'Total Success Rate (%)',
+                           higher_is_better: bool = True) -> List[Dict[str, Any]]:
+        """
+        Compare every pair of algorithms scenario by scenario with a sign test.
+
+        Args:
+            metric (str): Result column to compare
+            higher_is_better (bool): Direction of the metric
 
-def run_all_experiments() -> None:
+        Returns:
+            list: One dict per pair (algorithm_a, algorithm_b, wins, losses,
+                ties, p_value), wins counted for algorithm_a
+        """
+        values: Dict[str, Dict[str, float]] = {}
+        for result in self.results:
+            values.setdefault(result['Algorithm'], {})[result['Scenario']] = result[metric]
+
+        comparisons = []
+        for a, b in combinations(values, 2):
+            shared = values[a].keys() & values[b].keys()
+            diffs = [values[a][s] - values[b][s] for s in shared]
+            if not higher_is_better:
+                diffs = [-d for d in diffs]
+            wins = sum(1 for d in diffs if d > 0)
+            losses = sum(1 for d in diffs if d < 0)
+            comparisons.append({
+                'algorithm_a': a,
+                'algorithm_b': b,
+                'wins': wins,
+                'losses': losses,
+                'ties': len(diffs) - wins - losses,
+                'p_value': sign_test(wins, losses),
+            })
+        return comparisons
+
+    def print_paired_comparisons(self, metric: str = 'Total Success Rate (%)',
+                                 alpha: float = 0.05) -> None:
+        """Print paired sign tests across scenarios (see paired_comparisons())."""
+        comparisons = self.paired_comparisons(metric)
+        if not comparisons:
+            print("No algorithm pairs to compare!")
+            return
+
+        print("\n" + "=" * 100)
+        print(f"PAIRED SIGN TESTS ({metric}, per scenario)")
+        print("=" * 100)
+        print(f"{'Algorithm A':<20} | {'Algorithm B':<20} | {'A wins':>6} | {'B wins':>6} | "
+              f"{'Ties':>4} | {'p-value':>8}")
+        print("-" * 100)
+        for c in comparisons:
+            marker = ' *' if c['p_value'] < alpha else ''
+            print(f"{c['algorithm_a']:<20} | {c['algorithm_b']:<20} | {c['wins']:>6} | "
+                  f"{c['losses']:>6} | {c['ties']:>4} | {c['p_value']:>8.4f}{marker}")
+        print(f"\n* significant at {alpha} (two-sided exact sign test; ties dropped)")
+
+
+def run_all_experiments(trace_dir: Optional[str] = None, config: Optional[Config] = None,
+                        resume: bool = True, progress: Optional[Progress] = None) -> str:
     """
     Run complete experimental suite.
 
-    Executes all 24 scenarios across all 7 algorithms (168 total experiments).
+    Executes the configured scenarios across the configured algorithms (by
+    default all 24 scenarios × 7 algorithms), in parallel worker processes.
     Collects metrics, generates comparison table, and exports to CSV.
-    """
-
-    runner = ExperimentRunner()
 
-    # Get all scenarios
-    all_scenarios = get_all_scenarios()
+    Every finished experiment is journaled next to the results CSV (see
+    store.journal_path()) as it completes; a rerun after an interruption
+    skips the experiments already journaled.
 
-    # Get all algorithms
-    algorithms_dict = get_all_algorithms()
-    algorithms = [
-        ('SPT', algorithms_dict['SPT'], {}),
-        ('EDF', algorithms_dict['EDF'], {}),
-        ('Priority-First', algorithms_dict['Priority-First'], {}),
-        ('DPE (α=0.3)', algorithms_dict['DPE (α=0.3)'], {}),
-        ('DPE (α=0.5)', algorithms_dict['DPE (α=0.5)'], {}),
-        ('DPE (α=0.7)', algorithms_dict['DPE (α=0.7)'], {}),
-        ('DPE (α=0.9)', algorithms_dict['DPE (α=0.9)'], {}),
-    ]
+    Args:
+        trace_dir (str): Optional directory for per-experiment binary traces
+        config (Config): Run configuration (default: built-in defaults)
+        resume (bool): Reuse journaled experiments (False discards the journal)
+        progress (Progress): Reporter (default: config's logging.progress)
 
-    print("╔" + "=" * 78 + "╗")
-    print("║" + " " * 15 + "RUNNING COMPREHENSIVE EXPERIMENTS" + " " * 30 + "║")
-    print("║" + f"  Total Scenarios: {len(all_scenarios)} | Algorithms: {len(algorithms)}" + " " * 24 + "║")
-    print("╚" + "=" * 78 + "╝")
+    Returns:
+        str: Path of the results CSV
+    """
+    config = config or Config()
+    results_path = config.experiment.results_path
+    store = open_journal(results_path, resume)
+    runner = ExperimentRunner(trace_dir=trace_dir, store=store,
+                              progress=progress or make_progress(config.logging.progress))
+
+    all_scenarios = get_scenarios(list(config.scenarios))
+    algorithms = list(config.algorithms)
+    workers = config.experiment.workers
+
+    logger.info("╔" + "=" * 78 + "╗")
+    logger.info("║" + " " * 15 + "RUNNING COMPREHENSIVE EXPERIMENTS" + " " * 30 + "║")
+    logger.info("║" + f"  Total Scenarios: {len(all_scenarios)} | Algorithms: {len(algorithms)}"
+                f" | Workers: {workers}".ljust(78) + "║")
+    logger.info("╚" + "=" * 78 + "╝")
 
     # Run experiments
-    for scenario in all_scenarios:
-        print(f"\n\n{'=' * 80}")
-        print(f"SCENARIO: {scenario['name']}")
-        print(f"Description: {scenario['description']}")
-        print(f"Tasks: {len(scenario['tasks'])}, Machines: {scenario['num_machines']}")
-        print('=' * 80)
-
-        for algo_name, SchedulerClass, kwargs in algorithms:
-            runner.run_experiment(scenario, algo_name, SchedulerClass, **kwargs)
+    with store:
+        runner.run_experiments(all_scenarios, algorithms, workers=workers)
 
     # Calculate composite performance scores (requires all experiments to be complete)
-    print("\n" + "=" * 80)
-    print("Calculating composite performance scores...")
-    print("=" * 80)
-    runner.calculate_composite_scores()
+    if config.analysis.composite_scores:
+        logger.info("\n" + "=" * 80)
+        logger.info("Calculating composite performance scores...")
+        logger.info("=" * 80)
+        runner.calculate_composite_scores()
 
     # Print comparison
-    runner.compare_algorithms()
+    if config.analysis.comparison_tables:
+        runner.compare_algorithms()
+    if config.analysis.statistical_tests:
+        runner.print_paired_comparisons()
 
     # Export results
-    runner.export_to_csv('results/comprehensive_results.csv')
-
-    print("\n" + "=" * 80)
-    print("✅ ALL EXPERIMENTS COMPLETE!")
-    print("=" * 80)
-    print(f"\nTotal scenarios tested: {len(all_scenarios)}")
-    print(f"Total experiments run: {len(all_scenarios) * len(algorithms)}")
-    print("\nResults saved to: results/comprehensive_results.csv")
-    print("\nNext steps:")
-    print("1. Open results/comprehensive_results.csv in Excel/Google Sheets")
-    print("2. Run visualizer.py to generate charts")
-    print("3. Analyze algorithm performance across scenarios")
-    print("=" * 80)
+    runner.export_to_csv(results_path)
+    if config.experiment.database_path:
+        runner.export_to_db(config.experiment.database_path, results_path)
+
+    logger.info("\n" + "=" * 80)
+    logger.info("✅ ALL EXPERIMENTS COMPLETE!")
+    logger.info("=" * 80)
+    logger.info(f"\nTotal scenarios tested: {len(all_scenarios)}")
+    logger.info(f"Total experiments run: {len(all_scenarios) * len(algorithms)}")
+    logger.info(f"\nResults saved to: {results_path}")
+    logger.info(f"Schedules saved to: {schedules_path(results_path)}")
+    if config.experiment.database_path:
+        logger.info(f"Database: {config.experiment.database_path} (pyschedule_cli.py query)")
+    logger.info("\nNext steps:")
+    logger.info(f"1. Open {results_path} in Excel/Google Sheets")
+    logger.info("2. Run `pyschedule_cli.py visualize` to generate charts")
+    logger.info("3. Analyze algorithm performance across scenarios")
+    logger.info("=" * 80)
+    return results_path
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     run_all_experiments()
@@ -14,7 +14,10 @@ Author: PySchedule Development Team
 Date: 2024
 """
 
-from typing import Dict, List, Any
+import csv
+import json
+import os
+from typing import Dict, List, Any, Optional
 from .simulator import Task, Priority
 
 
@@ -725,6 +728,89 @@ def get_new_experiments():
     return scenarios
 
 
+# Scenario categories (config.yaml 'scenarios' keys), in get_all_scenarios() order
+SCENARIO_CATEGORIES = {
+    'simple': get_simple_scenarios,
+    'challenge': get_challenge_scenarios,
+    'extreme': get_extreme_scenarios,
+    'advanced': get_advanced_scenarios,
+    'new': get_new_experiments,
+    'cloud': get_cloud_scenarios,
+}
+
+
+def get_scenarios(categories: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Scenarios of the given categories (all of them if None).
+
+    Raises:
+        KeyError: For an unknown category
+    """
+    if categories is None:
+        return get_all_scenarios()
+    unknown = [c for c in categories if c not in SCENARIO_CATEGORIES]
+    if unknown:
+        raise KeyError(unknown[0])
+    return [scenario for name, build in SCENARIO_CATEGORIES.items()
+            if name in categories for scenario in build()]
+
+
+def load_workload(path: str, num_machines: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Load a custom workload as a scenario dictionary.
+
+    Accepts JSON (a list of tasks, or {"num_machines": n, "tasks": [...]})
+    or CSV with a header row. Task fields match the API's TaskInput: id,
+    arrival_time, processing_time, priority ('HIGH'/'LOW'), deadline and
+    optional cpu_required / ram_required.
+
+    Args:
+        path: .json or .csv file
+        num_machines: Machine count (overrides the file's; default 1)
+
+    Returns:
+        Scenario dictionary like get_all_scenarios() entries
+
+    Raises:
+        ValueError: For a malformed file or task
+    """
+    if path.lower().endswith('.json'):
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            if not isinstance(data.get('tasks'), list):
+                raise ValueError("workload JSON object has no 'tasks' list")
+            rows, file_machines = data['tasks'], data.get('num_machines')
+        else:
+            rows, file_machines = data, None
+    else:
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        file_machines = None
+
+    tasks = []
+    try:
+        for row in rows:
+            tasks.append(Task(
+                id=int(row['id']),
+                arrival_time=float(row['arrival_time']),
+                processing_time=float(row['processing_time']),
+                priority=Priority[str(row['priority']).strip().upper()],
+                deadline=float(row['deadline']),
+                cpu_required=int(row.get('cpu_required') or 1),
+                ram_required=int(row.get('ram_required') or 1),
+            ))
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid task in {path}: {e}") from e
+
+    return {
+        'name': os.path.splitext(os.path.basename(path))[0],
+        'description': f'Workload loaded from {path}',
+        'tasks': tasks,
+        'num_machines': int(num_machines or file_machines or 1),
+    }
+
+
 if __name__ == "__main__":
     """Test scenario creation"""
     scenarios = get_new_experiments()
@@ -6,11 +6,10 @@ A minimal discrete-event simulation engine for evaluating scheduling algorithms
 with priorities and deadlines. Designed for clarity and extensibility.
 """
 
-import copy
 import heapq
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence, Union
 
 
 class Priority(Enum):
@@ -18,11 +17,41 @@ class Priority(Enum):
     LOW = 2
 
 
+@dataclass(frozen=True)
+class TaskSpec:
+    """
+    Immutable task definition, safe to share between runs.
+
+    A Scheduler given TaskSpecs schedules fresh Task records made from
+    them, so one list of specs can back any number of runs.
+
+    Attributes:
+        id, arrival_time, processing_time, priority, deadline,
+        cpu_required, ram_required: As on Task
+    """
+    id: int
+    arrival_time: float
+    processing_time: float
+    priority: Priority
+    deadline: float
+    cpu_required: int = 1
+    ram_required: int = 1
+
+    def fresh(self) -> 'Task':
+        """New unscheduled Task with this definition."""
+        return Task(self.id, self.arrival_time, self.processing_time, self.priority,
+                    self.deadline, self.cpu_required, self.ram_required)
+
+
 @dataclass
 class Task:
     """
     Task definition with scheduling state.
 
+    A Task is the record of one run: the scheduler fills in its start,
+    completion and machine. Use fresh_tasks() (not copy.deepcopy) to run
+    the same tasks again.
+
     Attributes:
         id: Unique task identifier
         arrival_time: Time when task becomes available
@@ -48,6 +77,16 @@ class Task:
     completion_time: Optional[float] = None
     machine_id: Optional[int] = None
 
+    @property
+    def spec(self) -> TaskSpec:
+        """The immutable definition of this task."""
+        return TaskSpec(self.id, self.arrival_time, self.processing_time, self.priority,
+                        self.deadline, self.cpu_required, self.ram_required)
+
+    def fresh(self) -> 'Task':
+        """New unscheduled Task with the same definition (no run state)."""
+        return self.spec.fresh()
+
     def meets_deadline(self) -> bool:
         """
         Check if task completed before deadline.
@@ -86,6 +125,16 @@ class Task:
         return time_elapsed / time_available
 
 
+def fresh_tasks(tasks: Sequence[Union[Task, TaskSpec]]) -> List[Task]:
+    """
+    Unscheduled Task records for one run of a task list.
+
+    Only the definitions are read, so scenario lists (Tasks or TaskSpecs)
+    can be shared across runs without deep copies.
+    """
+    return [task.fresh() for task in tasks]
+
+
 @dataclass
 class Machine:
     """
@@ -143,21 +192,70 @@ class Event:
         return self.time < other.time
 
 
+class SimulationListener:
+    """
+    Observer notified by the Scheduler as the simulation progresses.
+
+    Listeners are attached with Scheduler.attach() and let trace writers and
+    online metrics follow the run without a second pass over the schedule.
+    Both hooks are no-ops by default; override the ones you need.
+
+    Listeners that set result_key have their to_dict() output included in
+    Scheduler.get_results() under that key. Listeners that set trace_table
+    and provide to_array() are stored as an extra table by an attached
+    TraceWriter (see trace.py). on_finish() is called in ascending
+    finish_order, so listeners that persist other listeners' output run last.
+    """
+
+    result_key: Optional[str] = None
+    trace_table: Optional[str] = None
+    finish_order: int = 0
+
+    def on_event(self, event_type: str, time: float, task: Task,
+                 machine: Optional[Machine] = None) -> None:
+        """
+        Handle a single simulation event.
+
+        Args:
+            event_type: 'ARRIVAL', 'START' or 'COMPLETION'
+            time: Simulation time of the event
+            task: Task the event refers to
+            machine: Machine involved (None for arrivals)
+        """
+
+    def on_finish(self, scheduler: 'Scheduler') -> None:
+        """Called once after the event loop has drained."""
+
+    def to_dict(self) -> Dict:
+        """Summary exported by get_results() when result_key is set."""
+        return {}
+
+
 class Scheduler:
     """
     Base discrete-event simulator for scheduling algorithms.
 
     Attributes:
-        all_tasks: Complete list of tasks to schedule
+        all_tasks: Complete list of tasks to schedule (TaskSpecs given to
+            the constructor are replaced by fresh Tasks)
         num_machines: Number of parallel machines
         machines: List of Machine instances
         event_queue: Priority queue of events
         ready_queue: Queue of ready-to-schedule tasks
         current_time: Current simulation time
         completed_tasks: List of completed tasks
+        listeners: Observers notified of every ARRIVAL, START and COMPLETION
+        record_logs: Build the per-event log returned by run(); set to False
+            on an instance when only the final schedule is needed (saves a
+            dict and a formatted message per event)
     """
 
-    def __init__(self, tasks: List[Task], num_machines: int):
+    record_logs: bool = True
+
+    def __init__(self, tasks: List[Union[Task, TaskSpec]], num_machines: int):
+        # Specs are shared definitions; the run schedules its own Task records
+        if any(isinstance(t, TaskSpec) for t in tasks):
+            tasks = [t.fresh() if isinstance(t, TaskSpec) else t for t in tasks]
         self.all_tasks = tasks
         self.num_machines = num_machines
         # Create heterogeneous machines for variety if num_machines > 1
@@ -175,6 +273,26 @@ class Scheduler:
         self.ready_queue: List[Task] = []
         self.current_time = 0.0
         self.completed_tasks: List[Task] = []
+        self.listeners: List[SimulationListener] = []
+
+    def attach(self, listener: SimulationListener) -> SimulationListener:
+        """
+        Register a listener to be notified of simulation events.
+
+        Args:
+            listener: SimulationListener instance
+
+        Returns:
+            The listener, for chaining
+        """
+        self.listeners.append(listener)
+        return listener
+
+    def _notify(self, event_type: str, task: Task,
+                machine: Optional[Machine] = None) -> None:
+        """Forward an event at the current time to all attached listeners."""
+        for listener in self.listeners:
+            listener.on_event(event_type, self.current_time, task, machine)
 
     def initialize(self) -> None:
         """Setup initial arrival events for all tasks."""
@@ -209,47 +327,85 @@ class Scheduler:
         """
         self.initialize()
         logs = []
+        record_logs = self.record_logs
 
         while self.event_queue or self.ready_queue:
             # Process ALL events at the current time before scheduling
             if self.event_queue:
-                event = heapq.heappop(self.event_queue)
-                self.current_time = event.time
-
-                # Collect all events at this time
-                events_at_current_time = [event]
-                while self.event_queue and self.event_queue[0].time == self.current_time:
-                    events_at_current_time.append(heapq.heappop(self.event_queue))
+                events_at_current_time = self._pop_events()
 
                 # Process all arrivals first, then completions
                 for evt in sorted(events_at_current_time, key=lambda e: (e.type != 'ARRIVAL', e.type)):
                     if evt.type == 'ARRIVAL':
-                        self.ready_queue.append(evt.task)
-                        logs.append({
-                            "time": self.current_time,
-                            "event": "ARRIVAL",
-                            "task_id": evt.task.id,
-                            "message": f"Task {evt.task.id} arrives (Needs {evt.task.cpu_required}CPU, {evt.task.ram_required}GB)"
-                        })
-
+                        self._handle_arrival(evt)
                     elif evt.type == 'COMPLETION':
-                        evt.machine.available_at = self.current_time
-                        evt.task.completion_time = self.current_time
-                        self.completed_tasks.append(evt.task)
-                        logs.append({
-                            "time": self.current_time,
-                            "event": "COMPLETION",
-                            "task_id": evt.task.id,
-                            "machine_id": evt.machine.id,
-                            "message": f"Task {evt.task.id} completes on Machine {evt.machine.id}"
-                        })
+                        self._handle_completion(evt)
+                    if record_logs:
+                        logs.append(self._log_entry(evt.type, evt.task, evt.machine))
 
             # Try to schedule ready tasks on idle machines
             new_logs = self.schedule_ready_tasks()
             logs.extend(new_logs)
-            
+
+        for listener in sorted(self.listeners, key=lambda l: l.finish_order):
+            listener.on_finish(self)
+
         return logs
 
+    def _pop_events(self) -> List[Event]:
+        """Pop every event at the earliest pending time and advance the clock to it."""
+        event = heapq.heappop(self.event_queue)
+        self.current_time = event.time
+        events = [event]
+        while self.event_queue and self.event_queue[0].time == self.current_time:
+            events.append(heapq.heappop(self.event_queue))
+        return events
+
+    def _handle_arrival(self, evt: Event) -> None:
+        """Make an arriving task ready."""
+        self.ready_queue.append(evt.task)
+        if self.listeners:
+            self._notify('ARRIVAL', evt.task)
+
+    def _handle_completion(self, evt: Event) -> None:
+        """Free the machine and record the task's completion."""
+        evt.machine.available_at = self.current_time
+        evt.task.completion_time = self.current_time
+        self.completed_tasks.append(evt.task)
+        if self.listeners:
+            self._notify('COMPLETION', evt.task, evt.machine)
+
+    def _log_entry(self, event_type: str, task: Task,
+                   machine: Optional[Machine] = None) -> Dict:
+        """Log record returned by run() for an ARRIVAL, START or COMPLETION."""
+        if event_type == 'ARRIVAL':
+            return {
+                "time": self.current_time,
+                "event": "ARRIVAL",
+                "task_id": task.id,
+                "message": f"Task {task.id} arrives (Needs {task.cpu_required}CPU, {task.ram_required}GB)"
+            }
+        if event_type == 'COMPLETION':
+            return {
+                "time": self.current_time,
+                "event": "COMPLETION",
+                "task_id": task.id,
+                "machine_id": machine.id,
+                "message": f"Task {task.id} completes on Machine {machine.id}"
+            }
+        return {
+            "time": self.current_time,
+            "event": "START",
+            "task_id": task.id,
+            "machine_id": machine.id,
+            "completion_time": task.start_time + task.processing_time,
+            "message": f"Task {task.id} starts on Machine {machine.id} (completes at {task.start_time + task.processing_time:.1f})"
+        }
+
+    def _compatible_tasks(self, machine: Machine) -> List[Task]:
+        """Ready tasks whose resource needs fit the machine."""
+        return [t for t in self.ready_queue if machine.can_fit(t)]
+
     def schedule_ready_tasks(self) -> List[Dict]:
         """Assign ready tasks to idle machines using selection strategy."""
         logs = []
@@ -269,7 +425,7 @@ class Scheduler:
                 break
                 
             # Filter ready tasks that fit on this machine
-            compatible_tasks = [t for t in self.ready_queue if machine.can_fit(t)]
+            compatible_tasks = self._compatible_tasks(machine)
             
             if not compatible_tasks:
                 continue # No tasks fit this machine
@@ -293,14 +449,10 @@ class Scheduler:
                           Event(completion_time, 'COMPLETION',
                                 selected_task, machine))
 
-            logs.append({
-                "time": self.current_time,
-                "event": "START",
-                "task_id": selected_task.id,
-                "machine_id": machine.id,
-                "completion_time": completion_time,
-                "message": f"Task {selected_task.id} starts on Machine {machine.id} (completes at {completion_time:.1f})"
-            })
+            if self.record_logs:
+                logs.append(self._log_entry('START', selected_task, machine))
+            if self.listeners:
+                self._notify('START', selected_task, machine)
             
         return logs
     
@@ -322,13 +474,14 @@ class Scheduler:
                 "arrival_time": task.arrival_time,
                 "start_time": task.start_time,
                 "completion_time": task.completion_time,
+                "machine_id": task.machine_id,
                 "deadline": task.deadline,
                 "meets_deadline": task.meets_deadline(),
                 "cpu_required": task.cpu_required,
                 "ram_required": task.ram_required
             })
 
-        return {
+        results = {
             "makespan": makespan,
             "total_tasks": len(self.all_tasks),
             "high_priority_stats": {
@@ -340,4 +493,11 @@ class Scheduler:
                 "met_deadline": low_met
             },
             "tasks": tasks_data
-        }
\ No newline at end of file
+        }
+
+        # Online summaries collected by listeners during the run
+        for listener in self.listeners:
+            if listener.result_key:
+                results[listener.result_key] = listener.to_dict()
+
+        return results
\ No newline at end of file
@@ -0,0 +1,249 @@
+"""
+Streaming Quantile Sketches
+===========================
+
+Constant-memory, mergeable estimates of tail latencies (p95/p99) updated as
+tasks complete, so SLO-style percentiles never require keeping every sample.
+
+QuantileSketch follows the DDSketch design (Masson et al., VLDB 2019):
+values are mapped to logarithmically spaced bins whose width guarantees a
+relative error of at most `relative_accuracy` on every quantile. Sketches
+with the same accuracy merge exactly by adding bin counts, which makes them
+suitable for combining replications and parallel workers. Negative values
+(e.g. lateness of tasks that finished early) use a mirrored bin store.
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Any
+
+from .simulator import SimulationListener, Task, Machine, Priority
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+LATENCY_METRICS = ('response_time', 'waiting_time', 'lateness')
+
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch with bounded memory.
+
+    Attributes:
+        relative_accuracy: Maximum relative error of quantile estimates
+        max_bins: Bin budget per sign; beyond it the bins closest to zero are
+            collapsed, preserving accuracy in the tails
+        count: Number of values added
+    """
+
+    # Magnitudes below this are counted as exact zeros
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value > self.MIN_INDEXABLE:
+            store = self._positive
+        elif value < -self.MIN_INDEXABLE:
+            store = self._negative
+        else:
+            self.zero_count += 1
+            return
+
+        key = self._key(abs(value))
+        store[key] = store.get(key, 0) + 1
+        if len(store) > self.max_bins:
+            self._collapse(store)
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add several observations."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Fold another sketch into this one.
+
+        Raises:
+            ValueError: If the sketches use different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for mine, theirs in ((self._positive, other._positive),
+                             (self._negative, other._negative)):
+            for key, n in theirs.items():
+                mine[key] = mine.get(key, 0) + n
+            if len(mine) > self.max_bins:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-quantile (0 <= q <= 1); None if the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Ascending value order: most negative first, then zeros, then positives
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Exact mean of the observations; None if empty."""
+        return self.sum / self.count if self.count else None
+
+    def summary(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """Count, mean, max and the requested quantiles as 'p50'-style keys."""
+        result: Dict[str, Optional[float]] = {
+            'count': self.count,
+            'mean': self.mean,
+            'max': self.max if self.count else None,
+        }
+        for q in quantiles:
+            result[f'p{q * 100:g}'] = self.quantile(q)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable state, e.g. for shipping sketches between processes."""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'max_bins': self.max_bins,
+            'positive': {str(k): n for k, n in self._positive.items()},
+            'negative': {str(k): n for k, n in self._negative.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'QuantileSketch':
+        """Rebuild a sketch from to_dict() output."""
+        sketch = cls(state['relative_accuracy'], state['max_bins'])
+        sketch._positive = {int(k): n for k, n in state['positive'].items()}
+        sketch._negative = {int(k): n for k, n in state['negative'].items()}
+        sketch.zero_count = state['zero_count']
+        sketch.count = state['count']
+        sketch.sum = state['sum']
+        if sketch.count:
+            sketch.min = state['min']
+            sketch.max = state['max']
+        return sketch
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # Midpoint (in relative terms) of the bin (gamma^(key-1), gamma^key]
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def _collapse(self, store: Dict[int, int]) -> None:
+        """Merge the bins nearest zero until the store fits the budget."""
+        keys = sorted(store)
+        excess = len(keys) - self.max_bins + 1
+        target = keys[excess]
+        store[target] += sum(store.pop(k) for k in keys[:excess])
+
+
+class LatencyRecorder(SimulationListener):
+    """
+    Listener keeping per-priority sketches of response time, waiting time
+    and lateness (completion - deadline; negative when early).
+
+    Waiting time is recorded when a task starts, response time and lateness
+    when it completes. Results appear under 'latency_percentiles' in
+    Scheduler.get_results(), with an extra 'ALL' class merging every priority.
+
+    Attributes:
+        sketches: {priority name: {metric: QuantileSketch}}
+    """
+
+    result_key = 'latency_percentiles'
+
+    def __init__(self, relative_accuracy: float = 0.01,
+                 quantiles: Iterable[float] = DEFAULT_QUANTILES) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.quantiles = tuple(quantiles)
+        self.sketches: Dict[str, Dict[str, QuantileSketch]] = {
+            p.name: {m: QuantileSketch(relative_accuracy) for m in LATENCY_METRICS}
+            for p in Priority
+        }
+
+    def on_event(self, event_type: str, time: float, task: Task,
+                 machine: Optional[Machine] = None) -> None:
+        if event_type == 'START':
+            self.sketches[task.priority.name]['waiting_time'].add(time - task.arrival_time)
+        elif event_type == 'COMPLETION':
+            sketches = self.sketches[task.priority.name]
+            sketches['response_time'].add(time - task.arrival_time)
+            sketches['lateness'].add(time - task.deadline)
+
+    def merge(self, other: 'LatencyRecorder') -> None:
+        """Fold another recorder's sketches into this one (e.g. replications)."""
+        for priority, metrics in other.sketches.items():
+            for metric, sketch in metrics.items():
+                self.sketches[priority][metric].merge(sketch)
+
+    def combined(self, metric: str) -> QuantileSketch:
+        """Sketch for a metric across all priority classes."""
+        merged = QuantileSketch(self.relative_accuracy)
+        for metrics in self.sketches.values():
+            merged.merge(metrics[metric])
+        return merged
+
+    def quantile(self, metric: str, q: float, priority: Optional[str] = None) -> Optional[float]:
+        """Quantile of a metric for one priority class (or all when None)."""
+        sketch = self.combined(metric) if priority is None else self.sketches[priority][metric]
+        return sketch.quantile(q)
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Summaries per priority class plus 'ALL'."""
+        result = {
+            priority: {m: s.summary(self.quantiles) for m, s in metrics.items()}
+            for priority, metrics in self.sketches.items()
+        }
+        result['ALL'] = {m: self.combined(m).summary(self.quantiles) for m in LATENCY_METRICS}
+        return result
@@ -0,0 +1,180 @@
+"""
+Durable Experiment Journal
+==========================
+
+Append-only record of finished experiments, so an interrupted run resumes
+where it stopped instead of starting over.
+
+Each experiment is one JSON line holding its key, result row and per-task
+schedule rows. A line is written with a single O_APPEND write and fsynced
+before the runner moves on, so a crash or preemption loses at most the
+experiments still in flight. A line torn by a crash mid-write is detected
+on open (no trailing newline, or invalid JSON) and cut off.
+
+Keys fingerprint the scenario's tasks and machine count together with the
+algorithm name, so editing a scenario invalidates its recorded experiments
+rather than silently reusing them.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from .manifest import fingerprint, task_signature
+
+logger = logging.getLogger(__name__)
+
+
+def journal_path(results_path: str) -> str:
+    """Journal stored alongside a metrics CSV (results.csv → results_journal.jsonl)."""
+    root, _ = os.path.splitext(results_path)
+    return f"{root}_journal.jsonl"
+
+
+def experiment_key(scenario: Dict[str, Any], algorithm_name: str) -> str:
+    """Identity of one experiment: scenario contents plus algorithm."""
+    return fingerprint(scenario['name'], scenario['num_machines'],
+                       task_signature(scenario['tasks']), algorithm_name)
+
+
+class ResultStore:
+    """
+    Journal of finished experiments (JSON lines).
+
+    Usage:
+        store = ResultStore('results/comprehensive_results_journal.jsonl')
+        if key not in store:
+            store.append(key, metrics, schedule)
+        store.close()
+
+    Attributes:
+        path: Journal file
+        repaired: Bytes of torn trailing data removed when the file was opened
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.repaired = 0
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._fd: Optional[int] = None
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        good = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            self._records[record['key']] = record
+            good += len(line)
+        if good < len(data):
+            # Torn write at the tail: drop it so new lines start cleanly
+            self.repaired = len(data) - good
+            with open(self.path, 'r+b') as f:
+                f.truncate(good)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Record for a key: {'key', 'metrics', 'schedule'}, or None."""
+        return self._records.get(key)
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Records in the order they were first written."""
+        return iter(self._records.values())
+
+    def append(self, key: str, metrics: Dict[str, Any],
+               schedule: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Durably add one finished experiment (replaces an earlier record of the key)."""
+        record = {'key': key, 'metrics': metrics, 'schedule': schedule or []}
+        line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+        if self._fd is None:
+            directory = os.path.dirname(self.path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            created = not os.path.exists(self.path)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if created:
+                _fsync_directory(directory)
+        written = 0
+        while written < len(line):
+            written += os.write(self._fd, line[written:])
+        os.fsync(self._fd)
+        self._records[key] = record
+
+    def clear(self) -> None:
+        """Forget every record and delete the journal."""
+        self.close()
+        self._records.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def open_journal(results_path: str, resume: bool = True) -> ResultStore:
+    """
+    Journal for a results CSV.
+
+    Args:
+        results_path: Results CSV the journaled experiments are exported to
+        resume: Keep earlier records (False starts an empty journal)
+    """
+    store = ResultStore(journal_path(results_path))
+    if not resume:
+        store.clear()
+    elif store.repaired:
+        logger.warning(f"Discarded {store.repaired} bytes of an interrupted write in {store.path}")
+    return store
+
+
+def _fsync_directory(directory: str) -> None:
+    """Persist a new directory entry (no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: str, write) -> None:
+    """
+    Replace a file in one step: write(f) fills a temporary file next to it,
+    which is fsynced and renamed over path.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', newline='', encoding='utf-8') as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_directory(directory)
@@ -0,0 +1,298 @@
+"""
+Parameter Sweeps
+================
+
+Expands a declarative grid into experiments and runs them in parallel,
+appending one result row per experiment to a CSV as soon as it finishes.
+
+A grid spec (JSON, or YAML when PyYAML is installed) lists algorithms with
+parameter values, machine counts and synthetic workload parameters (see
+benchmark.synthetic_workload); the sweep is their Cartesian product:
+
+    {
+      "algorithms": [
+        "EDF",
+        {"name": "DPE", "params": {"alpha": {"start": 0.05, "stop": 0.95, "step": 0.05}}}
+      ],
+      "num_machines": [2, 4, 8],
+      "workload": {"num_tasks": 1000, "load": [0.6, 0.8, 1.0], "seed": [0, 1, 2]}
+    }
+
+Any value may be a scalar, a list, or an inclusive {start, stop, step} range.
+Every row carries its point's key, so an interrupted sweep resumes by
+skipping the points already in the output file.
+"""
+
+import csv
+import functools
+import itertools
+import json
+import multiprocessing
+import os
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .algorithms import ALGORITHM_CLASSES, make_algorithm, algorithm_label
+from .benchmark import synthetic_workload
+from .runner import ExperimentRunner
+from .simulator import TaskSpec, fresh_tasks
+from .sketches import LatencyRecorder
+from .store import write_atomic
+
+# Workload generator parameters and their defaults
+WORKLOAD_DEFAULTS: Dict[str, Any] = {
+    'num_tasks': 1000,
+    'load': 0.8,
+    'high_fraction': 0.3,
+    'seed': 0,
+}
+
+# Columns identifying a point, ahead of the parameter and metric columns
+KEY_COLUMN = 'Point'
+POINT_COLUMNS = [KEY_COLUMN, 'Base Algorithm', 'Machines']
+
+
+def expand_values(value: Any) -> List[Any]:
+    """
+    Values of one grid axis.
+
+    Args:
+        value: A scalar, a list, or a dict {start, stop, step} (stop inclusive)
+
+    Raises:
+        ValueError: For a malformed range
+    """
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, dict):
+        return [value]
+    if set(value) != {'start', 'stop', 'step'}:
+        raise ValueError(f"Range needs exactly start, stop and step: {value}")
+    # Decimal steps so 0.05 increments land on 0.15, not 0.15000000000000002
+    start, stop, step = (Decimal(str(value[k])) for k in ('start', 'stop', 'step'))
+    if step <= 0 or stop < start:
+        raise ValueError(f"Range must have step > 0 and stop >= start: {value}")
+    as_int = all(isinstance(value[k], int) for k in ('start', 'stop', 'step'))
+    values = []
+    current = start
+    while current <= stop:
+        values.append(int(current) if as_int else float(current))
+        current += step
+    return values
+
+
+def load_grid(path: str) -> Dict[str, Any]:
+    """
+    Read a grid spec from a .json, .yaml or .yml file.
+
+    Raises:
+        ValueError: If the file is not a mapping, or YAML without PyYAML
+    """
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML grid specs need PyYAML (pip install pyyaml); use JSON instead")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    if not isinstance(spec, dict):
+        raise ValueError(f"{path}: grid spec must be a mapping")
+    return spec
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    """One experiment of a sweep."""
+    algorithm: str
+    params: Tuple[Tuple[str, Any], ...]
+    num_machines: int
+    workload: Tuple[Tuple[str, Any], ...]
+
+    @property
+    def key(self) -> str:
+        """Stable identifier, written to every row and used to resume."""
+        return json.dumps([self.algorithm, dict(self.params), self.num_machines,
+                           dict(self.workload)], sort_keys=True, ensure_ascii=False)
+
+    @property
+    def label(self) -> str:
+        return algorithm_label(self.algorithm, dict(self.params))
+
+    @property
+    def scenario(self) -> str:
+        workload = ', '.join(f"{k}={v}" for k, v in self.workload)
+        return f"Synthetic ({workload}, machines={self.num_machines})"
+
+
+def _product(axes: Dict[str, Any]) -> Iterator[Tuple[Tuple[str, Any], ...]]:
+    names = sorted(axes)
+    for combo in itertools.product(*(expand_values(axes[n]) for n in names)):
+        yield tuple(zip(names, combo))
+
+
+def expand_grid(spec: Dict[str, Any]) -> List[SweepPoint]:
+    """
+    Cartesian product of a grid spec, in spec order.
+
+    Raises:
+        ValueError: For unknown keys, algorithms or parameters
+    """
+    unknown = set(spec) - {'algorithms', 'num_machines', 'workload'}
+    if unknown:
+        raise ValueError(f"Unknown grid key(s): {', '.join(sorted(unknown))}")
+    workload_axes = dict(spec.get('workload') or {})
+    unknown = set(workload_axes) - set(WORKLOAD_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown workload parameter(s): {', '.join(sorted(unknown))} "
+                         f"(accepts: {', '.join(WORKLOAD_DEFAULTS)})")
+    workload_axes = {**WORKLOAD_DEFAULTS, **workload_axes}
+
+    algorithms = []
+    for entry in spec.get('algorithms') or []:
+        name, params = (entry, {}) if isinstance(entry, str) else (entry.get('name'), entry.get('params') or {})
+        if name not in ALGORITHM_CLASSES:
+            raise ValueError(f"Unknown algorithm '{name}' (available: {', '.join(ALGORITHM_CLASSES)})")
+        for combo in _product(params):
+            make_algorithm(name, **dict(combo))  # Validates parameter names
+            algorithms.append((name, combo))
+    if not algorithms:
+        raise ValueError("Grid spec lists no algorithms")
+
+    machine_counts = expand_values(spec.get('num_machines', 4))
+    workloads = list(_product(workload_axes))
+    return [SweepPoint(name, params, int(m), workload)
+            for workload in workloads for m in machine_counts for name, params in algorithms]
+
+
+def sweep_columns(points: List[SweepPoint]) -> List[str]:
+    """CSV header: point columns, every parameter, workload columns, then metrics."""
+    params = sorted({name for p in points for name, _ in p.params})
+    workload = list(WORKLOAD_DEFAULTS)
+    metrics = list(ExperimentRunner().calculate_metrics([], '', '', 0).keys())
+    return POINT_COLUMNS + params + workload + metrics
+
+
+def param_columns(columns: List[str]) -> List[str]:
+    """Parameter and workload columns of a sweep CSV header ([] for other CSVs)."""
+    if columns[:len(POINT_COLUMNS)] != POINT_COLUMNS or 'Scenario' not in columns:
+        return []
+    return columns[len(POINT_COLUMNS):columns.index('Scenario')]
+
+
+@functools.lru_cache(maxsize=8)
+def workload_specs(workload: Tuple[Tuple[str, Any], ...], num_machines: int) -> Tuple[TaskSpec, ...]:
+    """
+    Task definitions of a point's workload.
+
+    Generated once per process and shared by every point (algorithm,
+    parameter value) using the same workload; each run schedules fresh
+    Task records made from them.
+    """
+    params = dict(workload)
+    return tuple(task.spec for task in synthetic_workload(
+        params['num_tasks'], num_machines, load=params['load'],
+        high_fraction=params['high_fraction'], seed=params['seed']))
+
+
+def run_point(point: SweepPoint) -> Dict[str, Any]:
+    """
+    Simulate one point and return its result row.
+
+    Module level so worker processes can receive it.
+    """
+    workload = dict(point.workload)
+    tasks = fresh_tasks(workload_specs(point.workload, point.num_machines))
+    scheduler = make_algorithm(point.algorithm, **dict(point.params))(tasks, point.num_machines)
+    scheduler.record_logs = False
+    latency = scheduler.attach(LatencyRecorder())
+    scheduler.run()
+
+    metrics = ExperimentRunner().calculate_metrics(
+        tasks, point.scenario, point.label, scheduler.current_time, latency)
+    row = {KEY_COLUMN: point.key, 'Base Algorithm': point.algorithm, 'Machines': point.num_machines}
+    row.update(point.params)
+    row.update(workload)
+    row.update(metrics)
+    return row
+
+
+def completed_keys(path: str, columns: List[str]) -> Set[str]:
+    """
+    Keys of the points already in a sweep CSV.
+
+    A row cut short by an interruption is dropped (the file is rewritten
+    without it) so its point runs again.
+
+    Raises:
+        ValueError: If the file was written for a grid with other columns
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return set()
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != columns:
+            raise ValueError(f"{path} has different columns than this grid; "
+                             f"write to a new file or start over")
+        rows = list(reader)
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        ends_cleanly = f.read(1) == b'\n'
+    complete = [r for r in rows if r.get(columns[-1]) not in (None, '')]
+    if len(complete) != len(rows) or not ends_cleanly:
+        def write(f) -> None:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(complete)
+        write_atomic(path, write)
+    return {r[KEY_COLUMN] for r in complete}
+
+
+def run_sweep(points: List[SweepPoint], output: str, workers: int = 0, resume: bool = True,
+              on_row: Optional[Callable[[Dict[str, Any], int, int], None]] = None) -> int:
+    """
+    Run the points not yet in the output CSV and append their rows as they finish.
+
+    Args:
+        points: Points from expand_grid()
+        output: Result CSV path
+        workers: Processes (0 = CPU count; 1 = run in this process)
+        resume: Skip points already in the output file (otherwise overwrite it)
+        on_row: Called with (row, rows done, rows to do) after each row is written
+
+    Returns:
+        int: Rows written by this call
+    """
+    columns = sweep_columns(points)
+    if not resume and os.path.exists(output):
+        os.remove(output)
+    done = completed_keys(output, columns)
+    pending = [p for p in points if p.key not in done]
+    if not pending:
+        return 0
+
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    with open(output, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval='')
+        if f.tell() == 0:
+            writer.writeheader()
+
+        def write(rows: Iterator[Dict[str, Any]]) -> int:
+            count = 0
+            for row in rows:
+                writer.writerow(row)
+                # A finished point survives an interruption, or a preempted machine
+                f.flush()
+                os.fsync(f.fileno())
+                count += 1
+                if on_row:
+                    on_row(row, count, len(pending))
+            return count
+
+        if workers == 1:
+            return write(run_point(p) for p in pending)
+        with multiprocessing.get_context('spawn').Pool(workers) as pool:
+            return write(pool.imap_unordered(run_point, pending))
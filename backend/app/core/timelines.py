@@ -0,0 +1,183 @@
+"""
+Incremental Utilization and Backlog Timelines
+=============================================
+
+Piecewise-constant curves maintained while the simulation runs, so capacity
+planning does not need a second pass over the finished schedule:
+
+- busy machines
+- ready-queue length (overall and per priority class)
+- CPU cores and RAM in use
+
+Every event updates each affected curve in O(1). Curves can be exported
+as raw change points or downsampled to fixed-width, time-weighted buckets.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
+from .simulator import SimulationListener, Task, Machine, Scheduler, Priority
+
+
+class StepTimeline:
+    """
+    Piecewise-constant series: values[i] holds from times[i] until times[i + 1].
+
+    Changes must be recorded in non-decreasing time order. Several changes at
+    the same instant collapse into one step, and changes that leave the value
+    unchanged are not stored.
+
+    Attributes:
+        times: Change-point times
+        values: Value in effect from the matching change point onward
+        end_time: Time at which the series stops (set by close())
+    """
+
+    def __init__(self, initial: float = 0.0, start: float = 0.0) -> None:
+        self.times: List[float] = [start]
+        self.values: List[float] = [initial]
+        self.end_time: Optional[float] = None
+
+    @property
+    def current(self) -> float:
+        """Most recently recorded value."""
+        return self.values[-1]
+
+    def set(self, time: float, value: float) -> None:
+        """Record that the series takes a new value from time onward."""
+        if time == self.times[-1]:
+            self.values[-1] = value
+            # Drop a step that a same-instant update turned back into a no-op
+            if len(self.values) > 1 and self.values[-2] == value:
+                self.times.pop()
+                self.values.pop()
+        elif value != self.values[-1]:
+            self.times.append(time)
+            self.values.append(value)
+
+    def add(self, time: float, delta: float) -> None:
+        """Change the current value by delta from time onward."""
+        self.set(time, self.values[-1] + delta)
+
+    def close(self, time: float) -> None:
+        """Mark the end of the observed period."""
+        self.end_time = time
+
+    def value_at(self, time: float) -> float:
+        """Value in effect at the given time (initial value before the start)."""
+        i = bisect_right(self.times, time) - 1
+        return self.values[max(i, 0)]
+
+    def resample(self, width: float, start: Optional[float] = None,
+                 end: Optional[float] = None) -> Dict[str, List[float]]:
+        """
+        Time-weighted mean of the series over fixed-width buckets.
+
+        Args:
+            width: Bucket width in simulation time units
+            start: First bucket start (default: first change point)
+            end: Last bucket end (default: end_time or last change point)
+
+        Returns:
+            {'times': bucket starts, 'values': mean value in each bucket}
+        """
+        if width <= 0:
+            raise ValueError("Bucket width must be positive")
+        start = self.times[0] if start is None else start
+        if end is None:
+            end = self.end_time if self.end_time is not None else self.times[-1]
+        if end <= start:
+            return {'times': [], 'values': []}
+
+        num_buckets = int(-(-(end - start) // width))  # ceil
+        area = [0.0] * num_buckets
+
+        # Walk the steps once, spreading each step's area over the buckets it spans
+        bounds = self.times[1:] + [end]
+        for step_start, step_end, value in zip(self.times, bounds, self.values):
+            lo = max(step_start, start)
+            hi = min(step_end, end)
+            if hi <= lo or value == 0:
+                continue
+            b = int((lo - start) // width)
+            while lo < hi and b < num_buckets:
+                bucket_end = min(start + (b + 1) * width, hi)
+                area[b] += value * (bucket_end - lo)
+                lo = bucket_end
+                b += 1
+
+        times = [start + b * width for b in range(num_buckets)]
+        spans = [min(width, end - t) for t in times]
+        return {'times': times, 'values': [a / s for a, s in zip(area, spans)]}
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """Raw change points as {'times': [...], 'values': [...]}."""
+        return {'times': list(self.times), 'values': list(self.values)}
+
+
+class TimelineRecorder(SimulationListener):
+    """
+    Listener maintaining capacity-planning timelines during a run.
+
+    Attach before run(); the curves then appear under 'timelines' in
+    Scheduler.get_results().
+
+    Usage:
+        recorder = scheduler.attach(TimelineRecorder(bucket_width=10.0))
+        scheduler.run()
+        recorder.timelines['busy_machines'].value_at(42.0)
+
+    Attributes:
+        timelines: Mapping of curve name to StepTimeline
+        bucket_width: If set, to_dict() exports bucketed means instead of
+            raw change points
+    """
+
+    result_key = 'timelines'
+
+    def __init__(self, bucket_width: Optional[float] = None) -> None:
+        self.bucket_width = bucket_width
+        self.busy_machines = StepTimeline()
+        self.ready_queue = StepTimeline()
+        self.ready_by_priority = {p: StepTimeline() for p in Priority}
+        self.cpu_in_use = StepTimeline()
+        self.ram_in_use = StepTimeline()
+
+    @property
+    def timelines(self) -> Dict[str, StepTimeline]:
+        """All curves keyed by export name."""
+        curves = {
+            'busy_machines': self.busy_machines,
+            'ready_queue': self.ready_queue,
+        }
+        for priority, timeline in self.ready_by_priority.items():
+            curves[f'ready_queue_{priority.name}'] = timeline
+        curves['cpu_in_use'] = self.cpu_in_use
+        curves['ram_in_use'] = self.ram_in_use
+        return curves
+
+    def on_event(self, event_type: str, time: float, task: Task,
+                 machine: Optional[Machine] = None) -> None:
+        if event_type == 'ARRIVAL':
+            self.ready_queue.add(time, 1)
+            self.ready_by_priority[task.priority].add(time, 1)
+        elif event_type == 'START':
+            self.ready_queue.add(time, -1)
+            self.ready_by_priority[task.priority].add(time, -1)
+            self.busy_machines.add(time, 1)
+            self.cpu_in_use.add(time, task.cpu_required)
+            self.ram_in_use.add(time, task.ram_required)
+        elif event_type == 'COMPLETION':
+            self.busy_machines.add(time, -1)
+            self.cpu_in_use.add(time, -task.cpu_required)
+            self.ram_in_use.add(time, -task.ram_required)
+
+    def on_finish(self, scheduler: Scheduler) -> None:
+        for timeline in self.timelines.values():
+            timeline.close(scheduler.current_time)
+
+    def to_dict(self) -> Dict[str, Dict[str, List[float]]]:
+        """Export every curve, bucketed when bucket_width is set."""
+        if self.bucket_width:
+            return {name: t.resample(self.bucket_width) for name, t in self.timelines.items()}
+        return {name: t.to_dict() for name, t in self.timelines.items()}
@@ -0,0 +1,310 @@
+"""
+Binary Schedule Traces
+======================
+
+Compact on-disk representation of a finished (or running) simulation so a
+schedule can be re-analyzed without re-running it.
+
+File layout (all integers little-endian):
+
+    [0:8)    magic  b'PYSTRACE'
+    [8:12)   format version (uint32)
+    [12:16)  reserved
+    [16:24)  byte offset of the metadata block (uint64)
+    [24:32)  byte length of the metadata block (uint64)
+    [32:64)  reserved
+    [64:..)  event table, then task table, then any extra tables,
+             then the metadata block (UTF-8 JSON)
+
+The metadata block records free-form run information (algorithm, scenario,
+machine count) plus the offset, row count and dtype of every table, so the
+reader can memory-map each table in place. Events are appended in simulation
+order, which keeps the ``time`` column sorted and makes time-window slicing a
+binary search followed by a zero-copy view.
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .simulator import SimulationListener, Task, Machine, Scheduler, Priority
+
+MAGIC = b'PYSTRACE'
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct('<8sII QQ 32x')
+
+# Event codes stored in the 'event' column
+EVENT_CODES = {'ARRIVAL': 0, 'START': 1, 'COMPLETION': 2}
+EVENT_NAMES = {code: name for name, code in EVENT_CODES.items()}
+
+EVENT_DTYPE = np.dtype([
+    ('time', '<f8'),
+    ('event', 'u1'),
+    ('task', '<i8'),
+    ('machine', '<i4'),
+])
+
+TASK_DTYPE = np.dtype([
+    ('id', '<i8'),
+    ('arrival_time', '<f8'),
+    ('processing_time', '<f8'),
+    ('priority', 'u1'),
+    ('deadline', '<f8'),
+    ('cpu_required', '<i4'),
+    ('ram_required', '<i4'),
+    ('start_time', '<f8'),
+    ('completion_time', '<f8'),
+    ('machine_id', '<i4'),
+])
+
+PathLike = Union[str, Path]
+
+
+def tasks_to_array(tasks: List[Task]) -> np.ndarray:
+    """
+    Convert Task objects to a TASK_DTYPE structured array.
+
+    Unset start/completion times are stored as NaN and an unset machine as -1.
+    Priority is stored as its enum value (HIGH=1, LOW=2).
+    """
+    table = np.empty(len(tasks), dtype=TASK_DTYPE)
+    for i, t in enumerate(tasks):
+        table[i] = (
+            t.id, t.arrival_time, t.processing_time, t.priority.value,
+            t.deadline, t.cpu_required, t.ram_required,
+            np.nan if t.start_time is None else t.start_time,
+            np.nan if t.completion_time is None else t.completion_time,
+            -1 if t.machine_id is None else t.machine_id,
+        )
+    return table
+
+
+def array_to_tasks(table: np.ndarray) -> List[Task]:
+    """Rebuild Task objects (including scheduling state) from a task table."""
+    tasks = []
+    for row in table:
+        task = Task(
+            id=int(row['id']),
+            arrival_time=float(row['arrival_time']),
+            processing_time=float(row['processing_time']),
+            priority=Priority(int(row['priority'])),
+            deadline=float(row['deadline']),
+            cpu_required=int(row['cpu_required']),
+            ram_required=int(row['ram_required']),
+        )
+        if not np.isnan(row['start_time']):
+            task.start_time = float(row['start_time'])
+        if not np.isnan(row['completion_time']):
+            task.completion_time = float(row['completion_time'])
+        if row['machine_id'] >= 0:
+            task.machine_id = int(row['machine_id'])
+        tasks.append(task)
+    return tasks
+
+
+class TraceWriter(SimulationListener):
+    """
+    Stream simulation events into a binary trace file.
+
+    Events are buffered in a fixed-size structured array and flushed to disk
+    whenever the buffer fills, so memory use stays constant regardless of
+    schedule length. The task table and metadata are written when the run
+    finishes (or when close() is called explicitly). Used as a context
+    manager, a run that raises leaves no partial trace behind.
+
+    Usage:
+        scheduler = EDF_Scheduler(tasks, 2)
+        with scheduler.attach(TraceWriter('run.trace', metadata={'algorithm': 'EDF'})):
+            scheduler.run()   # trace is finalized by on_finish()
+
+    Attributes:
+        path: Output file path
+        metadata: Free-form JSON-serializable run information
+        events_written: Number of events flushed so far
+    """
+
+    # Finish after other listeners so their final summaries can be stored
+    finish_order = 1
+
+    def __init__(self, path: PathLike, metadata: Optional[Dict[str, Any]] = None,
+                 buffer_size: int = 65536) -> None:
+        self.path = Path(path)
+        self.metadata: Dict[str, Any] = dict(metadata or {})
+        self.events_written = 0
+        self._tables: List[Tuple[str, np.ndarray]] = []
+        self._buffer = np.empty(buffer_size, dtype=EVENT_DTYPE)
+        self._buffered = 0
+        self._closed = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'wb')
+        self._file.write(b'\0' * HEADER_SIZE)
+
+    def __enter__(self) -> 'TraceWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def on_event(self, event_type: str, time: float, task: Task,
+                 machine: Optional[Machine] = None) -> None:
+        self.record(time, event_type, task.id, -1 if machine is None else machine.id)
+
+    def on_finish(self, scheduler: Scheduler) -> None:
+        # Store online summaries (e.g. windowed metrics) alongside the events
+        for listener in scheduler.listeners:
+            if listener is not self and listener.trace_table:
+                self.add_table(listener.trace_table, listener.to_array())
+        self.metadata.setdefault('num_machines', scheduler.num_machines)
+        self.metadata.setdefault('algorithm', type(scheduler).__name__)
+        self.close(scheduler.all_tasks)
+
+    def record(self, time: float, event_type: str, task_id: int, machine_id: int = -1) -> None:
+        """Append one event row, flushing the buffer when it is full."""
+        self._buffer[self._buffered] = (time, EVENT_CODES[event_type], task_id, machine_id)
+        self._buffered += 1
+        if self._buffered == len(self._buffer):
+            self._flush()
+
+    def add_table(self, name: str, table: np.ndarray) -> None:
+        """
+        Attach an extra structured array to be stored after the task table.
+
+        Args:
+            name: Table name used by TraceReader.table()
+            table: NumPy structured array
+        """
+        if name in ('events', 'tasks'):
+            raise ValueError(f"Table name '{name}' is reserved")
+        self._tables.append((name, np.ascontiguousarray(table)))
+
+    def close(self, tasks: Optional[List[Task]] = None) -> None:
+        """
+        Write the task table, extra tables and metadata, then patch the header.
+
+        Args:
+            tasks: Tasks to store in the task table (may be empty)
+        """
+        if self._closed:
+            return
+        self._flush()
+
+        sections: Dict[str, Dict[str, Any]] = {
+            'events': {'offset': HEADER_SIZE, 'count': self.events_written,
+                       'dtype': EVENT_DTYPE.descr},
+        }
+        tables = [('tasks', tasks_to_array(tasks or []))] + self._tables
+        for name, table in tables:
+            sections[name] = {'offset': self._file.tell(), 'count': len(table),
+                              'dtype': table.dtype.descr}
+            table.tofile(self._file)
+
+        meta_offset = self._file.tell()
+        meta = json.dumps({'metadata': self.metadata, 'sections': sections}).encode('utf-8')
+        self._file.write(meta)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, meta_offset, len(meta)))
+        self._file.close()
+        self._closed = True
+
+    def abort(self) -> None:
+        """Close the file and delete the unfinished trace."""
+        if self._closed:
+            return
+        self._file.close()
+        self._closed = True
+        self.path.unlink(missing_ok=True)
+
+    def _flush(self) -> None:
+        if self._buffered:
+            self._buffer[:self._buffered].tofile(self._file)
+            self.events_written += self._buffered
+            self._buffered = 0
+
+
+class TraceReader:
+    """
+    Memory-mapped reader for traces produced by TraceWriter.
+
+    Tables are exposed as read-only NumPy memmaps; nothing is loaded into
+    Python objects until explicitly requested (e.g. via to_tasks()).
+
+    Attributes:
+        path: Trace file path
+        metadata: Run information stored by the writer
+        events: EVENT_DTYPE memmap, sorted by time
+        tasks: TASK_DTYPE memmap
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                raise ValueError(f"{self.path} is not a schedule trace (file too short)")
+            magic, version, _, meta_offset, meta_len = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a schedule trace (bad magic)")
+            if version > FORMAT_VERSION:
+                raise ValueError(f"Unsupported trace version {version}")
+            if meta_offset == 0:
+                raise ValueError(f"{self.path} was not closed cleanly")
+            f.seek(meta_offset)
+            info = json.loads(f.read(meta_len).decode('utf-8'))
+
+        self.metadata: Dict[str, Any] = info['metadata']
+        self._sections: Dict[str, Dict[str, Any]] = info['sections']
+        self.events = self.table('events')
+        self.tasks = self.table('tasks')
+
+    @property
+    def table_names(self) -> List[str]:
+        """Names of all tables stored in the trace."""
+        return list(self._sections)
+
+    def table(self, name: str) -> np.ndarray:
+        """Memory-map a table by name (empty tables return an empty array)."""
+        section = self._sections[name]
+        dtype = np.dtype([tuple(field) for field in section['dtype']])
+        if section['count'] == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode='r',
+                         offset=section['offset'], shape=(section['count'],))
+
+    def window(self, start: float, end: float) -> np.ndarray:
+        """
+        Events with start <= time < end, as a zero-copy view.
+
+        Args:
+            start: Window start (inclusive)
+            end: Window end (exclusive)
+        """
+        times = self.events['time']
+        lo = np.searchsorted(times, start, side='left')
+        hi = np.searchsorted(times, end, side='left')
+        return self.events[lo:hi]
+
+    def machine_events(self, machine_id: int, start: Optional[float] = None,
+                       end: Optional[float] = None) -> np.ndarray:
+        """
+        Events on one machine, optionally restricted to a time window.
+
+        The window is sliced without copying; only the machine filter
+        materializes the (usually much smaller) matching rows.
+        """
+        events = self.events
+        if start is not None or end is not None:
+            events = self.window(-np.inf if start is None else start,
+                                 np.inf if end is None else end)
+        return events[events['machine'] == machine_id]
+
+    def to_tasks(self) -> List[Task]:
+        """Rebuild Task objects with their recorded scheduling state."""
+        return array_to_tasks(self.tasks)
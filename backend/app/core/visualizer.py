@@ -19,22 +19,41 @@ Date: 2024
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import Rectangle
+from matplotlib.collections import PolyCollection, LineCollection
+from matplotlib.colors import to_rgba_array
 import numpy as np
 import pandas as pd
 import seaborn as sns
 from pathlib import Path
+from dataclasses import dataclass, replace, asdict
+from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+import io
 import os
-import copy
-from simple_simulator import Task, Priority
-from algorithms import get_all_algorithms
-from scenarios import get_all_scenarios
+import time
+from .simulator import Task, Priority, fresh_tasks
+from .algorithms import get_all_algorithms
+from .scenarios import get_all_scenarios
+from .manifest import (ChartManifest, fingerprint, task_signature, schedule_signature,
+                       scheduler_signature, file_digest)
+from .runner import load_schedules
+from .aggregates import ResultAggregates, categorize_scenario, CATEGORIES
+from .config import CHART_FORMATS
 
 # =============================================================================
 # MATPLOTLIB CONFIGURATION
 # =============================================================================
 
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
+# Output resolution of saved charts
+CHART_DPI = 300
+
+# Digest of the plotting and aggregation source, so any change to the code
+# that draws charts makes incremental generation redraw every chart
+PLOT_VERSION = fingerprint(*(file_digest(Path(__file__).with_name(name))
+                             for name in ('visualizer.py', 'aggregates.py')))
+
+plt.rcParams['figure.dpi'] = CHART_DPI
+plt.rcParams['savefig.dpi'] = CHART_DPI
 plt.rcParams['font.family'] = 'sans-serif'
 plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
 plt.rcParams['font.size'] = 10
@@ -57,6 +76,85 @@ ALGORITHM_COLORS = {
     'DPE (α=0.9)': '#F0E442'
 }
 
+# Above this many tasks, Gantt charts batch bars into collections
+COLLECTION_THRESHOLD = 500
+
+# Above this many tasks per horizontal pixel, Gantt charts switch to the
+# aggregated level-of-detail view
+LOD_TASKS_PER_PIXEL = 1.0
+LOD_BUSY_CMAP = 'Blues'
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """
+    How charts are rasterized and styled.
+
+    Attributes:
+        name: Profile name
+        dpi: Output resolution
+        tight_bbox: Crop to the drawn content (bbox_inches='tight'), which
+            costs an extra layout pass on every save
+        simplified: Batched bars, no per-task labels or grid, and fixed
+            margins instead of tight_layout()
+        formats: File formats written per chart (png, svg, pdf)
+    """
+    name: str
+    dpi: int
+    tight_bbox: bool
+    simplified: bool
+    formats: Tuple[str, ...] = ('png',)
+
+    @property
+    def bbox_inches(self):
+        return 'tight' if self.tight_bbox else None
+
+
+RENDER_PROFILES = {
+    'publication': RenderProfile('publication', CHART_DPI, tight_bbox=True, simplified=False),
+    'draft': RenderProfile('draft', 72, tight_bbox=False, simplified=True),
+}
+
+
+def get_render_profile(profile=None, formats=None, dpi=None):
+    """
+    Resolve a profile name (or RenderProfile) with optional overrides.
+
+    Args:
+        profile: Name in RENDER_PROFILES, a RenderProfile, or None for 'publication'
+        formats: Output formats replacing the profile's
+        dpi: Resolution replacing the profile's
+
+    Raises:
+        ValueError: For unknown profile names or formats
+    """
+    if profile is None:
+        profile = 'publication'
+    if isinstance(profile, str):
+        if profile not in RENDER_PROFILES:
+            raise ValueError(f"Unknown render profile: {profile}")
+        profile = RENDER_PROFILES[profile]
+    if formats:
+        formats = tuple(formats)
+        unknown = [f for f in formats if f not in CHART_FORMATS]
+        if unknown:
+            raise ValueError(f"Unsupported chart format(s): {', '.join(unknown)}")
+        profile = replace(profile, formats=formats)
+    if dpi:
+        profile = replace(profile, dpi=dpi)
+    return profile
+
+
+def save_figure(fig, path, profile):
+    """Save a figure once per profile format; returns the written paths."""
+    paths = []
+    for fmt in profile.formats:
+        target = Path(path).with_suffix(f'.{fmt}')
+        fig.savefig(target, format=fmt, dpi=profile.dpi, bbox_inches=profile.bbox_inches)
+        paths.append(target)
+    return paths
+
+
 PRIORITY_COLORS = {
     'high_priority': '#2E86AB',
     'low_priority': '#F77F00',
@@ -72,12 +170,24 @@ class SchedulingVisualizer:
     """Visualization system for scheduling analysis"""
 
     def __init__(self, output_dir='visualizations'):
-        """Initialize visualizer with output directory"""
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        """Initialize visualizer with output directory (None for in-memory rendering only)"""
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        if self.output_dir is not None:
+            self.output_dir.mkdir(exist_ok=True)
+
+    @staticmethod
+    def gantt_filename(algorithm_name, scenario_name, time_window=None):
+        """File name used for a scenario × algorithm Gantt chart"""
+        safe_algo = algorithm_name.replace('(', '').replace(')', '').replace(' ', '_').replace('=', '')
+        safe_scenario = scenario_name.replace(' ', '_').replace(':', '').replace('/', '_')
+        if time_window is not None:
+            safe_algo += f"_t{time_window[0]:g}-{time_window[1]:g}"
+        return f"{safe_scenario}_{safe_algo}_gantt.png"
 
     def create_gantt_chart(self, tasks, algorithm_name, scenario_name,
-                          num_machines=2, save=True):
+                          num_machines=2, save=True, fig=None, mode='auto',
+                          time_window=None, lod_threshold=LOD_TASKS_PER_PIXEL,
+                          profile=None):
         """
         Create Gantt chart showing task scheduling timeline.
 
@@ -87,12 +197,142 @@ class SchedulingVisualizer:
             scenario_name: Name of scenario for title
             num_machines: Number of machines to display
             save: Whether to save the figure
+            fig: Existing Figure to clear and draw into instead of creating
+                a new one (kept open after saving so it can be reused)
+            mode: 'patches' draws one patch, label and deadline line per
+                task; 'collections' batches all bars and deadline markers
+                into single collections and only labels bars the label fits
+                in; 'lod' bins each machine's timeline into pixel-wide
+                buckets shaded by busy fraction and deadline-miss density;
+                'auto' picks lod when tasks outnumber lod_threshold × the
+                horizontal pixels, else collections above
+                COLLECTION_THRESHOLD tasks, else patches
+            time_window: (start, end) to zoom into; only overlapping tasks
+                are drawn, so a narrow window drops back to full detail
+            lod_threshold: Tasks per horizontal pixel above which 'auto'
+                switches to the level-of-detail view
+            profile: RenderProfile or profile name ('publication', 'draft');
+                simplified profiles default to collections without labels
 
         Returns:
             matplotlib Figure object
         """
-        fig, ax = plt.subplots(figsize=(10, max(3, num_machines * 0.8)))
+        profile = get_render_profile(profile)
+        figsize = (10, max(3, num_machines * 0.8))
+        reuse = fig is not None
+        # Drawn at the output resolution, so the pixel widths behind the
+        # auto mode, LOD buckets and label fitting match the saved image
+        if reuse:
+            fig.clf()
+            fig.set_dpi(profile.dpi)
+            fig.set_size_inches(*figsize)
+            ax = fig.add_subplot()
+        else:
+            fig, ax = plt.subplots(figsize=figsize, dpi=profile.dpi)
+
+        if time_window is not None:
+            x_min, x_max = time_window
+            tasks = [t for t in tasks
+                     if t.start_time is not None and t.completion_time is not None
+                     and t.start_time < x_max and t.completion_time > x_min]
+        else:
+            x_min = 0
+            x_max = max((t.completion_time for t in tasks if t.completion_time), default=10) + 2
+
+        if mode == 'auto':
+            if len(tasks) > lod_threshold * ax.get_window_extent().width:
+                mode = 'lod'
+            elif profile.simplified or len(tasks) > COLLECTION_THRESHOLD:
+                mode = 'collections'
+            else:
+                mode = 'patches'
+        if mode == 'lod':
+            self._draw_gantt_lod(ax, tasks, num_machines, x_min, x_max)
+        elif mode == 'collections':
+            bars = self._draw_gantt_collections(ax, tasks)
+        elif mode == 'patches':
+            self._draw_gantt_patches(ax, tasks)
+        else:
+            raise ValueError(f"Unknown Gantt rendering mode: {mode}")
+
+        # Configure axes
+        title = f'{algorithm_name} - {scenario_name}'
+        if time_window is not None:
+            title += f' [t={x_min:g}–{x_max:g}]'
+        ax.set_xlim(x_min, x_max)
+        ax.set_ylim(-0.5, num_machines - 0.5)
+        ax.set_xlabel('Time', fontsize=11, fontweight='bold')
+        ax.set_ylabel('Machine', fontsize=11, fontweight='bold')
+        ax.set_title(title, fontsize=13, fontweight='bold', pad=15)
+        ax.set_yticks(range(num_machines))
+        ax.set_yticklabels([f'M{i}' for i in range(num_machines)])
+        if profile.simplified:
+            ax.grid(False)
+        else:
+            ax.grid(True, axis='x', alpha=0.3, linestyle='--')
+        ax.invert_yaxis()
+
+        if mode == 'collections' and not profile.simplified:
+            # Needs final axis limits to know which bars are wide enough
+            self._draw_fitting_labels(ax, *bars)
+
+        # Create legend
+        if mode == 'lod':
+            legend_elements = [
+                mpatches.Patch(facecolor=plt.get_cmap(LOD_BUSY_CMAP)(0.8), label='Busy fraction'),
+                mpatches.Patch(facecolor=PRIORITY_COLORS['deadline_missed'], label='Deadline-miss density')
+            ]
+        else:
+            legend_elements = [
+                mpatches.Patch(facecolor=PRIORITY_COLORS['high_priority'], edgecolor='black', label='High Priority'),
+                mpatches.Patch(facecolor=PRIORITY_COLORS['low_priority'], edgecolor='black', label='Low Priority'),
+                mpatches.Patch(facecolor='white', edgecolor=PRIORITY_COLORS['deadline_missed'], linewidth=3, label='Deadline Missed')
+            ]
+        ax.legend(handles=legend_elements, loc='upper right', framealpha=0.9)
+
+        if profile.simplified:
+            # Fixed margins (in inches) instead of a layout pass
+            width, height = figsize
+            fig.subplots_adjust(left=0.7 / width, right=1 - 0.15 / width,
+                                bottom=0.6 / height, top=1 - 0.5 / height)
+        else:
+            fig.tight_layout()
+
+        if save:
+            filepath = self.output_dir / self.gantt_filename(algorithm_name, scenario_name, time_window)
+            save_figure(fig, filepath, profile)
+            if not reuse:
+                plt.close(fig)
+
+        return fig
+
+    def render_gantt_image(self, tasks, algorithm_name, scenario_name,
+                           num_machines=2, fmt='png', fig=None, profile=None, **options):
+        """
+        Render a Gantt chart to image bytes instead of a file.
 
+        Args:
+            fmt: 'png', 'svg' or 'pdf'
+            fig: Figure to reuse, as in create_gantt_chart
+            profile: RenderProfile or profile name (default 'publication')
+            **options: Passed through to create_gantt_chart (mode, time_window, ...)
+
+        Returns:
+            Encoded image bytes
+        """
+        profile = get_render_profile(profile)
+        reuse = fig is not None
+        fig = self.create_gantt_chart(tasks, algorithm_name, scenario_name,
+                                      num_machines=num_machines, save=False,
+                                      fig=fig, profile=profile, **options)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=profile.dpi, bbox_inches=profile.bbox_inches)
+        if not reuse:
+            plt.close(fig)
+        return buffer.getvalue()
+
+    def _draw_gantt_patches(self, ax, tasks):
+        """Draw one Rectangle, label and deadline line per task."""
         # Plot each task as a rectangle
         for task in tasks:
             if task.start_time is None or task.completion_time is None:
@@ -142,36 +382,118 @@ class SchedulingVisualizer:
                    [machine_y - 0.45, machine_y + 0.45],
                    color='gray', linestyle=':', linewidth=1.5, alpha=0.6)
 
-        # Configure axes
-        ax.set_xlim(0, max((t.completion_time for t in tasks if t.completion_time), default=10) + 2)
-        ax.set_ylim(-0.5, num_machines - 0.5)
-        ax.set_xlabel('Time', fontsize=11, fontweight='bold')
-        ax.set_ylabel('Machine', fontsize=11, fontweight='bold')
-        ax.set_title(f'{algorithm_name} - {scenario_name}', fontsize=13, fontweight='bold', pad=15)
-        ax.set_yticks(range(num_machines))
-        ax.set_yticklabels([f'M{i}' for i in range(num_machines)])
-        ax.grid(True, axis='x', alpha=0.3, linestyle='--')
-        ax.invert_yaxis()
-
-        # Create legend
-        legend_elements = [
-            mpatches.Patch(facecolor=PRIORITY_COLORS['high_priority'], edgecolor='black', label='High Priority'),
-            mpatches.Patch(facecolor=PRIORITY_COLORS['low_priority'], edgecolor='black', label='Low Priority'),
-            mpatches.Patch(facecolor='white', edgecolor=PRIORITY_COLORS['deadline_missed'], linewidth=3, label='Deadline Missed')
-        ]
-        ax.legend(handles=legend_elements, loc='upper right', framealpha=0.9)
+    def _draw_gantt_collections(self, ax, tasks):
+        """
+        Draw every bar as one PolyCollection and every deadline marker as one
+        LineCollection, with styles assigned by vectorized masks.
 
-        plt.tight_layout()
+        Returns:
+            (start, end, machine, ids) arrays of the drawn bars, for labeling
+        """
+        scheduled = [t for t in tasks
+                     if t.start_time is not None and t.completion_time is not None]
+        start = np.fromiter((t.start_time for t in scheduled), float, len(scheduled))
+        end = np.fromiter((t.completion_time for t in scheduled), float, len(scheduled))
+        machine = np.fromiter((t.machine_id for t in scheduled), float, len(scheduled))
+        deadline = np.fromiter((t.deadline for t in scheduled), float, len(scheduled))
+        ids = np.fromiter((t.id for t in scheduled), np.int64, len(scheduled))
+        high = np.fromiter((t.priority.name == 'HIGH' for t in scheduled), bool, len(scheduled))
+        met = end <= deadline
+
+        # Rectangle corners, shape (n, 4, 2)
+        verts = np.empty((len(scheduled), 4, 2))
+        verts[:, [0, 1], 0] = start[:, None]
+        verts[:, [2, 3], 0] = end[:, None]
+        verts[:, [0, 3], 1] = (machine - 0.4)[:, None]
+        verts[:, [1, 2], 1] = (machine + 0.4)[:, None]
+
+        face = np.where(high[:, None],
+                        to_rgba_array(PRIORITY_COLORS['high_priority']),
+                        to_rgba_array(PRIORITY_COLORS['low_priority']))
+        face[:, 3] = np.where(met, 0.8, 0.5)
+        edge = np.where(met[:, None],
+                        to_rgba_array('black'),
+                        to_rgba_array(PRIORITY_COLORS['deadline_missed']))
+        ax.add_collection(PolyCollection(verts, facecolors=face, edgecolors=edge,
+                                         linewidths=np.where(met, 1.0, 3.0)))
+
+        segments = np.empty((len(scheduled), 2, 2))
+        segments[:, :, 0] = deadline[:, None]
+        segments[:, 0, 1] = machine - 0.45
+        segments[:, 1, 1] = machine + 0.45
+        ax.add_collection(LineCollection(segments, colors='gray', linestyles=':',
+                                         linewidths=1.5, alpha=0.6))
+        return start, end, machine, ids
+
+    def _draw_gantt_lod(self, ax, tasks, num_machines, x_min, x_max):
+        """
+        Aggregated view: one row of pixel-wide buckets per machine.
 
-        if save:
-            safe_algo = algorithm_name.replace('(', '').replace(')', '').replace(' ', '_').replace('=', '')
-            safe_scenario = scenario_name.replace(' ', '_').replace(':', '').replace('/', '_')
-            filename = f"{safe_scenario}_{safe_algo}_gantt.png"
-            filepath = self.output_dir / filename
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close(fig)
+        Bucket shade is the fraction of the bucket the machine spent busy;
+        buckets where deadlines were missed are blended toward red in
+        proportion to the number of misses (normalized to the densest bucket).
+        """
+        bins = max(1, int(ax.get_window_extent().width))
+        busy, misses = self._lod_bins(tasks, num_machines, np.linspace(x_min, x_max, bins + 1))
+
+        image = plt.get_cmap(LOD_BUSY_CMAP)(np.clip(busy, 0, 1) * 0.85)
+        if misses.max() > 0:
+            weight = (misses / misses.max())[..., None] * 0.85
+            image[..., :3] = image[..., :3] * (1 - weight) + to_rgba_array(
+                PRIORITY_COLORS['deadline_missed'])[0, :3] * weight
+        ax.imshow(image, aspect='auto', interpolation='nearest', origin='lower',
+                  extent=(x_min, x_max, -0.5, num_machines - 0.5))
+
+    @staticmethod
+    def _lod_bins(tasks, num_machines, edges):
+        """
+        Per-machine busy fraction and deadline-miss count of each bucket.
 
-        return fig
+        Returns:
+            (busy, misses) arrays of shape (num_machines, len(edges) - 1)
+        """
+        busy = np.zeros((num_machines, len(edges) - 1))
+        misses = np.zeros((num_machines, len(edges) - 1))
+
+        scheduled = [t for t in tasks
+                     if t.start_time is not None and t.completion_time is not None
+                     and t.machine_id is not None and t.machine_id < num_machines]
+        by_machine = {}
+        for t in scheduled:
+            by_machine.setdefault(t.machine_id, []).append(t)
+
+        for machine_id, machine_tasks in by_machine.items():
+            machine_tasks.sort(key=lambda t: t.start_time)
+            start = np.fromiter((t.start_time for t in machine_tasks), float, len(machine_tasks))
+            end = np.fromiter((t.completion_time for t in machine_tasks), float, len(machine_tasks))
+            missed_at = np.array([t.completion_time for t in machine_tasks if not t.meets_deadline()])
+
+            # Cumulative busy time is piecewise linear with knots at every
+            # start/end, so per-bucket busy time is a difference of interpolations
+            done_before = np.concatenate(([0.0], np.cumsum(end - start)[:-1]))
+            knots_x = np.column_stack((start, end)).ravel()
+            knots_y = np.column_stack((done_before, done_before + (end - start))).ravel()
+            cumulative = np.interp(edges, knots_x, knots_y)
+            busy[machine_id] = np.diff(cumulative) / np.diff(edges)
+
+            if len(missed_at):
+                misses[machine_id], _ = np.histogram(missed_at, bins=edges)
+        return busy, misses
+
+    def _draw_fitting_labels(self, ax, start, end, machine, ids, fontsize=9):
+        """Label only the bars whose on-screen width can hold their task ID."""
+        if len(ids) == 0:
+            return
+        x0, x1 = ax.get_xlim()
+        pixels_per_unit = ax.get_window_extent().width / (x1 - x0)
+        # Bold glyphs are roughly 0.65 em wide; labels read "T<id>"
+        char_px = fontsize * 0.65 * ax.figure.dpi / 72
+        label_px = (np.floor(np.log10(np.maximum(ids, 1))) + 2) * char_px
+        fits = (end - start) * pixels_per_unit >= label_px * 1.2
+
+        for x, y, task_id in zip((start + end)[fits] / 2, machine[fits], ids[fits]):
+            ax.text(x, y, f"T{task_id}", ha='center', va='center',
+                    fontsize=fontsize, fontweight='bold', color='white')
 
 
 # =============================================================================
@@ -190,45 +512,30 @@ def load_results_data(csv_path='results/comprehensive_results.csv'):
         return None
 
 
-def categorize_scenario(scenario_name):
-    """Categorize scenarios by type"""
-    if any(x in scenario_name for x in ['Light', 'Heavy', 'Batch', 'Starvation Test']):
-        return 'Basic'
-    elif 'Challenge' in scenario_name:
-        return 'Challenge'
-    elif 'Extreme' in scenario_name:
-        return 'Extreme'
-    elif 'Advanced' in scenario_name:
-        return 'Advanced'
-    elif 'New' in scenario_name:
-        return 'New'
-    return 'Other'
-
-
-def create_algorithm_performance_by_category(df, output_dir='visualizations'):
+def create_algorithm_performance_by_category(data, output_dir='visualizations', profile=None):
     """
     Algorithm performance comparison across scenario categories.
     Grouped bar chart showing mean composite performance scores.
+
+    data may be ResultAggregates or a raw results DataFrame (as for every
+    aggregate chart below).
     """
     print("\n📊 Generating Algorithm Performance Comparison...")
 
-    df['Category'] = df['Scenario'].apply(categorize_scenario)
-    perf_data = df.groupby(['Algorithm', 'Category'])['Composite Performance Score (%)'].mean().reset_index()
+    agg = ResultAggregates.coerce(data)
+    perf_data = agg.mean(['Algorithm', 'Category'], 'Composite Performance Score (%)')
 
     fig, ax = plt.subplots(figsize=(14, 8))
 
-    categories = ['Basic', 'Challenge', 'Extreme', 'Advanced', 'New']
-    algorithms = df['Algorithm'].unique()
+    categories = CATEGORIES
+    algorithms = agg.algorithms
 
     x = np.arange(len(categories))
     width = 0.12
     multiplier = 0
 
     for algorithm in algorithms:
-        alg_data = perf_data[perf_data['Algorithm'] == algorithm]
-        values = [alg_data[alg_data['Category'] == cat]['Composite Performance Score (%)'].values[0]
-                  if len(alg_data[alg_data['Category'] == cat]) > 0 else 0
-                  for cat in categories]
+        values = [perf_data.get((algorithm, cat), 0) for cat in categories]
 
         offset = width * multiplier
         bars = ax.bar(x + offset, values, width,
@@ -258,29 +565,30 @@ def create_algorithm_performance_by_category(df, output_dir='visualizations'):
 
     plt.tight_layout()
     output_path = Path(output_dir) / 'algorithm_performance_by_category.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    save_figure(plt.gcf(), output_path, get_render_profile(profile))
     plt.close()
     print(f"   ✅ Saved: {output_path}")
 
 
-def create_alpha_sensitivity_clean(df, output_dir='visualizations'):
+def create_alpha_sensitivity_clean(data, output_dir='visualizations', profile=None):
     """
     DPE alpha sensitivity analysis showing threshold effect on low-priority success rates.
     """
     print("\n📊 Generating Alpha Sensitivity Analysis...")
 
-    dpe_data = df[df['Algorithm'].str.contains('DPE')].copy()
-    dpe_data['Alpha'] = dpe_data['Algorithm'].str.extract(r'α=(\d\.\d)')[0].astype(float)
-    dpe_data['Category'] = dpe_data['Scenario'].apply(categorize_scenario)
+    agg = ResultAggregates.coerce(data)
+    dpe_data = agg.where(agg.table['Algorithm'].str.contains('DPE') & agg.table['Alpha'].notna())
+    by_category = dpe_data.mean(['Category', 'Alpha'], 'Low Success Rate (%)')
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
     # Panel 1: By Category
-    categories = ['Basic', 'Challenge', 'Extreme', 'Advanced', 'New']
+    categories = CATEGORIES
     colors_cat = ['#2E86AB', '#E63946', '#F77F00', '#7209B7', '#06A77D']
 
     for category, color in zip(categories, colors_cat):
-        cat_data = dpe_data[dpe_data['Category'] == category].groupby('Alpha')['Low Success Rate (%)'].mean()
+        in_category = by_category.index.get_level_values('Category') == category
+        cat_data = by_category[in_category].droplevel('Category')
         if len(cat_data) > 0:
             ax1.plot(cat_data.index, cat_data.values, marker='o', markersize=8,
                     linewidth=2.5, label=category, color=color)
@@ -296,7 +604,10 @@ def create_alpha_sensitivity_clean(df, output_dir='visualizations'):
     ax1.legend(loc='lower left', fontsize=9)
 
     # Panel 2: Overall Trend
-    overall = dpe_data.groupby('Alpha')['Low Success Rate (%)'].agg(['mean', 'std']).reset_index()
+    overall = pd.DataFrame({
+        'mean': dpe_data.mean(['Alpha'], 'Low Success Rate (%)'),
+        'std': dpe_data.std(['Alpha'], 'Low Success Rate (%)'),
+    }).rename_axis('Alpha').reset_index()
     ax2.plot(overall['Alpha'], overall['mean'], marker='o', markersize=10,
             linewidth=3, color='#2E86AB', label='Mean')
     ax2.fill_between(overall['Alpha'],
@@ -316,26 +627,22 @@ def create_alpha_sensitivity_clean(df, output_dir='visualizations'):
 
     plt.tight_layout()
     output_path = Path(output_dir) / 'alpha_sensitivity_clean.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    save_figure(plt.gcf(), output_path, get_render_profile(profile))
     plt.close()
     print(f"   ✅ Saved: {output_path}")
 
 
-def create_performance_heatmap_clean(df, output_dir='visualizations'):
+def create_performance_heatmap_clean(data, output_dir='visualizations', profile=None):
     """
     Performance heatmap showing composite performance scores (Scenario × Algorithm).
     """
     print("\n📊 Generating Performance Heatmap...")
 
-    pivot_data = df.pivot_table(
-        values='Composite Performance Score (%)',
-        index='Scenario',
-        columns='Algorithm',
-        aggfunc='mean'
-    )
+    agg = ResultAggregates.coerce(data)
+    pivot_data = agg.mean(['Scenario', 'Algorithm'], 'Composite Performance Score (%)').unstack()
 
     algorithm_order = ['SPT', 'EDF', 'Priority-First', 'DPE (α=0.3)', 'DPE (α=0.5)', 'DPE (α=0.7)', 'DPE (α=0.9)']
-    pivot_data = pivot_data[algorithm_order]
+    pivot_data = pivot_data[[a for a in algorithm_order if a in pivot_data.columns]]
 
     fig, ax = plt.subplots(figsize=(14, 16))
 
@@ -352,21 +659,22 @@ def create_performance_heatmap_clean(df, output_dir='visualizations'):
 
     plt.tight_layout()
     output_path = Path(output_dir) / 'performance_heatmap_clean.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    save_figure(plt.gcf(), output_path, get_render_profile(profile))
     plt.close()
     print(f"   ✅ Saved: {output_path}")
 
 
-def create_success_rate_by_priority(df, output_dir='visualizations'):
+def create_success_rate_by_priority(data, output_dir='visualizations', profile=None):
     """
     Success rate comparison for high vs low priority tasks by algorithm.
     """
     print("\n📊 Generating Success Rate by Priority...")
 
-    priority_data = df.groupby('Algorithm').agg({
-        'High Success Rate (%)': 'mean',
-        'Low Success Rate (%)': 'mean'
-    }).reset_index()
+    agg = ResultAggregates.coerce(data)
+    priority_data = pd.concat([
+        agg.mean(['Algorithm'], 'High Success Rate (%)'),
+        agg.mean(['Algorithm'], 'Low Success Rate (%)'),
+    ], axis=1).reset_index()
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
@@ -398,22 +706,23 @@ def create_success_rate_by_priority(df, output_dir='visualizations'):
 
     plt.tight_layout()
     output_path = Path(output_dir) / 'success_rate_by_priority.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    save_figure(plt.gcf(), output_path, get_render_profile(profile))
     plt.close()
     print(f"   ✅ Saved: {output_path}")
 
 
-def create_pareto_frontier_clean(df, output_dir='visualizations'):
+def create_pareto_frontier_clean(data, output_dir='visualizations', profile=None):
     """
     Pareto frontier analysis: Fairness vs Efficiency trade-off.
     """
     print("\n📊 Generating Pareto Frontier...")
 
-    pareto_data = df.groupby('Algorithm').agg({
-        'High Success Rate (%)': 'mean',
-        'Low Success Rate (%)': 'mean',
-        'Makespan': 'mean'
-    }).reset_index()
+    agg = ResultAggregates.coerce(data)
+    pareto_data = pd.concat([
+        agg.mean(['Algorithm'], 'High Success Rate (%)'),
+        agg.mean(['Algorithm'], 'Low Success Rate (%)'),
+        agg.mean(['Algorithm'], 'Makespan'),
+    ], axis=1).reset_index()
 
     pareto_data['Fairness'] = pareto_data['Low Success Rate (%)']
     pareto_data['Efficiency'] = pareto_data['High Success Rate (%)']
@@ -445,78 +754,261 @@ def create_pareto_frontier_clean(df, output_dir='visualizations'):
 
     plt.tight_layout()
     output_path = Path(output_dir) / 'pareto_frontier_clean.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    save_figure(plt.gcf(), output_path, get_render_profile(profile))
     plt.close()
     print(f"   ✅ Saved: {output_path}")
 
 
-def generate_all_gantt_charts(output_dir='visualizations'):
+# Algorithms shown in the per-scenario Gantt chart set
+GANTT_ALGORITHMS = [
+    "SPT",
+    "EDF",
+    "Priority-First",
+    "DPE (α=0.3)",
+    "DPE (α=0.5)",
+    "DPE (α=0.7)",
+    "DPE (α=0.9)",
+]
+
+# Figure reused by every chart a render worker draws
+_worker_figure = None
+
+
+def _init_render_worker():
+    """Process-pool initializer: render headless with the Agg backend."""
+    plt.switch_backend('Agg')
+
+
+def _render_gantt_job(job):
+    """
+    Save one scenario × algorithm Gantt chart.
+
+    Runs inside a render worker. Jobs carrying a stored schedule are drawn
+    directly; otherwise the scenario is simulated first. Algorithms travel
+    by name because the registry's DPE factories are lambdas and cannot be
+    pickled.
+
+    Returns:
+        (scenario name, algorithm name, seconds spent on this chart)
+    """
+    global _worker_figure
+    output_dir, scenario, algo_name, tasks, profile = job
+    started = time.perf_counter()
+
+    if _worker_figure is None:
+        _worker_figure = plt.figure()
+
+    if tasks is None:
+        tasks = fresh_tasks(scenario['tasks'])
+        scheduler = get_all_algorithms()[algo_name](tasks, scenario['num_machines'])
+        scheduler.run()
+
+    SchedulingVisualizer(output_dir=output_dir).create_gantt_chart(
+        tasks,
+        algo_name,
+        scenario['name'],
+        num_machines=scenario['num_machines'],
+        save=True,
+        fig=_worker_figure,
+        profile=profile
+    )
+    return scenario['name'], algo_name, time.perf_counter() - started
+
+
+def print_render_summary(timings, wall_time, workers):
+    """Print chart count, wall time and per-chart render statistics."""
+    if not timings:
+        print("\nNo charts rendered")
+        return
+    chart_times = [seconds for _, _, seconds in timings]
+    busy = sum(chart_times)
+    slowest = max(timings, key=lambda t: t[2])
+
+    print(f"\n✅ Total Gantt charts generated: {len(timings)}")
+    print(f"   Workers: {workers}")
+    print(f"   Wall time: {wall_time:.2f}s ({len(timings) / wall_time:.1f} charts/s)")
+    print(f"   Per chart: mean {busy / len(timings) * 1000:.0f}ms, "
+          f"max {slowest[2] * 1000:.0f}ms ({slowest[1]} / {slowest[0]})")
+    print(f"   Render time across workers: {busy:.2f}s ({busy / wall_time:.2f}x wall time)")
+
+
+def chart_files(chart, profile):
+    """File names a chart is written to under a profile, one per format."""
+    return [str(Path(chart).with_suffix(f'.{fmt}')) for fmt in profile.formats]
+
+
+def gantt_fingerprint(scenario, algo_name, stored=None, profile=None):
+    """
+    Fingerprint of everything a scenario × algorithm Gantt chart depends on.
+
+    With a stored schedule the chart depends only on that schedule, so it is
+    fingerprinted directly; otherwise on the scenario inputs and algorithm.
+    The render profile (DPI, cropping, styling) is always included.
+    """
+    profile = get_render_profile(profile)
+    if stored is not None:
+        return fingerprint('gantt', PLOT_VERSION, asdict(profile),
+                           stored['num_machines'], schedule_signature(stored['tasks']))
+    scheduler = get_all_algorithms()[algo_name]([], scenario['num_machines'])
+    return fingerprint('gantt', PLOT_VERSION, asdict(profile),
+                       task_signature(scenario['tasks']),
+                       scheduler_signature(scheduler))
+
+
+def generate_all_gantt_charts(output_dir='visualizations', workers=None, force=False,
+                              schedules_csv='results/comprehensive_results_schedules.csv',
+                              profile=None):
     """
     Generate Gantt charts for all scenarios and algorithms.
     Total: 24 scenarios × 7 algorithms = 168 charts
+
+    Charts are rendered by a process pool pinned to the Agg backend, one job
+    per chart, with each worker reusing a single figure. Charts whose inputs
+    match the fingerprint recorded in the output directory's manifest are
+    skipped.
+
+    Schedules saved by the experiment runner are drawn as stored; only
+    pairs missing from the schedule file are simulated.
+
+    Args:
+        output_dir: Directory for the PNG files
+        workers: Number of render processes (default: CPU count;
+            1 renders in the current process)
+        force: Redraw every chart regardless of the manifest
+        schedules_csv: Schedule file written by ExperimentRunner.export_to_csv()
+            (ignored if it does not exist)
+        profile: RenderProfile or profile name ('publication', 'draft')
+
+    Returns:
+        List of (scenario, algorithm, seconds) per rendered chart
     """
     print("\n" + "=" * 80)
     print("GENERATING ALL GANTT CHARTS")
     print("=" * 80)
 
-    viz = SchedulingVisualizer(output_dir=output_dir)
-    scenarios = get_all_scenarios()
-    algorithms_dict = get_all_algorithms()
-
-    algorithms = [
-        ("SPT", algorithms_dict['SPT']),
-        ("EDF", algorithms_dict['EDF']),
-        ("Priority-First", algorithms_dict['Priority-First']),
-        ("DPE (α=0.3)", algorithms_dict['DPE (α=0.3)']),
-        ("DPE (α=0.5)", algorithms_dict['DPE (α=0.5)']),
-        ("DPE (α=0.7)", algorithms_dict['DPE (α=0.7)']),
-        ("DPE (α=0.9)", algorithms_dict['DPE (α=0.9)']),
-    ]
-
-    total_charts = 0
-
-    for i, scenario in enumerate(scenarios, 1):
-        scenario_name = scenario['name']
-        print(f"\n{i}. {scenario_name}")
-
-        for algo_name, SchedulerClass in algorithms:
-            tasks_copy = copy.deepcopy(scenario['tasks'])
-            scheduler = SchedulerClass(tasks_copy, scenario['num_machines'])
-            scheduler.run()
-
-            viz.create_gantt_chart(
-                tasks_copy,
-                algo_name,
-                scenario_name,
-                num_machines=scenario['num_machines'],
-                save=True
-            )
-            total_charts += 1
-
-        print(f"   ✅ Generated 7 charts")
+    SchedulingVisualizer(output_dir=output_dir)  # Ensure output directory exists
+    profile = get_render_profile(profile)
+    workers = workers or os.cpu_count() or 1
+    manifest = ChartManifest(output_dir)
+    stored = load_schedules(schedules_csv) if schedules_csv and Path(schedules_csv).exists() else {}
+
+    jobs = []
+    pending = {}
+    skipped = 0
+    simulated = 0
+    for scenario in get_all_scenarios():
+        for algo_name in GANTT_ALGORITHMS:
+            schedule = stored.get((scenario['name'], algo_name))
+            files = chart_files(SchedulingVisualizer.gantt_filename(algo_name, scenario['name']), profile)
+            fp = gantt_fingerprint(scenario, algo_name, schedule, profile)
+            if not force and all(manifest.is_current(f, fp) for f in files):
+                skipped += 1
+                continue
+            pending[(scenario['name'], algo_name)] = (files, fp)
+            if schedule is None:
+                simulated += 1
+                jobs.append((output_dir, scenario, algo_name, None, profile))
+            else:
+                jobs.append((output_dir, dict(scenario, num_machines=schedule['num_machines']),
+                             algo_name, schedule['tasks'], profile))
+
+    started = time.perf_counter()
+    if not jobs:
+        timings = []
+    elif workers == 1:
+        _init_render_worker()
+        timings = [_render_gantt_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_render_worker) as pool:
+            timings = list(pool.map(_render_gantt_job, jobs,
+                                    chunksize=max(1, len(jobs) // (workers * 4))))
+    wall_time = time.perf_counter() - started
+
+    for scenario_name, algo_name, _ in timings:
+        files, fp = pending[(scenario_name, algo_name)]
+        for f in files:
+            manifest.record(f, fp)
+    manifest.save()
+
+    if skipped:
+        print(f"\n⏭️  Skipped {skipped} unchanged Gantt charts")
+    if jobs:
+        print(f"\n📅 {len(jobs) - simulated} charts drawn from stored schedules, {simulated} simulated")
+    print_render_summary(timings, wall_time, workers)
+    return timings
+
+
+# Aggregate charts: output file name → drawing function
+AGGREGATE_CHARTS = {
+    'algorithm_performance_by_category.png': create_algorithm_performance_by_category,
+    'alpha_sensitivity_clean.png': create_alpha_sensitivity_clean,
+    'performance_heatmap_clean.png': create_performance_heatmap_clean,
+    'success_rate_by_priority.png': create_success_rate_by_priority,
+    'pareto_frontier_clean.png': create_pareto_frontier_clean,
+}
 
-    print(f"\n✅ Total Gantt charts generated: {total_charts}")
+# Aggregate chart → chart type toggled in config.yaml's visualization.charts
+AGGREGATE_CHART_TYPES = {
+    'algorithm_performance_by_category.png': 'performance_comparison',
+    'alpha_sensitivity_clean.png': 'alpha_sensitivity',
+    'performance_heatmap_clean.png': 'heatmap',
+    'success_rate_by_priority.png': 'performance_comparison',
+    'pareto_frontier_clean.png': 'pareto_frontier',
+}
 
 
 def generate_all_aggregate_visualizations(csv_path='results/comprehensive_results.csv',
-                                          output_dir='visualizations'):
+                                          output_dir='visualizations', force=False,
+                                          profile=None, chart_types=None):
     """
     Generate all aggregate analysis visualizations from experimental results.
+
+    Charts already rendered from an identical results file (same content
+    hash, plotting version and render profile) are skipped unless force is set.
+
+    chart_types limits generation to charts of those AGGREGATE_CHART_TYPES
+    (default: all).
     """
     print("\n" + "=" * 80)
     print("GENERATING AGGREGATE VISUALIZATIONS")
     print("=" * 80)
 
-    df = load_results_data(csv_path)
-    if df is None:
+    if not Path(csv_path).exists():
+        print(f"❌ File not found: {csv_path}")
         return
 
-    create_algorithm_performance_by_category(df, output_dir)
-    create_alpha_sensitivity_clean(df, output_dir)
-    create_performance_heatmap_clean(df, output_dir)
-    create_success_rate_by_priority(df, output_dir)
-    create_pareto_frontier_clean(df, output_dir)
+    profile = get_render_profile(profile)
+    manifest = ChartManifest(output_dir)
+    data_digest = file_digest(csv_path)
+    stale = {}
+    selected = [chart for chart in AGGREGATE_CHARTS
+                if chart_types is None or AGGREGATE_CHART_TYPES[chart] in chart_types]
+    for chart in selected:
+        fp = fingerprint('aggregate', chart, PLOT_VERSION, asdict(profile), data_digest)
+        if force or not all(manifest.is_current(f, fp) for f in chart_files(chart, profile)):
+            stale[chart] = fp
+
+    if not stale:
+        print("⏭️  All aggregate charts are up to date")
+        return
 
+    started = time.perf_counter()
+    agg = ResultAggregates.from_csv(csv_path)
+    source = "cached aggregates" if agg.from_cache else "one chunked pass"
+    print(f"✅ Aggregated {agg.total_rows} experimental results into {len(agg.table)} groups "
+          f"({source}, {time.perf_counter() - started:.2f}s)")
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    for chart, fp in stale.items():
+        AGGREGATE_CHARTS[chart](agg, output_dir, profile)
+        for f in chart_files(chart, profile):
+            manifest.record(f, fp)
+    manifest.save()
+
+    skipped = len(selected) - len(stale)
+    if skipped:
+        print(f"\n⏭️  Skipped {skipped} unchanged aggregate charts")
     print("\n✅ All aggregate visualizations generated!")
 
 
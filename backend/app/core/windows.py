@@ -0,0 +1,197 @@
+"""
+Windowed Online Metrics
+=======================
+
+Aggregators that follow a running simulation and report how completion
+throughput, deadline-hit rate (overall and per priority) and mean lateness
+evolve over time, e.g. to see whether DPE starves LOW tasks after a burst.
+
+- TumblingWindowAggregator: consecutive, non-overlapping windows
+- SlidingWindowAggregator: a window of fixed width sampled at a fixed step
+
+Both are SimulationListeners updated on every COMPLETION in O(1) amortized
+time. Closed windows are appended to `windows`, passed to an optional
+`on_window` callback as they close (for streaming), exported by
+get_results(), and stored as an extra table when a TraceWriter is attached
+to the same scheduler.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .simulator import SimulationListener, Task, Machine, Scheduler, Priority
+
+WindowCallback = Callable[[Dict[str, Any]], None]
+
+# Column order for window rows (and the trace table dtype)
+WINDOW_FIELDS = [
+    ('start', '<f8'),
+    ('end', '<f8'),
+    ('completions', '<i8'),
+    ('throughput', '<f8'),
+    ('deadline_hit_ratio', '<f8'),
+    ('high_completions', '<i8'),
+    ('high_hit_ratio', '<f8'),
+    ('low_completions', '<i8'),
+    ('low_hit_ratio', '<f8'),
+    ('mean_lateness', '<f8'),
+]
+
+
+class _WindowStats:
+    """Running counts for one window; supports both adding and removing samples."""
+
+    def __init__(self) -> None:
+        self.completions = {p: 0 for p in Priority}
+        self.hits = {p: 0 for p in Priority}
+        self.lateness_sum = 0.0
+
+    def add(self, priority: Priority, met: bool, lateness: float) -> None:
+        self.completions[priority] += 1
+        self.hits[priority] += met
+        self.lateness_sum += lateness
+
+    def remove(self, priority: Priority, met: bool, lateness: float) -> None:
+        self.completions[priority] -= 1
+        self.hits[priority] -= met
+        self.lateness_sum -= lateness
+
+    def row(self, start: float, end: float) -> Dict[str, Any]:
+        def ratio(hits: int, total: int) -> Optional[float]:
+            return hits / total if total else None
+
+        total = sum(self.completions.values())
+        high, low = Priority.HIGH, Priority.LOW
+        return {
+            'start': start,
+            'end': end,
+            'completions': total,
+            'throughput': total / (end - start) if end > start else 0.0,
+            'deadline_hit_ratio': ratio(sum(self.hits.values()), total),
+            'high_completions': self.completions[high],
+            'high_hit_ratio': ratio(self.hits[high], self.completions[high]),
+            'low_completions': self.completions[low],
+            'low_hit_ratio': ratio(self.hits[low], self.completions[low]),
+            'mean_lateness': self.lateness_sum / total if total else None,
+        }
+
+
+class _WindowAggregator(SimulationListener):
+    """Shared plumbing: window storage, callbacks and export."""
+
+    def __init__(self, width: float, on_window: Optional[WindowCallback] = None) -> None:
+        if width <= 0:
+            raise ValueError("Window width must be positive")
+        self.width = width
+        self.on_window = on_window
+        self.windows: List[Dict[str, Any]] = []
+
+    def _emit(self, row: Dict[str, Any]) -> None:
+        self.windows.append(row)
+        if self.on_window is not None:
+            self.on_window(row)
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        return list(self.windows)
+
+    def to_array(self):
+        """Windows as a NumPy structured array (missing ratios become NaN)."""
+        import numpy as np
+
+        table = np.empty(len(self.windows), dtype=np.dtype(WINDOW_FIELDS))
+        for i, row in enumerate(self.windows):
+            table[i] = tuple(np.nan if row[name] is None else row[name]
+                             for name, _ in WINDOW_FIELDS)
+        return table
+
+
+class TumblingWindowAggregator(_WindowAggregator):
+    """
+    Metrics over consecutive windows [k * width, (k + 1) * width).
+
+    Windows without completions are still emitted so the series has no gaps.
+
+    Attributes:
+        width: Window width in simulation time units
+        windows: Closed windows, oldest first
+    """
+
+    result_key = 'tumbling_windows'
+    trace_table = 'tumbling_windows'
+
+    def __init__(self, width: float, on_window: Optional[WindowCallback] = None) -> None:
+        super().__init__(width, on_window)
+        self._index = 0
+        self._stats = _WindowStats()
+
+    def on_event(self, event_type: str, time: float, task: Task,
+                 machine: Optional[Machine] = None) -> None:
+        if event_type != 'COMPLETION':
+            return
+        while time >= (self._index + 1) * self.width:
+            self._close_window()
+        self._stats.add(task.priority, time <= task.deadline, time - task.deadline)
+
+    def on_finish(self, scheduler: Scheduler) -> None:
+        # Flush the window holding the last completion (still open by construction)
+        self._close_window()
+
+    def _close_window(self) -> None:
+        start = self._index * self.width
+        self._emit(self._stats.row(start, start + self.width))
+        self._index += 1
+        self._stats = _WindowStats()
+
+
+class SlidingWindowAggregator(_WindowAggregator):
+    """
+    Metrics over the trailing window [t - width, t), sampled every `step`.
+
+    Completions are kept in a deque with running sums; each one is added and
+    evicted exactly once, so updates are O(1) amortized.
+
+    Attributes:
+        width: Window width in simulation time units
+        step: Sampling interval (defaults to width / 4)
+        windows: Samples, oldest first
+    """
+
+    result_key = 'sliding_windows'
+    trace_table = 'sliding_windows'
+
+    def __init__(self, width: float, step: Optional[float] = None,
+                 on_window: Optional[WindowCallback] = None) -> None:
+        super().__init__(width, on_window)
+        self.step = step if step is not None else width / 4
+        if self.step <= 0:
+            raise ValueError("Sampling step must be positive")
+        self._next_sample = self.step
+        self._entries: Deque[Tuple[float, Priority, bool, float]] = deque()
+        self._stats = _WindowStats()
+
+    def on_event(self, event_type: str, time: float, task: Task,
+                 machine: Optional[Machine] = None) -> None:
+        if event_type != 'COMPLETION':
+            return
+        self._sample_until(time)
+        entry = (time, task.priority, time <= task.deadline, time - task.deadline)
+        self._entries.append(entry)
+        self._stats.add(*entry[1:])
+
+    def on_finish(self, scheduler: Scheduler) -> None:
+        self._sample_until(scheduler.current_time)
+        # Final sample, covering completions at the very end of the run
+        self._sample_until(self._next_sample)
+
+    def _sample_until(self, time: float) -> None:
+        """Emit every sample whose window closes at or before time."""
+        while self._next_sample <= time:
+            self._evict(self._next_sample)
+            self._emit(self._stats.row(self._next_sample - self.width, self._next_sample))
+            self._next_sample += self.step
+
+    def _evict(self, end: float) -> None:
+        start = end - self.width
+        while self._entries and self._entries[0][0] < start:
+            _, priority, met, lateness = self._entries.popleft()
+            self._stats.remove(priority, met, lateness)
@@ -1,11 +1,21 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api import routes
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the Gantt render worker process
+    routes.gantt_renderer.shutdown()
+
+
 app = FastAPI(
     title="Scheduling Simulator API",
     description="API for Real-Time Scheduling Research Toolkit",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
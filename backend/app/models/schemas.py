@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -20,6 +20,8 @@ class SimulationRequest(BaseModel):
     num_machines: int
     tasks: List[TaskInput]
     alpha: Optional[float] = 0.7  # For DPE
+    timelines: bool = False  # Record utilization/backlog curves during the run
+    timeline_bucket_width: Optional[float] = Field(None, gt=0)  # Downsample curves to fixed buckets
 
 class LogEntry(BaseModel):
     time: float
@@ -39,11 +41,16 @@ class TaskResult(BaseModel):
     meets_deadline: bool
     cpu_required: int
     ram_required: int
+    machine_id: Optional[int] = None
 
 class PriorityStats(BaseModel):
     total: int
     met_deadline: int
 
+class TimelineSeries(BaseModel):
+    times: List[float]
+    values: List[float]
+
 class SimulationResult(BaseModel):
     makespan: float
     total_tasks: int
@@ -51,6 +58,74 @@ class SimulationResult(BaseModel):
     low_priority_stats: PriorityStats
     tasks: List[TaskResult]
     logs: List[LogEntry]
+    timelines: Optional[Dict[str, TimelineSeries]] = None
+    # {priority class or 'ALL': {metric: {'count', 'mean', 'max', 'p50', 'p95', 'p99'}}}
+    latency_percentiles: Optional[Dict[str, Dict[str, Dict[str, Optional[float]]]]] = None
+
+class TimelineRequest(SimulationRequest):
+    start: Optional[float] = None  # Defaults to schedule start
+    end: Optional[float] = None  # Defaults to makespan
+    machine_id: Optional[int] = None
+    buckets: int = Field(100, ge=1, le=10_000)  # Utilization curve resolution
+
+class UtilizationBucket(BaseModel):
+    start: float
+    end: float
+    utilization: float
+
+class TimelineWindow(BaseModel):
+    start: float
+    end: float
+    num_machines: int
+    tasks: List[TaskResult]
+    utilization: List[UtilizationBucket]
+
+class WindowMode(str, Enum):
+    TUMBLING = "tumbling"
+    SLIDING = "sliding"
+
+class WindowedMetricsRequest(SimulationRequest):
+    window_width: float
+    mode: WindowMode = WindowMode.TUMBLING
+    step: Optional[float] = None  # Sliding windows only; defaults to width / 4
+
+class GanttFormat(str, Enum):
+    PNG = "png"
+    SVG = "svg"
+    PDF = "pdf"
+
+class RenderProfileName(str, Enum):
+    PUBLICATION = "publication"
+    DRAFT = "draft"  # Low DPI, no tight bbox, simplified styling
+
+class GanttMode(str, Enum):
+    AUTO = "auto"
+    PATCHES = "patches"
+    COLLECTIONS = "collections"
+    LOD = "lod"
+
+class GanttRequest(SimulationRequest):
+    format: GanttFormat = GanttFormat.PNG
+    mode: GanttMode = GanttMode.AUTO
+    profile: RenderProfileName = RenderProfileName.PUBLICATION
+    title: str = "Custom"  # Scenario label shown in the chart title
+    start: Optional[float] = None  # Zoom window; defaults to the whole schedule
+    end: Optional[float] = None
+
+class ObjectiveSense(str, Enum):
+    MAX = "max"
+    MIN = "min"
+
+class ParetoRequest(BaseModel):
+    # Result rows to filter; defaults to the experiment runner's stored results
+    rows: Optional[List[Dict[str, Any]]] = None
+    # Column → direction; defaults to success rate, makespan, high-priority success, p99 response time
+    objectives: Optional[Dict[str, ObjectiveSense]] = None
+
+class ParetoResult(BaseModel):
+    objectives: Dict[str, ObjectiveSense]
+    total: int
+    frontier: List[Dict[str, Any]]
 
 class AlgorithmInfo(BaseModel):
     id: str
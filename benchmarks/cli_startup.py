@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+=====================
+
+Wall-clock time of short pyschedule_cli.py invocations, each in a fresh
+interpreter, next to the bare interpreter start-up they cannot go below.
+
+Usage:
+    python benchmarks/cli_startup.py
+    python benchmarks/cli_startup.py --runs 50 --budget-ms 150
+    python benchmarks/cli_startup.py --importtime "list algorithms"
+
+Exits with status 1 if any command's median exceeds --budget-ms.
+"""
+
+import argparse
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = str(ROOT / 'pyschedule_cli.py')
+
+COMMANDS = [
+    'list algorithms',
+    'list scenarios',
+    '--help',
+]
+
+
+def time_command(argv, runs):
+    """Median and minimum wall time (ms) of running argv runs times."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def print_importtime(command, top=15):
+    """Slowest imports (cumulative µs) of one CLI invocation, via -X importtime."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', CLI, *shlex.split(command)],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line and 'cumulative' not in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            rows.append((int(cumulative), name.rstrip()))
+    print(f"\nSlowest imports for '{command}':")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pyschedule_cli.py start-up time")
+    parser.add_argument('--runs', type=int, default=20, help='Invocations per command (default: 20)')
+    parser.add_argument('--budget-ms', type=float, default=150.0,
+                        help='Fail if a median exceeds this (default: 150)')
+    parser.add_argument('--importtime', metavar='COMMAND', default=None,
+                        help='Also list the slowest imports of one command')
+    args = parser.parse_args()
+
+    base_median, base_min = time_command([sys.executable, '-c', 'pass'], args.runs)
+    print(f"{'command':<24} {'median ms':>10} {'min ms':>8} {'over python':>12}")
+    print(f"{'(python -c pass)':<24} {base_median:>10.1f} {base_min:>8.1f} {'':>12}")
+
+    over_budget = []
+    for command in COMMANDS:
+        median, fastest = time_command([sys.executable, CLI, *shlex.split(command)], args.runs)
+        print(f"{command:<24} {median:>10.1f} {fastest:>8.1f} {median - base_median:>+12.1f}")
+        if median > args.budget_ms:
+            over_budget.append(command)
+
+    if args.importtime:
+        print_importtime(args.importtime)
+
+    if over_budget:
+        print(f"\nOver the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,6 +17,8 @@ export interface SimulationRequest {
     num_machines: number;
     tasks: TaskInput[];
     alpha?: number;
+    timelines?: boolean;
+    timeline_bucket_width?: number;
 }
 
 export interface LogEntry {
@@ -38,6 +40,7 @@ export interface TaskResult {
     meets_deadline: boolean;
     cpu_required: number;
     ram_required: number;
+    machine_id?: number | null;
 }
 
 export interface PriorityStats {
@@ -45,6 +48,11 @@ export interface PriorityStats {
     met_deadline: number;
 }
 
+export interface TimelineSeries {
+    times: number[];
+    values: number[];
+}
+
 export interface SimulationResult {
     makespan: number;
     total_tasks: number;
@@ -52,6 +60,68 @@ export interface SimulationResult {
     low_priority_stats: PriorityStats;
     tasks: TaskResult[];
     logs: LogEntry[];
+    timelines?: Record<string, TimelineSeries> | null;
+    latency_percentiles?: Record<string, Record<string, Record<string, number | null>>> | null;
+}
+
+export interface TimelineRequest extends SimulationRequest {
+    start?: number;
+    end?: number;
+    machine_id?: number;
+    buckets?: number;
+}
+
+export interface UtilizationBucket {
+    start: number;
+    end: number;
+    utilization: number;
+}
+
+export interface TimelineWindow {
+    start: number;
+    end: number;
+    num_machines: number;
+    tasks: TaskResult[];
+    utilization: UtilizationBucket[];
+}
+
+export interface WindowedMetricsRequest extends SimulationRequest {
+    window_width: number;
+    mode?: 'tumbling' | 'sliding';
+    step?: number;
+}
+
+export interface WindowRow {
+    start: number;
+    end: number;
+    completions: number;
+    throughput: number;
+    deadline_hit_ratio: number | null;
+    high_completions: number;
+    high_hit_ratio: number | null;
+    low_completions: number;
+    low_hit_ratio: number | null;
+    mean_lateness: number | null;
+}
+
+export interface GanttRequest extends SimulationRequest {
+    format?: 'png' | 'svg' | 'pdf';
+    mode?: 'auto' | 'patches' | 'collections' | 'lod';
+    profile?: 'publication' | 'draft';
+    title?: string;
+    start?: number;
+    end?: number;
+}
+
+export interface ParetoRequest {
+    rows?: Record<string, string | number>[];
+    objectives?: Record<string, 'max' | 'min'>;
+}
+
+export interface ParetoResult {
+    objectives: Record<string, 'max' | 'min'>;
+    total: number;
+    frontier: Record<string, string | number>[];
 }
 
 export interface AlgorithmInfo {
@@ -80,5 +150,41 @@ export const api = {
     runSimulation: async (data: SimulationRequest) => {
         const response = await axios.post<SimulationResult>(`${API_URL}/simulate`, data);
         return response.data;
+    },
+    getTimeline: async (data: TimelineRequest) => {
+        const response = await axios.post<TimelineWindow>(`${API_URL}/timeline`, data);
+        return response.data;
+    },
+    renderGantt: async (data: GanttRequest) => {
+        const response = await axios.post<Blob>(`${API_URL}/gantt`, data, { responseType: 'blob' });
+        return response.data;
+    },
+    ganttUrl: (scenario: string, algorithm: string, format: 'png' | 'svg' | 'pdf' = 'png',
+               profile: 'publication' | 'draft' = 'publication') =>
+        `${API_URL}/gantt?${new URLSearchParams({ scenario, algorithm, format, profile })}`,
+    getParetoFrontier: async (data: ParetoRequest = {}) => {
+        const response = await axios.post<ParetoResult>(`${API_URL}/pareto`, data);
+        return response.data;
+    },
+    streamWindows: async (data: WindowedMetricsRequest, onWindow: (row: WindowRow) => void) => {
+        const response = await fetch(`${API_URL}/simulate/windows`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(data),
+        });
+        if (!response.ok || !response.body) {
+            throw new Error(`Window stream failed: ${response.status}`);
+        }
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffered = '';
+        for (;;) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffered += decoder.decode(value, { stream: true });
+            const lines = buffered.split('\n');
+            buffered = lines.pop() ?? '';
+            lines.filter(Boolean).forEach((line) => onWindow(JSON.parse(line)));
+        }
     }
 };
@@ -9,6 +9,7 @@ Usage:
     python pyschedule_cli.py run --algorithm SPT --scenario simple_1
     python pyschedule_cli.py list algorithms
     python pyschedule_cli.py analyze results/experiment_results.csv
+    python pyschedule_cli.py visualize --profile draft
 """
 
 import argparse
@@ -20,14 +21,43 @@ from typing import List, Optional
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from simple_simulator import Task, Priority
-from algorithms import get_all_algorithms
-from scenarios import get_all_scenarios
-from runner import ExperimentRunner, run_all_experiments
+# Subcommands import the simulator packages (and pandas / matplotlib) only
+# when they run, so quick commands like `list` start in interpreter time.
+# benchmarks/cli_startup.py measures this; tests/test_cli.py guards it.
+
+
+def resolve_config(config=None, output_dir: Optional[str] = None, workers: Optional[int] = None,
+                   progress: Optional[str] = None):
+    """The run configuration (defaults if None) with command-line overrides applied."""
+    from dataclasses import replace
+    from backend.app.core.config import Config
+
+    config = config or Config()
+    if output_dir:
+        config = replace(config, experiment=replace(config.experiment, output_dir=output_dir))
+    if workers:
+        config = replace(config, experiment=replace(config.experiment, parallel_workers=workers))
+    if progress:
+        config = replace(config, logging=replace(config.logging, progress=progress))
+    return config
+
+
+def load_run_config(path: Optional[str]):
+    """Load and validate config.yaml (or the given file) and apply its logging settings."""
+    from backend.app.core.config import load_config, configure_logging
+
+    try:
+        config = load_config(path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Invalid configuration: {e}")
+        return None
+    configure_logging(config.logging)
+    return config
 
 
 def list_algorithms():
     """List all available scheduling algorithms."""
+    from backend.app.core.algorithms import get_all_algorithms
     algorithms = get_all_algorithms()
 
     print("\n" + "=" * 60)
@@ -53,6 +83,7 @@ def list_algorithms():
 
 def list_scenarios():
     """List all available test scenarios."""
+    from backend.app.core.scenarios import get_all_scenarios
     scenarios = get_all_scenarios()
 
     print("\n" + "=" * 60)
@@ -85,8 +116,15 @@ def list_scenarios():
     print("=" * 60 + "\n")
 
 
-def run_single_experiment(algorithm_name: str, scenario_name: str, output_dir: str = "results"):
+def run_single_experiment(algorithm_name: str, scenario_name: str, output_dir: Optional[str] = None,
+                          trace_dir: Optional[str] = None, config=None):
     """Run a single algorithm/scenario combination."""
+    from backend.app.core.algorithms import get_all_algorithms
+    from backend.app.core.scenarios import get_all_scenarios
+    from backend.app.core.runner import ExperimentRunner
+    from backend.app.core.progress import make_progress
+    config = resolve_config(config, output_dir=output_dir)
+    output_dir = config.experiment.output_dir
     algorithms = get_all_algorithms()
     scenarios = get_all_scenarios()
 
@@ -113,7 +151,7 @@ def run_single_experiment(algorithm_name: str, scenario_name: str, output_dir: s
     print(f"  Output: {output_dir}/")
     print()
 
-    runner = ExperimentRunner()
+    runner = ExperimentRunner(trace_dir=trace_dir, progress=make_progress(config.logging.progress))
     metrics = runner.run_experiment(
         scenario=scenario,
         algorithm_name=algorithm_name,
@@ -123,43 +161,62 @@ def run_single_experiment(algorithm_name: str, scenario_name: str, output_dir: s
     # Export results
     output_file = f"{output_dir}/single_experiment_{algorithm_name}_{scenario_name}.csv"
     runner.export_to_csv(output_file)
+    if config.experiment.database_path:
+        runner.export_to_db(config.experiment.database_path, output_file)
 
     print(f"\n✅ Experiment complete!")
     print(f"Results saved to: {output_file}")
     return 0
 
 
-def run_all(output_dir: str = "results"):
-    """Run all experiments (all algorithms × all scenarios)."""
+def run_all(output_dir: Optional[str] = None, trace_dir: Optional[str] = None, config=None,
+            workers: Optional[int] = None, resume: bool = True):
+    """Run all experiments (configured algorithms × configured scenarios)."""
+    from backend.app.core.runner import run_all_experiments
+    from backend.app.core.scenarios import get_scenarios
+
+    config = resolve_config(config, output_dir=output_dir, workers=workers)
+    scenarios = get_scenarios(list(config.scenarios))
+
     print("\n" + "=" * 60)
     print("RUNNING COMPREHENSIVE EXPERIMENTAL SUITE")
     print("=" * 60)
 
-    algorithms = get_all_algorithms()
-    scenarios = get_all_scenarios()
-
-    print(f"\nConfiguration:")
-    print(f"  Algorithms: {len(algorithms)}")
-    print(f"  Scenarios: {len(scenarios)}")
-    print(f"  Total experiments: {len(algorithms) * len(scenarios)}")
-    print(f"  Output directory: {output_dir}/")
+    print(f"\nConfiguration: {config.source or 'built-in defaults'}")
+    print(f"  Algorithms: {len(config.algorithms)}")
+    print(f"  Scenarios: {len(scenarios)} ({', '.join(config.scenarios)})")
+    print(f"  Total experiments: {len(config.algorithms) * len(scenarios)}")
+    print(f"  Workers: {config.experiment.workers}")
+    print(f"  Output directory: {config.experiment.output_dir}/")
     print()
 
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(config.experiment.output_dir, exist_ok=True)
 
     # Run all experiments
-    run_all_experiments()
+    results_path = run_all_experiments(trace_dir=trace_dir, config=config, resume=resume)
 
     print("\n✅ All experiments complete!")
-    print(f"Results saved to: {output_dir}/comprehensive_results.csv")
+    print(f"Results saved to: {results_path}")
+
+    if config.visualization.enabled:
+        return visualize(results_file=results_path, config=config)
     return 0
 
 
-def run_by_algorithm(algorithm_name: str, output_dir: str = "results"):
-    """Run single algorithm across all scenarios."""
+def run_by_algorithm(algorithm_name: str, output_dir: Optional[str] = None,
+                     trace_dir: Optional[str] = None, config=None, workers: Optional[int] = None,
+                     resume: bool = True):
+    """Run single algorithm across all configured scenarios."""
+    from backend.app.core.algorithms import get_all_algorithms
+    from backend.app.core.scenarios import get_scenarios
+    from backend.app.core.runner import ExperimentRunner
+    from backend.app.core.store import open_journal
+    from backend.app.core.progress import make_progress
+    config = resolve_config(config, output_dir=output_dir, workers=workers)
+    output_dir = config.experiment.output_dir
     algorithms = get_all_algorithms()
-    scenarios = get_all_scenarios()
+    scenarios = get_scenarios(list(config.scenarios))
 
     if algorithm_name not in algorithms:
         print(f"❌ Error: Algorithm '{algorithm_name}' not found.")
@@ -171,26 +228,35 @@ def run_by_algorithm(algorithm_name: str, output_dir: str = "results"):
 
     os.makedirs(output_dir, exist_ok=True)
 
-    runner = ExperimentRunner()
-    for scenario in scenarios:
-        runner.run_experiment(
-            scenario=scenario,
-            algorithm_name=algorithm_name,
-            SchedulerClass=algorithms[algorithm_name]
-        )
+    output_file = f"{output_dir}/{algorithm_name}_all_scenarios.csv"
+    with open_journal(output_file, resume) as store:
+        runner = ExperimentRunner(trace_dir=trace_dir, store=store,
+                                  progress=make_progress(config.logging.progress))
+        runner.run_experiments(scenarios, [algorithm_name], workers=config.experiment.workers)
 
     # Calculate composite scores and export
-    runner.calculate_composite_scores()
-    output_file = f"{output_dir}/{algorithm_name}_all_scenarios.csv"
+    if config.analysis.composite_scores:
+        runner.calculate_composite_scores()
     runner.export_to_csv(output_file)
+    if config.experiment.database_path:
+        runner.export_to_db(config.experiment.database_path, output_file)
 
     print(f"\n✅ {algorithm_name} experiments complete!")
     print(f"Results saved to: {output_file}")
     return 0
 
 
-def run_by_scenario(scenario_name: str, output_dir: str = "results"):
+def run_by_scenario(scenario_name: str, output_dir: Optional[str] = None,
+                    trace_dir: Optional[str] = None, config=None, workers: Optional[int] = None,
+                    resume: bool = True):
     """Run all algorithms on single scenario."""
+    from backend.app.core.algorithms import get_all_algorithms
+    from backend.app.core.scenarios import get_all_scenarios
+    from backend.app.core.runner import ExperimentRunner
+    from backend.app.core.store import open_journal
+    from backend.app.core.progress import make_progress
+    config = resolve_config(config, output_dir=output_dir, workers=workers)
+    output_dir = config.experiment.output_dir
     algorithms = get_all_algorithms()
     scenarios = get_all_scenarios()
 
@@ -204,34 +270,41 @@ def run_by_scenario(scenario_name: str, output_dir: str = "results"):
 
     os.makedirs(output_dir, exist_ok=True)
 
-    runner = ExperimentRunner()
-    for algo_name, algo_class in algorithms.items():
-        runner.run_experiment(
-            scenario=scenario,
-            algorithm_name=algo_name,
-            SchedulerClass=algo_class
-        )
+    output_file = f"{output_dir}/{scenario_name}_all_algorithms.csv"
+    with open_journal(output_file, resume) as store:
+        runner = ExperimentRunner(trace_dir=trace_dir, store=store,
+                                  progress=make_progress(config.logging.progress))
+        runner.run_experiments([scenario], list(algorithms), workers=config.experiment.workers)
 
     # Calculate composite scores and comparison
-    runner.calculate_composite_scores()
-    runner.compare_algorithms()
+    if config.analysis.composite_scores:
+        runner.calculate_composite_scores()
+    if config.analysis.comparison_tables:
+        runner.compare_algorithms()
+    if config.analysis.statistical_tests:
+        runner.print_paired_comparisons()
 
-    output_file = f"{output_dir}/{scenario_name}_all_algorithms.csv"
     runner.export_to_csv(output_file)
+    if config.experiment.database_path:
+        runner.export_to_db(config.experiment.database_path, output_file)
 
     print(f"\n✅ Scenario experiments complete!")
     print(f"Results saved to: {output_file}")
     return 0
 
 
-def analyze_results(results_file: str):
+def analyze_results(results_file: str, pareto: bool = False,
+                    objectives: Optional[List[str]] = None):
     """Analyze and summarize experiment results from CSV."""
-    import pandas as pd
-
     if not os.path.exists(results_file):
         print(f"❌ Error: Results file not found: {results_file}")
         return 1
 
+    if pareto:
+        return print_pareto_frontier(results_file, objectives)
+
+    import pandas as pd
+
     print(f"\n📊 Analyzing results from: {results_file}\n")
 
     df = pd.read_csv(results_file)
@@ -263,6 +336,348 @@ def analyze_results(results_file: str):
     return 0
 
 
+def print_pareto_frontier(results_file: str, objectives: Optional[List[str]] = None):
+    """Print the experiments on the multi-objective Pareto frontier."""
+    from backend.app.core.pareto import DEFAULT_OBJECTIVES, parse_objectives, pareto_frontier
+    from backend.app.core.runner import load_results
+
+    try:
+        chosen = parse_objectives(objectives) if objectives else DEFAULT_OBJECTIVES
+        rows = load_results(results_file)
+        frontier = pareto_frontier(rows, chosen)
+    except (ValueError, KeyError) as e:
+        print(f"❌ Error: Unknown or invalid objective {e}")
+        return 1
+
+    print(f"\n🎯 Pareto frontier: {len(frontier)} of {len(rows)} experiments\n")
+    print("Objectives: " + ", ".join(f"{c} ({d})" for c, d in chosen.items()))
+    print("-" * 70)
+    for row in frontier:
+        values = " | ".join(f"{c}: {row[c]:.2f}" for c in chosen)
+        print(f"  {row['Algorithm']:<20} {row['Scenario']:<30} {values}")
+    print()
+    return 0
+
+
+def visualize(charts: str = "all", results_file: Optional[str] = None,
+              output_dir: Optional[str] = None, profile: str = "publication",
+              formats: Optional[List[str]] = None, dpi: Optional[int] = None,
+              workers: Optional[int] = None, force: bool = False, config=None):
+    """Generate Gantt and/or aggregate charts with a render profile."""
+    from backend.app.core.runner import schedules_path
+    from backend.app.core.visualizer import (
+        generate_all_gantt_charts, generate_all_aggregate_visualizations, get_render_profile
+    )
+
+    # Command-line options win over the profile; config.yaml formats / dpi
+    # only tune the publication profile, so --profile draft stays draft
+    config = resolve_config(config)
+    settings = config.visualization
+    results_file = results_file or config.experiment.results_path
+    output_dir = output_dir or settings.output_dir
+    workers = workers or config.experiment.parallel_workers or None
+    chart_types = settings.charts if charts == 'all' else None
+    if profile == 'publication':
+        formats, dpi = formats or settings.formats, dpi or settings.dpi
+
+    try:
+        render_profile = get_render_profile(profile, formats=formats, dpi=dpi)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    print(f"\n🎨 Rendering charts ({render_profile.name}: {render_profile.dpi} dpi, "
+          f"{', '.join(render_profile.formats)})")
+
+    if charts == 'gantt' or (charts == 'all' and 'gantt' in settings.charts):
+        generate_all_gantt_charts(output_dir, workers=workers, force=force,
+                                  schedules_csv=schedules_path(results_file),
+                                  profile=render_profile)
+    if charts in ('all', 'aggregate'):
+        generate_all_aggregate_visualizations(results_file, output_dir, force=force,
+                                              profile=render_profile, chart_types=chart_types)
+    return 0
+
+
+def bench(sizes: Optional[List[int]] = None, machines: Optional[List[int]] = None,
+          algorithms: Optional[List[str]] = None, repeat: int = 3, load: float = 0.8,
+          seed: int = 0, save: Optional[str] = None, baseline: Optional[str] = None,
+          tolerance: float = 0.15, isolate: bool = True, memory: bool = False):
+    """Benchmark engine throughput (or memory footprint) and optionally check it against a baseline."""
+    from backend.app.core.algorithms import get_all_algorithms
+    from backend.app.core.benchmark import (
+        BENCH_SIZES, BENCH_MACHINES, MEMORY_SIZES, MEMORY_MACHINES,
+        run_suite, save_baseline, load_baseline, compare, compare_memory
+    )
+
+    unknown = [a for a in algorithms or [] if a not in get_all_algorithms()]
+    if unknown:
+        print(f"❌ Error: Algorithm '{unknown[0]}' not found.")
+        print(f"Available algorithms: {', '.join(get_all_algorithms().keys())}")
+        return 1
+
+    kind = 'memory' if memory else 'throughput'
+    sizes = sizes or list(MEMORY_SIZES if memory else BENCH_SIZES)
+    machines = machines or list(MEMORY_MACHINES if memory else BENCH_MACHINES)
+
+    reference = None
+    if baseline:
+        try:
+            reference = load_baseline(baseline, kind=kind)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: Cannot read baseline: {e}")
+            return 1
+
+    if memory:
+        print(f"\n🧠 Measuring memory footprint (tracemalloc): sizes {sizes}, "
+              f"machines {machines}, load {load}\n")
+        print(f"{'Algorithm':<20} {'Tasks':>8} {'Mach':>5} {'Logs':>5} {'B/task':>8} "
+              f"{'B/event':>8} {'B/log':>8} {'B/row':>8} {'Run peak MB':>12}")
+        print("-" * 92)
+
+        def report(r):
+            print(f"{r.algorithm:<20} {r.tasks:>8} {r.machines:>5} "
+                  f"{'on' if r.record_logs else 'off':>5} {r.task_bytes:>8.0f} "
+                  f"{r.event_bytes:>8.0f} {r.log_entry_bytes:>8.0f} {r.result_row_bytes:>8.0f} "
+                  f"{r.run_peak_bytes / 2**20:>12.2f}", flush=True)
+    else:
+        print(f"\n⏱  Benchmarking engine: sizes {sizes}, machines {machines}, "
+              f"load {load}, best of {repeat}\n")
+        print(f"{'Algorithm':<20} {'Tasks':>9} {'Mach':>5} {'Time (s)':>9} "
+              f"{'Events/s':>11} {'µs/dispatch':>12} {'Peak RSS MB':>12}")
+        print("-" * 84)
+
+        def report(r):
+            rss = f"{r.peak_rss_kb / 1024:.1f}" if r.peak_rss_kb is not None else "n/a"
+            print(f"{r.algorithm:<20} {r.tasks:>9} {r.machines:>5} {r.seconds:>9.3f} "
+                  f"{r.events_per_sec:>11.0f} {r.us_per_dispatch:>12.2f} {rss:>12}", flush=True)
+
+    results = run_suite(algorithms, sizes, machines, repeat=repeat, load=load, seed=seed,
+                        isolate=isolate, on_result=report, memory=memory)
+
+    if save:
+        os.makedirs(os.path.dirname(save) or '.', exist_ok=True)
+        save_baseline(results, save, kind=kind, load=load, seed=seed, repeat=repeat)
+        print(f"\n💾 Baseline saved to: {save}")
+
+    if reference is not None:
+        if memory:
+            regressions = compare_memory(results, reference, tolerance)
+            if regressions:
+                print(f"\n❌ {len(regressions)} footprint(s) larger than baseline by more than {tolerance:.0%}:")
+                for r in regressions:
+                    logs = 'logs on' if r['record_logs'] else 'logs off'
+                    print(f"  {r['algorithm']} ({r['tasks']} tasks, {logs}) {r['metric']}: "
+                          f"{r['baseline']:.0f} → {r['current']:.0f} bytes ({r['change']:+.1%})")
+                return 1
+            print(f"\n✅ No footprint growth beyond {tolerance:.0%} versus {baseline}")
+            return 0
+
+        regressions = compare(results, reference, tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} case(s) slower than baseline by more than {tolerance:.0%}:")
+            for r in regressions:
+                print(f"  {r['algorithm']} ({r['tasks']} tasks, {r['machines']} machines): "
+                      f"{r['baseline']:.0f} → {r['current']:.0f} events/s ({r['change']:+.1%})")
+            return 1
+        print(f"\n✅ No throughput regressions beyond {tolerance:.0%} versus {baseline}")
+    return 0
+
+
+def profile(algorithm_name: str, scenario_name: Optional[str] = None,
+            workload: Optional[str] = None, synthetic: Optional[int] = None,
+            machines: Optional[int] = None, top: int = 20, output_dir: str = "results",
+            collapsed: Optional[str] = None, stats_file: Optional[str] = None,
+            record_logs: bool = True):
+    """Profile one simulation and break its time down by engine phase."""
+    from backend.app.core.algorithms import get_all_algorithms
+    from backend.app.core.profiling import profile_run
+    from backend.app.core.runner import safe_filename
+
+    algorithms = get_all_algorithms()
+    if algorithm_name not in algorithms:
+        print(f"❌ Error: Algorithm '{algorithm_name}' not found.")
+        print(f"Available algorithms: {', '.join(algorithms.keys())}")
+        return 1
+
+    if workload:
+        from backend.app.core.scenarios import load_workload
+        try:
+            scenario = load_workload(workload, machines)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: Cannot load workload: {e}")
+            return 1
+    elif synthetic:
+        from backend.app.core.benchmark import synthetic_workload
+        num_machines = machines or 4
+        scenario = {'name': f'Synthetic {synthetic}', 'num_machines': num_machines,
+                    'tasks': synthetic_workload(synthetic, num_machines)}
+    else:
+        from backend.app.core.scenarios import get_all_scenarios
+        scenario = next((s for s in get_all_scenarios() if s['name'] == scenario_name), None)
+        if not scenario:
+            print(f"❌ Error: Scenario '{scenario_name}' not found.")
+            print(f"Use 'pyschedule_cli.py list scenarios' to see available scenarios.")
+            return 1
+        if machines:
+            scenario = dict(scenario, num_machines=machines)
+
+    scheduler = algorithms[algorithm_name](scenario['tasks'], scenario['num_machines'])
+    scheduler.record_logs = record_logs
+
+    print(f"\n🔍 Profiling {algorithm_name} on {scenario['name']} "
+          f"({len(scenario['tasks'])} tasks, {scenario['num_machines']} machines)")
+    report = profile_run(scheduler)
+
+    print(f"\nProfiled time: {report.total * 1000:.1f} ms (cProfile overhead included)\n")
+    print(f"{'Phase':<26} {'ms':>10} {'share':>8}")
+    print("-" * 46)
+    for phase, seconds in sorted(report.phases.items(), key=lambda kv: kv[1], reverse=True):
+        share = seconds / report.total if report.total else 0.0
+        print(f"{phase:<26} {seconds * 1000:>10.1f} {share:>8.1%}")
+
+    print(f"\nTop {top} functions by self time:")
+    print(f"{'Function':<44} {'Calls':>9} {'Self ms':>9} {'Cum ms':>9}  Location")
+    print("-" * 100)
+    for row in report.top(top):
+        print(f"{row['function'][:44]:<44} {row['calls']:>9} {row['tottime'] * 1000:>9.1f} "
+              f"{row['cumtime'] * 1000:>9.1f}  {row['location']}")
+
+    if collapsed is None:
+        collapsed = os.path.join(
+            output_dir, f"profile_{safe_filename(algorithm_name)}_{safe_filename(scenario['name'])}.folded")
+    count = report.write_collapsed(collapsed)
+    print(f"\n🔥 {count} collapsed stacks written to: {collapsed} (flamegraph.pl / speedscope)")
+    if stats_file:
+        report.stats.dump_stats(stats_file)
+        print(f"📈 Raw cProfile stats written to: {stats_file}")
+    return 0
+
+
+def sweep(grid_file: str, output: str = "results/sweep_results.csv", workers: int = 0,
+          resume: bool = True, dry_run: bool = False, config=None):
+    """Run the Cartesian product of a grid spec in parallel, appending rows as they finish."""
+    from backend.app.core.sweep import load_grid, expand_grid, run_sweep, completed_keys, sweep_columns
+    from backend.app.core.progress import make_progress
+
+    try:
+        points = expand_grid(load_grid(grid_file))
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Cannot read grid: {e}")
+        return 1
+
+    try:
+        done = completed_keys(output, sweep_columns(points)) if resume else set()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    pending = sum(1 for p in points if p.key not in done)
+    print(f"\n🧪 Sweep {grid_file}: {len(points)} points, {len(points) - pending} already in {output}, "
+          f"{pending} to run")
+    if dry_run or not pending:
+        return 0
+
+    config = resolve_config(config)
+    progress = make_progress(config.logging.progress)
+    progress.start(pending)
+
+    def report(row, count, total):
+        progress.step(f"{row['Algorithm']} | {row['Machines']} machines | {row['Scenario']}", row)
+
+    try:
+        written = run_sweep(points, output, workers=workers or config.experiment.workers,
+                            resume=resume, on_row=report)
+    except KeyboardInterrupt:
+        print(f"\n⏸ Interrupted; finished points are in {output}. Re-run the same command to resume.")
+        return 130
+    finally:
+        progress.finish()
+    print(f"\n📊 {written} rows appended to: {output}")
+
+    database = config.experiment.database_path
+    if database:
+        from backend.app.core.results_db import ResultsDB
+        os.makedirs(os.path.dirname(database) or '.', exist_ok=True)
+        with ResultsDB(database) as db:
+            print(f"🗄  {db.import_csv(output)} rows stored in: {database}")
+    return 0
+
+
+def query(db_path: Optional[str] = None, imports: Optional[List[str]] = None,
+          scenario: Optional[str] = None, algorithm: Optional[str] = None,
+          source: Optional[str] = None, since: Optional[str] = None,
+          where: Optional[List[str]] = None, group_by: Optional[List[str]] = None,
+          aggregates: Optional[List[str]] = None, columns: Optional[List[str]] = None,
+          order_by: Optional[str] = None, descending: bool = False, limit: Optional[int] = None,
+          csv_file: Optional[str] = None, show_sql: bool = False, config=None):
+    """Filter and aggregate stored results in SQL, printing or exporting the rows."""
+    import sqlite3
+    from backend.app.core.results_db import ResultsDB, parse_filter, export_csv
+
+    db_path = db_path or resolve_config(config).experiment.database_path
+    if not db_path:
+        print("❌ Error: experiment.database is disabled in the configuration; pass --db")
+        return 1
+    if not imports and not os.path.exists(db_path):
+        print(f"❌ Error: Results database not found: {db_path}")
+        print("Run experiments first, or load result CSVs with --import.")
+        return 1
+
+    try:
+        filters = [parse_filter(expression) for expression in where or []]
+        for column, value in (('Scenario', scenario), ('Algorithm', algorithm), ('Source', source)):
+            if value:
+                # Shell-style wildcards match with GLOB (still indexed for a literal prefix)
+                filters.append((column, 'glob' if any(c in value for c in '*?[') else '=', value))
+        if since:
+            filters.append(('Recorded At', '>=', since))
+
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        with ResultsDB(db_path) as db:
+            for path in imports or []:
+                print(f"📥 {db.import_csv(path)} rows imported from: {path}")
+            options = dict(filters=filters, group_by=group_by or [], aggregates=aggregates or [],
+                           columns=columns, order_by=order_by, descending=descending, limit=limit)
+            if show_sql:
+                sql, args, _ = db.build_query(**options)
+                print(f"\n{sql}\n  args: {args}")
+                for step in db.explain(sql, args):
+                    print(f"  plan: {step}")
+            labels, rows = db.query(**options)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    if csv_file:
+        export_csv(csv_file, labels, rows)
+        print(f"\n📊 {len(rows)} rows exported to: {csv_file}")
+        return 0
+
+    def cell(value):
+        if value is None:
+            return ''
+        return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+    shown = [[cell(v) for v in row] for row in rows[:50]]
+    widths = [max([len(label)] + [len(r[i]) for r in shown]) for i, label in enumerate(labels)]
+    numeric = [bool(rows) and all(isinstance(r[i], (int, float)) or r[i] is None for r in rows[:50])
+               for i in range(len(labels))]
+
+    def line(values):
+        return '  '.join(v.rjust(w) if num else v.ljust(w)
+                         for v, w, num in zip(values, widths, numeric)).rstrip()
+
+    print()
+    print(line(labels))
+    print(line(['-' * w for w in widths]))
+    for row in shown:
+        print(line(row))
+    if len(rows) > len(shown):
+        print(f"... {len(rows) - len(shown)} more rows (narrow the query, or export with --csv)")
+    print(f"\n{len(rows)} rows")
+    return 0
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -276,15 +691,46 @@ Examples:
 
   # Run experiments
   %(prog)s run --all
+  %(prog)s --config config.yaml run --all --workers 4
+  %(prog)s run --all --restart      # ignore the journal of an interrupted run
+  %(prog)s run --all --progress verbose   # per-experiment summaries instead of a bar
   %(prog)s run --algorithm SPT --scenario "Simple Scenario 1"
   %(prog)s run --by-algorithm EDF
   %(prog)s run --by-scenario "Challenge Scenario 1"
 
   # Analyze results
   %(prog)s analyze results/comprehensive_results.csv
+  %(prog)s analyze results/comprehensive_results.csv --pareto
+  %(prog)s analyze results/sweep.csv --pareto --objectives "Total Success Rate (%%):max" Makespan:min
+
+  # Benchmark engine throughput and guard against regressions
+  %(prog)s bench --save benchmarks/baselines/engine.json
+  %(prog)s bench --baseline benchmarks/baselines/engine.json --tolerance 0.1
+  %(prog)s bench --sizes 1000000 --machines 16 --algorithms EDF
+  %(prog)s bench --memory --save benchmarks/baselines/memory.json
+
+  # Profile a slow scenario (phase breakdown, top-N, collapsed stacks)
+  %(prog)s profile --algorithm EDF --scenario "Challenge 1: Burst Load"
+  %(prog)s profile --algorithm "DPE (α=0.7)" --workload customer.json --machines 8
+
+  # Sweep algorithm parameters, machine counts and workloads (resumable)
+  %(prog)s sweep sweep.example.json --output results/sweep.csv --workers 8
+
+  # Query the results database (filters and aggregation run in SQLite)
+  %(prog)s query --group-by Algorithm --agg count "mean:Total Success Rate (%%)"
+  %(prog)s query --scenario "Challenge*" --where "alpha>=0.5" --group-by alpha --agg mean:Makespan
+  %(prog)s query --import results/sweep.csv --source results/sweep.csv --csv results/sweep_summary.csv
+
+  # Generate charts (draft profile for fast iteration)
+  %(prog)s visualize --profile draft
+  %(prog)s visualize --charts aggregate --formats png svg
         """
     )
 
+    parser.add_argument('--config', type=str, default=None, metavar='YAML',
+                        help='Run configuration for run/visualize/sweep/query '
+                             '(default: ./config.yaml if present; see config.example.yaml)')
+
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
     # List command
@@ -306,13 +752,149 @@ Examples:
 
     run_parser.add_argument('--scenario', type=str,
                            help='Specific scenario (required with --algorithm)')
-    run_parser.add_argument('--output', type=str, default='results',
-                           help='Output directory (default: results/)')
+    run_parser.add_argument('--output', type=str, default=None,
+                           help="Output directory (default: config's experiment.output_dir, results/)")
+    run_parser.add_argument('--workers', type=int, default=None,
+                           help="Worker processes (default: config's experiment.parallel_workers, "
+                                "CPU count)")
+    run_parser.add_argument('--restart', action='store_true',
+                           help='Discard the journal of finished experiments instead of resuming '
+                                'an interrupted run')
+    run_parser.add_argument('--trace-dir', type=str, default=None,
+                           help='Write a binary schedule trace per experiment to this directory')
+    run_parser.add_argument('--progress', choices=['silent', 'bar', 'verbose'], default=None,
+                           help="Progress reporting (default: config's logging.progress, bar)")
 
     # Analyze command
     analyze_parser = subparsers.add_parser('analyze', help='Analyze experiment results')
     analyze_parser.add_argument('results_file', type=str,
                                help='Path to results CSV file')
+    analyze_parser.add_argument('--pareto', action='store_true',
+                               help='List the experiments on the Pareto frontier instead')
+    analyze_parser.add_argument('--objectives', nargs='+', default=None, metavar='COLUMN:DIR',
+                               help="Frontier objectives as 'column:max' or 'column:min' (default: "
+                                    "success rate, makespan, high-priority success, p99 response time)")
+
+    # Visualize command
+    viz_parser = subparsers.add_parser('visualize', help='Generate charts from experiment results')
+    viz_parser.add_argument('--charts', choices=['all', 'gantt', 'aggregate'], default='all',
+                           help='Which charts to generate (default: all)')
+    viz_parser.add_argument('--results', type=str, default=None,
+                           help='Results CSV; schedules are read from the matching _schedules.csv '
+                                '(default: results/comprehensive_results.csv)')
+    viz_parser.add_argument('--output', type=str, default=None,
+                           help="Output directory (default: config's visualization.output_dir, "
+                                "visualizations/)")
+    viz_parser.add_argument('--profile', choices=['publication', 'draft'], default='publication',
+                           help='Render profile: publication (300 dpi, tight bbox) or draft '
+                                '(low dpi, simplified styling)')
+    viz_parser.add_argument('--formats', nargs='+', choices=['png', 'svg', 'pdf'], default=None,
+                           help="Output formats (default: the profile's, png)")
+    viz_parser.add_argument('--dpi', type=int, default=None,
+                           help="Override the profile's resolution")
+    viz_parser.add_argument('--workers', type=int, default=None,
+                           help="Gantt render processes (default: config's "
+                                "experiment.parallel_workers, CPU count)")
+    viz_parser.add_argument('--force', action='store_true',
+                           help='Redraw charts even if their inputs are unchanged')
+
+    # Bench command
+    bench_parser = subparsers.add_parser('bench', help='Benchmark engine throughput')
+    bench_parser.add_argument('--sizes', type=int, nargs='+', default=None,
+                             help='Workload sizes in tasks (default: 1000 10000 100000)')
+    bench_parser.add_argument('--machines', type=int, nargs='+', default=None,
+                             help='Machine counts (default: 4 16)')
+    bench_parser.add_argument('--algorithms', nargs='+', default=None,
+                             help='Algorithms to run (default: all registered)')
+    bench_parser.add_argument('--repeat', type=int, default=3,
+                             help='Timed repeats per case; the fastest is kept (default: 3)')
+    bench_parser.add_argument('--load', type=float, default=0.8,
+                             help='Offered load per machine of the synthetic workload (default: 0.8)')
+    bench_parser.add_argument('--seed', type=int, default=0, help='Workload seed (default: 0)')
+    bench_parser.add_argument('--save', type=str, default=None, metavar='JSON',
+                             help='Write the results as a baseline file')
+    bench_parser.add_argument('--baseline', type=str, default=None, metavar='JSON',
+                             help='Fail if events/sec dropped versus this baseline')
+    bench_parser.add_argument('--tolerance', type=float, default=0.15,
+                             help='Allowed throughput drop as a fraction (default: 0.15)')
+    bench_parser.add_argument('--no-isolate', action='store_true',
+                             help='Run all cases in this process instead of one fresh process each')
+    bench_parser.add_argument('--memory', action='store_true',
+                             help='Measure bytes per task/event/log entry/result row with tracemalloc '
+                                  '(logging on and off) instead of throughput')
+
+    # Profile command
+    profile_parser = subparsers.add_parser('profile', help='Profile one simulation by engine phase')
+    profile_parser.add_argument('--algorithm', type=str, required=True, help='Algorithm to profile')
+    source_group = profile_parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--scenario', type=str, help='Built-in scenario name')
+    source_group.add_argument('--workload', type=str,
+                              help='Task file (.json or .csv with TaskInput fields)')
+    source_group.add_argument('--synthetic', type=int, metavar='N',
+                              help='Synthetic workload of N tasks (see bench)')
+    profile_parser.add_argument('--machines', type=int, default=None,
+                               help="Machine count (default: the scenario's; 4 for synthetic)")
+    profile_parser.add_argument('--top', type=int, default=20,
+                               help='Rows in the function table (default: 20)')
+    profile_parser.add_argument('--output', type=str, default='results',
+                               help='Directory for the collapsed-stack file (default: results/)')
+    profile_parser.add_argument('--collapsed', type=str, default=None, metavar='PATH',
+                               help='Collapsed-stack output path (overrides --output)')
+    profile_parser.add_argument('--stats', type=str, default=None, metavar='PATH',
+                               help='Also dump raw cProfile stats (for snakeviz, pstats)')
+    profile_parser.add_argument('--no-logs', action='store_true',
+                               help='Profile with the event log disabled, as the experiment runner does')
+
+    # Sweep command
+    sweep_parser = subparsers.add_parser('sweep', help='Run a parameter grid in parallel')
+    sweep_parser.add_argument('grid', type=str,
+                             help='Grid spec (.json, or .yaml with PyYAML); see sweep.example.json')
+    sweep_parser.add_argument('--output', type=str, default='results/sweep_results.csv',
+                             help='Result CSV, appended to as points finish '
+                                  '(default: results/sweep_results.csv)')
+    sweep_parser.add_argument('--workers', type=int, default=0,
+                             help="Worker processes (default: config's experiment.parallel_workers, "
+                                  "CPU count; 1 runs in-process)")
+    sweep_parser.add_argument('--restart', action='store_true',
+                             help='Discard the existing output instead of resuming it')
+    sweep_parser.add_argument('--dry-run', action='store_true',
+                             help='Only count the points and how many remain')
+    sweep_parser.add_argument('--progress', choices=['silent', 'bar', 'verbose'], default=None,
+                             help="Progress reporting (default: config's logging.progress, bar)")
+
+    # Query command
+    query_parser = subparsers.add_parser('query', help='Filter and aggregate stored results in SQL')
+    query_parser.add_argument('--db', type=str, default=None,
+                             help="Results database (default: config's experiment.database, "
+                                  "results/results.db)")
+    query_parser.add_argument('--import', dest='imports', nargs='+', default=None, metavar='CSV',
+                             help='First store these result CSVs (replacing rows imported from '
+                                  'the same file before)')
+    query_parser.add_argument('--scenario', type=str, default=None,
+                             help='Scenario name; * and ? wildcards allowed')
+    query_parser.add_argument('--algorithm', type=str, default=None,
+                             help="Algorithm label, e.g. 'DPE (α=0.5)'; * and ? wildcards allowed")
+    query_parser.add_argument('--source', type=str, default=None,
+                             help='Only rows exported to this results file')
+    query_parser.add_argument('--since', type=str, default=None, metavar='DATE',
+                             help='Only rows recorded at or after this ISO date/time (UTC)')
+    query_parser.add_argument('--where', nargs='+', default=None, metavar='EXPR',
+                             help="Conditions like 'Makespan<=120' or 'alpha>=0.5' (all must hold)")
+    query_parser.add_argument('--group-by', nargs='+', default=None, metavar='COLUMN',
+                             help='Group by columns or parameters, e.g. Algorithm alpha')
+    query_parser.add_argument('--agg', nargs='+', default=None, metavar='FUNC:COLUMN',
+                             help="Aggregates: count, mean:, min:, max:, sum: a column "
+                                  "(default with --group-by: count)")
+    query_parser.add_argument('--columns', nargs='+', default=None,
+                             help='Columns of ungrouped rows (default: scenario, algorithm, metrics)')
+    query_parser.add_argument('--order-by', type=str, default=None,
+                             help='Output column to sort by, e.g. "mean(Makespan)"')
+    query_parser.add_argument('--desc', action='store_true', help='Sort descending')
+    query_parser.add_argument('--limit', type=int, default=None, help='Maximum rows')
+    query_parser.add_argument('--csv', type=str, default=None, metavar='PATH',
+                             help='Write the rows to a CSV instead of printing them')
+    query_parser.add_argument('--sql', action='store_true',
+                             help="Print the generated SQL and SQLite's query plan")
 
     # Parse arguments
     args = parser.parse_args()
@@ -321,6 +903,14 @@ Examples:
         parser.print_help()
         return 0
 
+    # Commands that run simulations or render charts follow config.yaml
+    config = None
+    if args.command in ('run', 'visualize', 'sweep', 'query'):
+        config = load_run_config(args.config)
+        if config is None:
+            return 1
+        config = resolve_config(config, progress=getattr(args, 'progress', None))
+
     # Execute commands
     if args.command == 'list':
         if args.item == 'algorithms':
@@ -331,19 +921,44 @@ Examples:
 
     elif args.command == 'run':
         if args.all:
-            return run_all(args.output)
+            return run_all(args.output, args.trace_dir, config, args.workers, not args.restart)
         elif args.by_algorithm:
-            return run_by_algorithm(args.by_algorithm, args.output)
+            return run_by_algorithm(args.by_algorithm, args.output, args.trace_dir, config,
+                                    args.workers, not args.restart)
         elif args.by_scenario:
-            return run_by_scenario(args.by_scenario, args.output)
+            return run_by_scenario(args.by_scenario, args.output, args.trace_dir, config,
+                                   args.workers, not args.restart)
         elif args.algorithm:
             if not args.scenario:
                 print("❌ Error: --scenario required when using --algorithm")
                 return 1
-            return run_single_experiment(args.algorithm, args.scenario, args.output)
+            return run_single_experiment(args.algorithm, args.scenario, args.output, args.trace_dir,
+                                         config)
 
     elif args.command == 'analyze':
-        return analyze_results(args.results_file)
+        return analyze_results(args.results_file, args.pareto, args.objectives)
+
+    elif args.command == 'bench':
+        return bench(args.sizes, args.machines, args.algorithms, args.repeat, args.load,
+                     args.seed, args.save, args.baseline, args.tolerance, not args.no_isolate,
+                     args.memory)
+
+    elif args.command == 'profile':
+        return profile(args.algorithm, args.scenario, args.workload, args.synthetic,
+                       args.machines, args.top, args.output, args.collapsed, args.stats,
+                       not args.no_logs)
+
+    elif args.command == 'sweep':
+        return sweep(args.grid, args.output, args.workers, not args.restart, args.dry_run, config)
+
+    elif args.command == 'query':
+        return query(args.db, args.imports, args.scenario, args.algorithm, args.source, args.since,
+                     args.where, args.group_by, args.agg, args.columns, args.order_by, args.desc,
+                     args.limit, args.csv, args.sql, config)
+
+    elif args.command == 'visualize':
+        return visualize(args.charts, args.results, args.output, args.profile,
+                         args.formats, args.dpi, args.workers, args.force, config)
 
     return 0
 
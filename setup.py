@@ -49,6 +49,7 @@ setup(
         "matplotlib>=3.5.0",
         "pandas>=1.3.0",
         "numpy>=1.21.0",
+        "pyyaml>=5.4",
     ],
 
     # Optional dependencies for development
@@ -221,3 +221,18 @@ def any_scheduler_class(request):
 def dpe_alpha_values(request):
     """Parametrized fixture for testing different DPE alpha values."""
     return request.param
+
+
+# =============================================================================
+# API Fixtures
+# =============================================================================
+
+@pytest.fixture
+def api_client():
+    """Client for the API routes (without the app's render worker lifespan)."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.app.api.routes import router
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
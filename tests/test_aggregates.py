@@ -0,0 +1,126 @@
+"""
+Tests for the one-pass aggregate tables behind the analysis charts.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.core.aggregates import (
+    ResultAggregates, AGGREGATE_COLUMNS, categorize_scenario
+)
+
+
+@pytest.fixture
+def results_frame():
+    """Results with repeated (scenario, algorithm) rows and DPE alphas."""
+    rng = np.random.default_rng(7)
+    scenarios = ['Light Load', 'Challenge 1', 'Extreme Burst']
+    algorithms = ['EDF', 'DPE (α=0.3)', 'DPE (α=0.7)']
+    rows = []
+    for rep in range(4):
+        for scenario in scenarios:
+            for algorithm in algorithms:
+                row = {'Scenario': scenario, 'Algorithm': algorithm, 'Unused': 'x'}
+                row.update({c: float(rng.uniform(0, 100)) for c in AGGREGATE_COLUMNS})
+                rows.append(row)
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def results_csv(results_frame, tmp_path):
+    path = tmp_path / 'results.csv'
+    results_frame.to_csv(path, index=False)
+    return path
+
+
+class TestResultAggregates:
+    """Test that aggregates reproduce direct pandas group-bys."""
+
+    def test_chunked_means_match_pandas(self, results_frame, results_csv):
+        """Means per (Algorithm, Category) equal a full-frame group-by."""
+        agg = ResultAggregates.from_csv(results_csv, chunksize=5)
+        frame = results_frame.assign(Category=results_frame['Scenario'].map(categorize_scenario))
+        column = 'Composite Performance Score (%)'
+        expected = frame.groupby(['Algorithm', 'Category'])[column].mean()
+        assert np.allclose(agg.mean(['Algorithm', 'Category'], column), expected)
+
+    def test_std_matches_pandas(self, results_frame, results_csv):
+        """Sample std per alpha equals pandas' std over DPE rows."""
+        agg = ResultAggregates.from_csv(results_csv, chunksize=7)
+        dpe = results_frame[results_frame['Algorithm'].str.contains('DPE')].copy()
+        dpe['Alpha'] = dpe['Algorithm'].str.extract(r'α=(\d\.\d)')[0].astype(float)
+        column = 'Low Success Rate (%)'
+        expected = dpe.groupby('Alpha')[column].std()
+        got = agg.where(agg.table['Alpha'].notna()).std(['Alpha'], column)
+        assert np.allclose(got, expected)
+
+    def test_groups_and_counts(self, results_frame, results_csv):
+        """One row per pair, row counts preserved, first-seen algorithm order."""
+        agg = ResultAggregates.from_csv(results_csv, chunksize=4)
+        assert len(agg.table) == 9
+        assert agg.total_rows == len(results_frame)
+        assert agg.algorithms == ['EDF', 'DPE (α=0.3)', 'DPE (α=0.7)']
+
+    def test_from_frame_matches_from_csv(self, results_frame, results_csv):
+        """In-memory and on-disk aggregation agree."""
+        column = 'Makespan'
+        from_csv = ResultAggregates.from_csv(results_csv, use_cache=False)
+        from_frame = ResultAggregates.from_frame(results_frame)
+        assert np.allclose(from_csv.mean(['Scenario', 'Algorithm'], column),
+                           from_frame.mean(['Scenario', 'Algorithm'], column))
+
+    def test_coerce_accepts_dataframe(self, results_frame):
+        """Charts may be handed a raw DataFrame."""
+        agg = ResultAggregates.coerce(results_frame)
+        assert ResultAggregates.coerce(agg) is agg
+
+    def test_derived_columns(self, results_frame):
+        """Category and alpha are derived per group."""
+        table = ResultAggregates.from_frame(results_frame).table
+        assert set(table['Category']) == {'Basic', 'Challenge', 'Extreme'}
+        assert set(table['Alpha'].dropna()) == {0.3, 0.7}
+
+
+class TestAggregateCache:
+    """Test the on-disk cache keyed by CSV content."""
+
+    def test_second_load_uses_cache(self, results_csv, tmp_path):
+        """An unchanged CSV is answered from the cached table."""
+        cache = tmp_path / 'cache'
+        first = ResultAggregates.from_csv(results_csv, cache_dir=cache)
+        second = ResultAggregates.from_csv(results_csv, cache_dir=cache)
+        assert not first.from_cache
+        assert second.from_cache
+        pd.testing.assert_frame_equal(first.table, second.table)
+
+    def test_changed_csv_invalidates_cache(self, results_frame, results_csv, tmp_path):
+        """Editing the CSV produces a fresh aggregation."""
+        cache = tmp_path / 'cache'
+        ResultAggregates.from_csv(results_csv, cache_dir=cache)
+        results_frame.iloc[:3].to_csv(results_csv, index=False)
+        agg = ResultAggregates.from_csv(results_csv, cache_dir=cache)
+        assert not agg.from_cache
+        assert agg.total_rows == 3
+
+    def test_new_revision_replaces_stale_tables(self, results_frame, results_csv, tmp_path):
+        """Only the table for the current CSV revision is kept."""
+        cache = tmp_path / 'cache'
+        cache.mkdir()
+        unrelated = cache / f'other.v1.{"0" * 16}.csv'
+        unrelated.write_text('x\n')
+        ResultAggregates.from_csv(results_csv, cache_dir=cache)
+        first = {p.name for p in cache.glob('*.csv')}
+        results_frame.iloc[:3].to_csv(results_csv, index=False)
+        ResultAggregates.from_csv(results_csv, cache_dir=cache)
+        second = {p.name for p in cache.glob('*.csv')}
+
+        assert len(second) == 2
+        assert unrelated.name in second
+        assert not (first - {unrelated.name}) & second
+
+    def test_cache_can_be_disabled(self, results_csv, tmp_path):
+        """use_cache=False neither reads nor writes the cache."""
+        cache = tmp_path / 'cache'
+        ResultAggregates.from_csv(results_csv, cache_dir=cache, use_cache=False)
+        assert not cache.exists()
@@ -8,7 +8,7 @@ import pytest
 from backend.app.core.simulator import Task, Priority
 from backend.app.core.algorithms import (
     SPT_Scheduler, EDF_Scheduler, PriorityFirst_Scheduler, DPE_Scheduler,
-    get_all_algorithms
+    get_all_algorithms, make_algorithm, algorithm_label, parse_algorithm_label
 )
 
 
@@ -328,6 +328,34 @@ class TestGetAllAlgorithms:
                 assert scheduler is not None
 
 
+class TestMakeAlgorithm:
+    """Test parameterised algorithm factories."""
+
+    def test_make_algorithm_passes_params(self):
+        """Test that the factory builds the base class with the given parameters."""
+        scheduler = make_algorithm('DPE', alpha=0.35)([], 2)
+        assert isinstance(scheduler, DPE_Scheduler)
+        assert scheduler.alpha == 0.35
+
+    def test_make_algorithm_rejects_unknown_params(self):
+        """Test that parameters the constructor does not take are rejected."""
+        with pytest.raises(ValueError):
+            make_algorithm('EDF', alpha=0.5)
+        with pytest.raises(KeyError):
+            make_algorithm('Nope')
+
+    def test_algorithm_label_matches_registry(self):
+        """Test that generated names match the registry's DPE variants."""
+        assert algorithm_label('DPE', {'alpha': 0.7}) in get_all_algorithms()
+        assert algorithm_label('EDF', {}) == 'EDF'
+
+    def test_parse_algorithm_label_inverts_label(self):
+        """Test that labels parse back to base name and parameters."""
+        assert parse_algorithm_label(algorithm_label('DPE', {'alpha': 0.35})) == ('DPE', {'alpha': 0.35})
+        assert parse_algorithm_label('EDF') == ('EDF', {})
+        assert parse_algorithm_label('Max-Min (Cloud)') == ('Max-Min (Cloud)', {})
+
+
 class TestAlgorithmComparison:
     """Test comparing algorithms on same scenarios."""
 
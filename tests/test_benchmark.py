@@ -0,0 +1,129 @@
+"""
+Tests for the engine benchmark suite and its baselines.
+"""
+
+import pytest
+
+from backend.app.core.benchmark import (
+    synthetic_workload, run_case, run_suite, save_baseline, load_baseline, compare,
+    measure_memory, compare_memory, BenchResult, MemoryResult
+)
+from backend.app.core.simulator import Machine, Priority
+
+
+class TestSyntheticWorkload:
+    """Test the generated workloads."""
+
+    def test_reproducible(self):
+        """The same seed yields the same tasks."""
+        assert synthetic_workload(200, 4, seed=3) == synthetic_workload(200, 4, seed=3)
+        assert synthetic_workload(200, 4, seed=3) != synthetic_workload(200, 4, seed=4)
+
+    def test_offered_load(self):
+        """Work arriving per unit time per machine is close to the requested load."""
+        tasks = synthetic_workload(20_000, 8, load=0.5)
+        work = sum(t.processing_time for t in tasks)
+        assert work / tasks[-1].arrival_time / 8 == pytest.approx(0.5, rel=0.05)
+
+    def test_tasks_are_schedulable(self):
+        """Every task fits the large machine type and deadlines follow arrivals."""
+        large = Machine(0, cpu_capacity=8, ram_capacity=32)
+        tasks = synthetic_workload(1_000, 2)
+        assert all(large.can_fit(t) and t.deadline > t.arrival_time for t in tasks)
+        assert {t.priority for t in tasks} == {Priority.HIGH, Priority.LOW}
+
+
+class TestRunCase:
+    """Test single-case measurement."""
+
+    def test_counts(self):
+        """Every task arrives, starts and completes once."""
+        result = run_case('EDF', 300, 4, repeat=1)
+        assert result.dispatches == 300
+        assert result.events == 600
+        assert result.seconds > 0
+        assert result.events_per_sec > 0 and result.us_per_dispatch > 0
+
+    def test_suite_in_process(self):
+        """Suites cover algorithms × sizes × machines and stream results."""
+        seen = []
+        results = run_suite(['SPT', 'FCFS'], sizes=[100, 200], machines=[2], repeat=1,
+                            isolate=False, on_result=seen.append)
+        assert len(results) == 4
+        assert seen == results
+
+    def test_unknown_algorithm(self):
+        """Unknown names fail before anything runs."""
+        with pytest.raises(KeyError):
+            run_suite(['Nope'], sizes=[10], machines=[1], isolate=False)
+
+
+class TestBaselines:
+    """Test baseline persistence and regression detection."""
+
+    def _result(self, seconds):
+        return BenchResult('EDF', 1000, 4, seconds=seconds, events=2000, dispatches=1000)
+
+    def test_round_trip(self, tmp_path):
+        """Saved results load back keyed by case."""
+        path = tmp_path / 'baseline.json'
+        save_baseline([self._result(0.01)], str(path), load=0.8)
+        baseline = load_baseline(str(path))
+        assert baseline['EDF|1000|4']['events_per_sec'] == pytest.approx(200_000)
+
+    def test_regression_beyond_tolerance(self, tmp_path):
+        """A throughput drop larger than the tolerance is reported."""
+        path = tmp_path / 'baseline.json'
+        save_baseline([self._result(0.01)], str(path))
+        baseline = load_baseline(str(path))
+        assert compare([self._result(0.011)], baseline, tolerance=0.15) == []
+        regressions = compare([self._result(0.02)], baseline, tolerance=0.15)
+        assert len(regressions) == 1
+        assert regressions[0]['change'] == pytest.approx(-0.5)
+
+    def test_new_cases_ignored(self):
+        """Cases without a baseline entry never count as regressions."""
+        assert compare([self._result(1.0)], {}, tolerance=0.0) == []
+
+
+class TestMemory:
+    """Test tracemalloc footprints and memory baselines."""
+
+    def test_footprints_with_logs(self):
+        """Every event is logged and every per-object figure is positive."""
+        result = measure_memory('EDF', 500, 2)
+        assert result.log_entries == 1500
+        assert min(result.task_bytes, result.event_bytes,
+                   result.log_entry_bytes, result.result_row_bytes) > 0
+
+    def test_disabled_logging_saves_memory(self):
+        """Without logs nothing is logged and run() peaks lower."""
+        logged = measure_memory('EDF', 500, 2, record_logs=True)
+        quiet = measure_memory('EDF', 500, 2, record_logs=False)
+        assert quiet.log_entries == 0 and quiet.log_entry_bytes == 0
+        assert quiet.run_peak_bytes < logged.run_peak_bytes
+
+    def test_suite_runs_both_logging_modes(self):
+        """Memory suites measure each case with logging on and off."""
+        results = run_suite(['SPT'], sizes=[100], machines=[2], isolate=False, memory=True)
+        assert [r.record_logs for r in results] == [True, False]
+
+    def test_footprint_growth_reported(self, tmp_path):
+        """A per-object metric growing past the tolerance is a regression."""
+        def result(task_bytes):
+            return MemoryResult('EDF', 100, 2, True, task_bytes=task_bytes, event_bytes=100,
+                                log_entry_bytes=300, result_row_bytes=280,
+                                run_peak_bytes=1000, log_entries=300)
+        path = tmp_path / 'memory.json'
+        save_baseline([result(200.0)], str(path), kind='memory')
+        baseline = load_baseline(str(path), kind='memory')
+        assert compare_memory([result(210.0)], baseline, tolerance=0.15) == []
+        regressions = compare_memory([result(300.0)], baseline, tolerance=0.15)
+        assert [r['metric'] for r in regressions] == ['task_bytes']
+
+    def test_kind_mismatch(self, tmp_path):
+        """A memory baseline cannot be used for throughput comparisons."""
+        path = tmp_path / 'memory.json'
+        save_baseline([], str(path), kind='memory')
+        with pytest.raises(ValueError):
+            load_baseline(str(path))
@@ -0,0 +1,90 @@
+"""
+Tests for the command-line interface: start-up cost and option resolution.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ['numpy', 'pandas', 'matplotlib', 'seaborn']
+
+# Runs the CLI in-process and reports which heavy modules it imported
+PROBE = """
+import contextlib, io, json, sys
+sys.argv = ['pyschedule_cli.py'] + json.loads(sys.argv[1])
+sys.path.insert(0, {root!r})
+import pyschedule_cli
+with contextlib.redirect_stdout(io.StringIO()):
+    pyschedule_cli.main()
+print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}} & set({heavy!r}))))
+"""
+
+
+def _heavy_imports(*argv):
+    probe = PROBE.format(root=str(ROOT), heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, '-c', probe, json.dumps(list(argv))],
+                         capture_output=True, text=True, check=True, cwd=ROOT).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    """Test that quick subcommands skip the heavy scientific stack."""
+
+    @pytest.mark.parametrize('item', ['algorithms', 'scenarios'])
+    def test_list_is_light(self, item):
+        """`list` never imports numpy, pandas, matplotlib or seaborn."""
+        assert _heavy_imports('list', item) == []
+
+    def test_importing_cli_is_light(self):
+        """Importing the CLI module loads no simulator code at all."""
+        probe = (f"import sys; sys.path.insert(0, {str(ROOT)!r}); import pyschedule_cli; "
+                 "print(any(m.startswith('backend') for m in sys.modules))")
+        out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True,
+                             check=True, cwd=ROOT).stdout
+        assert out.strip() == 'False'
+
+
+class TestVisualizeProfiles:
+    """Test how `visualize` combines render profiles with config.yaml and flags."""
+
+    @pytest.fixture
+    def rendered(self, monkeypatch, tmp_path):
+        """Run `visualize` without drawing; returns the profile it would render with."""
+        import pyschedule_cli
+        from backend.app.core import visualizer
+        from backend.app.core.config import parse_config
+        profiles = []
+        monkeypatch.setattr(visualizer, 'generate_all_gantt_charts',
+                            lambda *args, profile, **kwargs: profiles.append(profile))
+        monkeypatch.setattr(visualizer, 'generate_all_aggregate_visualizations',
+                            lambda *args, profile, **kwargs: profiles.append(profile))
+
+        def run(profile, **options):
+            config = parse_config({'visualization': {'formats': ['pdf'], 'dpi': 450}})
+            assert pyschedule_cli.visualize(results_file=str(tmp_path / 'results.csv'),
+                                            output_dir=str(tmp_path), profile=profile,
+                                            config=config, **options) == 0
+            return profiles[-1]
+        return run
+
+    def test_config_tunes_publication_profile(self, rendered):
+        """config.yaml formats / dpi apply to the publication profile."""
+        profile = rendered('publication')
+        assert (profile.formats, profile.dpi) == (('pdf',), 450)
+
+    def test_config_leaves_draft_profile_alone(self, rendered):
+        """The draft profile keeps its own formats and resolution."""
+        from backend.app.core.visualizer import RENDER_PROFILES
+        profile = rendered('draft')
+        assert (profile.formats, profile.dpi) == (RENDER_PROFILES['draft'].formats,
+                                                  RENDER_PROFILES['draft'].dpi)
+
+    def test_flags_override_any_profile(self, rendered):
+        """--formats / --dpi win over the draft profile too."""
+        profile = rendered('draft', formats=['svg'], dpi=120)
+        assert (profile.formats, profile.dpi) == (('svg',), 120)
@@ -0,0 +1,107 @@
+"""
+Tests for loading and validating config.yaml.
+"""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from backend.app.core.config import (
+    Config, parse_config, load_config, configure_logging, LoggingSettings,
+    DEFAULT_ALGORITHMS, PACKAGE_LOGGER
+)
+
+EXAMPLE = Path(__file__).parent.parent / 'config.example.yaml'
+
+
+class TestParseConfig:
+    """Test validation of config mappings."""
+
+    def test_defaults(self):
+        """An empty file gives the built-in defaults."""
+        assert parse_config(None) == Config()
+        assert Config().algorithms == DEFAULT_ALGORITHMS
+        assert Config().experiment.workers >= 1
+
+    def test_example_file(self):
+        """The shipped example is valid and read as written."""
+        config = load_config(str(EXAMPLE))
+        assert config.source == str(EXAMPLE)
+        assert config.visualization.formats is None
+        assert config.visualization.dpi is None
+        assert config.logging.file == 'pyschedule.log'
+
+    def test_sections_override_defaults(self):
+        """Given keys replace defaults; others keep them."""
+        config = parse_config({
+            'experiment': {'parallel_workers': 3},
+            'algorithms': ['EDF'],
+            'scenarios': {'extreme': False, 'cloud': False},
+            'visualization': {'formats': ['svg', 'pdf'], 'charts': {'gantt': False}},
+            'logging': {'level': 'debug'},
+        })
+        assert config.experiment.workers == 3
+        assert config.experiment.output_dir == 'results'
+        assert config.algorithms == ('EDF',)
+        assert config.scenarios == ('simple', 'challenge', 'advanced', 'new')
+        assert config.visualization.formats == ('svg', 'pdf')
+        assert 'gantt' not in config.visualization.charts
+        assert config.logging.level == 'DEBUG'
+
+    @pytest.mark.parametrize('data', [
+        {'experiments': {}},
+        {'experiment': {'workers': 2}},
+        {'experiment': {'parallel_workers': -1}},
+        {'experiment': {'parallel_workers': True}},
+        {'experiment': {'database': 5}},
+        {'algorithms': ['Nope']},
+        {'scenarios': {'simple': 'yes'}},
+        {'visualization': {'formats': ['gif']}},
+        {'visualization': {'dpi': 0}},
+        {'visualization': {'charts': {'pie': True}}},
+        {'logging': {'level': 'LOUD'}},
+        {'logging': {'progress': 'chatty'}},
+    ])
+    def test_invalid(self, data):
+        """Unknown keys and invalid values are errors, not silent defaults."""
+        with pytest.raises(ValueError):
+            parse_config(data)
+
+    def test_database(self):
+        """The database lives in the output directory; null disables it."""
+        assert Config().experiment.database_path == 'results/results.db'
+        config = parse_config({'experiment': {'output_dir': 'out', 'database': 'runs.db'}})
+        assert config.experiment.database_path == 'out/runs.db'
+        assert parse_config({'experiment': {'database': None}}).experiment.database_path is None
+
+    def test_missing_default_file(self, tmp_path, monkeypatch):
+        """Without ./config.yaml the defaults apply; an explicit missing path fails."""
+        monkeypatch.chdir(tmp_path)
+        assert load_config() == Config()
+        with pytest.raises(OSError):
+            load_config('missing.yaml')
+
+
+class TestConfigureLogging:
+    """Test log routing."""
+
+    def test_level_and_file(self, tmp_path):
+        """Records below the level are dropped; the rest reach the log file."""
+        log_file = tmp_path / 'logs' / 'run.log'
+        logger = configure_logging(LoggingSettings(level='WARNING', file=str(log_file),
+                                                   console=False))
+        try:
+            child = logging.getLogger(f'{PACKAGE_LOGGER}.runner')
+            child.info('quiet')
+            child.warning('loud')
+            for handler in logger.handlers:
+                handler.flush()
+            text = log_file.read_text()
+            assert 'loud' in text and 'quiet' not in text
+        finally:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            logger.setLevel(logging.NOTSET)
+            logger.propagate = True
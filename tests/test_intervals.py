@@ -0,0 +1,92 @@
+"""
+Tests for the schedule interval index (intervals.py).
+"""
+
+import pytest
+from backend.app.core.simulator import Task, Priority
+from backend.app.core.algorithms import EDF_Scheduler
+from backend.app.core.intervals import ScheduleIndex
+
+
+def scheduled(task_id, machine_id, start, end):
+    """Task with scheduling state already filled in."""
+    task = Task(id=task_id, arrival_time=0.0, processing_time=end - start,
+                priority=Priority.HIGH, deadline=100.0)
+    task.start_time = start
+    task.completion_time = end
+    task.machine_id = machine_id
+    return task
+
+
+@pytest.fixture
+def index():
+    """Two machines: M0 busy [0,5) [5,10) [20,30); M1 busy [2,8)."""
+    return ScheduleIndex([
+        scheduled(1, 0, 0.0, 5.0),
+        scheduled(2, 0, 5.0, 10.0),
+        scheduled(3, 0, 20.0, 30.0),
+        scheduled(4, 1, 2.0, 8.0),
+    ], num_machines=2)
+
+
+class TestScheduleIndex:
+    """Test window, point and utilization queries."""
+
+    def test_window_all_machines(self, index):
+        """Window returns every task overlapping [start, end)."""
+        assert {t.id for t in index.window(4.0, 6.0)} == {1, 2, 4}
+
+    def test_window_single_machine(self, index):
+        """Machine filter restricts the result."""
+        assert [t.id for t in index.window(0.0, 100.0, machine_id=0)] == [1, 2, 3]
+
+    def test_window_boundaries_are_half_open(self, index):
+        """Tasks ending at the window start or starting at its end are excluded."""
+        assert {t.id for t in index.window(10.0, 20.0)} == set()
+
+    def test_running_at(self, index):
+        """Point queries find the task executing on each machine."""
+        assert {t.id for t in index.running_at(5.0)} == {2, 4}
+        assert index.busy_machines_at(15.0) == 0
+        assert index.utilization_at(3.0) == 1.0
+
+    def test_busy_time(self, index):
+        """Busy time clips intervals to the window."""
+        assert index.busy_time(0.0, 10.0) == pytest.approx(16.0)
+        assert index.busy_time(25.0, 40.0, machine_id=0) == pytest.approx(5.0)
+
+    def test_utilization_curve(self, index):
+        """Bucketed utilization averages busy machines over each bucket."""
+        curve = index.utilization_curve(0.0, 30.0, buckets=3)
+        assert [b['utilization'] for b in curve] == pytest.approx([0.8, 0.0, 0.5])
+
+    def test_matches_linear_scan(self, mixed_priority_tasks):
+        """Index answers agree with a brute-force scan of a real schedule."""
+        scheduler = EDF_Scheduler(mixed_priority_tasks, num_machines=2)
+        scheduler.run()
+        index = ScheduleIndex.from_scheduler(scheduler)
+
+        for start, end in [(0.0, 3.0), (4.0, 9.0), (10.0, 40.0)]:
+            expected = {t.id for t in scheduler.completed_tasks
+                        if t.start_time < end and t.completion_time > start}
+            assert {t.id for t in index.window(start, end)} == expected
+
+    def test_empty_schedule(self):
+        """An empty index answers every query with nothing."""
+        index = ScheduleIndex([], num_machines=2)
+        assert index.window(0.0, 10.0) == []
+        assert index.utilization_at(1.0) == 0.0
+        assert index.utilization_curve() == []
+
+
+class TestTimelineRequest:
+    """Test validation of POST /timeline requests."""
+
+    @pytest.mark.parametrize('buckets', [0, 10_001, 10 ** 8])
+    def test_rejects_out_of_range_buckets(self, buckets):
+        """The utilization curve resolution is bounded."""
+        from pydantic import ValidationError
+        from backend.app.models.schemas import TimelineRequest
+
+        with pytest.raises(ValidationError):
+            TimelineRequest(algorithm='EDF', num_machines=1, tasks=[], buckets=buckets)
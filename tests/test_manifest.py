@@ -0,0 +1,113 @@
+"""
+Tests for chart fingerprints and the manifest used for incremental rendering.
+"""
+
+import json
+
+import pytest
+
+from backend.app.core.simulator import Task, Priority
+from backend.app.core.algorithms import get_all_algorithms
+from backend.app.core.manifest import (
+    ChartManifest, MANIFEST_NAME, fingerprint, task_signature,
+    scheduler_signature, file_digest
+)
+
+
+def _tasks():
+    return [
+        Task(id=1, arrival_time=0, processing_time=2, priority=Priority.HIGH, deadline=5),
+        Task(id=2, arrival_time=1, processing_time=3, priority=Priority.LOW, deadline=10),
+    ]
+
+
+class TestFingerprints:
+    """Test what changes (and what does not change) a fingerprint."""
+
+    def test_fingerprint_is_deterministic(self):
+        """Equal inputs produce equal fingerprints, including dict key order."""
+        assert fingerprint({'a': 1, 'b': 2}, 3) == fingerprint({'b': 2, 'a': 1}, 3)
+
+    def test_task_inputs_change_fingerprint(self):
+        """Editing a task's inputs changes its signature."""
+        tasks = _tasks()
+        before = fingerprint(task_signature(tasks))
+        tasks[1].deadline = 11
+        assert fingerprint(task_signature(tasks)) != before
+
+    def test_scheduling_state_is_ignored(self):
+        """Start/completion times do not affect the task signature."""
+        tasks = _tasks()
+        before = task_signature(tasks)
+        tasks[0].start_time = 0.0
+        tasks[0].completion_time = 2.0
+        assert task_signature(tasks) == before
+
+    def test_algorithm_parameters_distinguish_presets(self):
+        """DPE alpha presets get different scheduler signatures."""
+        algorithms = get_all_algorithms()
+        low = scheduler_signature(algorithms['DPE (α=0.3)']([], 2))
+        high = scheduler_signature(algorithms['DPE (α=0.9)']([], 2))
+        assert low['params']['alpha'] == 0.3
+        assert low != high
+
+    def test_machine_count_changes_signature(self):
+        """Machine configuration is part of the scheduler signature."""
+        edf = get_all_algorithms()['EDF']
+        assert scheduler_signature(edf([], 2)) != scheduler_signature(edf([], 4))
+
+    def test_file_digest_tracks_content(self, tmp_path):
+        """File digests change with content, not with modification time."""
+        path = tmp_path / 'results.csv'
+        path.write_text('a,b\n1,2\n')
+        first = file_digest(path)
+        path.write_text('a,b\n1,2\n')
+        assert file_digest(path) == first
+        path.write_text('a,b\n1,3\n')
+        assert file_digest(path) != first
+
+
+class TestChartManifest:
+    """Test manifest bookkeeping."""
+
+    def test_unknown_chart_is_stale(self, tmp_path):
+        """A chart never recorded is not current."""
+        assert not ChartManifest(tmp_path).is_current('chart.png', 'abc')
+
+    def test_recorded_chart_is_current(self, tmp_path):
+        """A recorded chart whose file exists is current for the same fingerprint only."""
+        (tmp_path / 'chart.png').write_bytes(b'png')
+        manifest = ChartManifest(tmp_path)
+        manifest.record('chart.png', 'abc')
+        assert manifest.is_current('chart.png', 'abc')
+        assert not manifest.is_current('chart.png', 'def')
+
+    def test_missing_file_is_stale(self, tmp_path):
+        """A deleted chart is regenerated even if its fingerprint matches."""
+        manifest = ChartManifest(tmp_path)
+        manifest.record('chart.png', 'abc')
+        assert not manifest.is_current('chart.png', 'abc')
+
+    def test_save_and_reload(self, tmp_path):
+        """Entries survive a round trip through the manifest file."""
+        (tmp_path / 'chart.png').write_bytes(b'png')
+        manifest = ChartManifest(tmp_path)
+        manifest.record('chart.png', 'abc')
+        manifest.save()
+
+        assert json.loads((tmp_path / MANIFEST_NAME).read_text()) == {'chart.png': 'abc'}
+        assert ChartManifest(tmp_path).is_current('chart.png', 'abc')
+        assert not (tmp_path / (MANIFEST_NAME + '.tmp')).exists()
+
+    def test_corrupt_manifest_starts_empty(self, tmp_path):
+        """An unreadable manifest is treated as empty rather than failing."""
+        (tmp_path / MANIFEST_NAME).write_text('{not json')
+        assert ChartManifest(tmp_path).entries == {}
+
+    @pytest.mark.parametrize('chart', ['chart.png', None])
+    def test_forget(self, tmp_path, chart):
+        """forget() drops one entry or all of them."""
+        manifest = ChartManifest(tmp_path)
+        manifest.record('chart.png', 'abc')
+        manifest.forget(chart)
+        assert 'chart.png' not in manifest.entries
@@ -0,0 +1,91 @@
+"""
+Tests for multi-objective Pareto frontier computation.
+"""
+
+import random
+
+import pytest
+
+from backend.app.core.pareto import (
+    pareto_front, pareto_frontier, parse_objectives, DEFAULT_OBJECTIVES
+)
+from backend.app.core.algorithms import AVAILABLE_ALGORITHMS
+from backend.app.core.runner import ExperimentRunner
+
+
+def _brute_force(points):
+    """Quadratic reference: indices not dominated by any other point."""
+    def dominates(p, q):
+        return all(a <= b for a, b in zip(p, q)) and any(a < b for a, b in zip(p, q))
+    return [i for i, p in enumerate(points) if not any(dominates(q, p) for q in points)]
+
+
+class TestParetoFront:
+    """Test the dimension-specific algorithms against brute force."""
+
+    @pytest.mark.parametrize('dims', [1, 2, 3, 4, 5])
+    def test_matches_brute_force(self, dims):
+        """Small integer grids exercise ties and duplicates in every dimension."""
+        rng = random.Random(dims)
+        for _ in range(50):
+            n = rng.randint(0, 300 if dims > 3 else 40)
+            points = [tuple(rng.randint(0, 4) for _ in range(dims)) for _ in range(n)]
+            assert pareto_front(points) == _brute_force(points)
+
+    def test_duplicates_share_fate(self):
+        """Identical points do not dominate each other."""
+        points = [(1, 2), (1, 2), (2, 3)]
+        assert pareto_front(points) == [0, 1]
+
+    def test_maximize_objectives(self):
+        """'max' objectives prefer larger values."""
+        points = [(90, 10), (80, 5), (70, 20)]
+        assert pareto_front(points, ['max', 'min']) == [0, 1]
+
+    def test_nan_never_on_frontier(self):
+        """Rows with missing values are excluded."""
+        points = [(float('nan'), 0.0), (1.0, 1.0)]
+        assert pareto_front(points) == [1]
+
+    def test_inconsistent_dimensions(self):
+        """Ragged points are rejected."""
+        with pytest.raises(ValueError):
+            pareto_front([(1, 2), (1, 2, 3)])
+
+
+class TestParetoFrontier:
+    """Test frontier selection over result rows."""
+
+    def test_default_objectives(self):
+        """Rows are filtered on success, makespan, high success and p99 latency."""
+        rows = [
+            {'Algorithm': 'A', 'Total Success Rate (%)': 90, 'Makespan': 50,
+             'High Success Rate (%)': 100, 'P99 Response Time': 10},
+            {'Algorithm': 'B', 'Total Success Rate (%)': 80, 'Makespan': 60,
+             'High Success Rate (%)': 90, 'P99 Response Time': 12},
+            {'Algorithm': 'C', 'Total Success Rate (%)': 95, 'Makespan': 70,
+             'High Success Rate (%)': 80, 'P99 Response Time': 9},
+        ]
+        assert [r['Algorithm'] for r in pareto_frontier(rows)] == ['A', 'C']
+
+    def test_missing_column(self):
+        """Objectives absent from the rows raise KeyError."""
+        with pytest.raises(KeyError):
+            pareto_frontier([{'Makespan': 1}], {'Nope': 'max'})
+
+    def test_parse_objectives(self):
+        """Direction suffixes parse; a bare column means maximize."""
+        parsed = parse_objectives(['Makespan:min', 'Total Success Rate (%)'])
+        assert parsed == {'Makespan': 'min', 'Total Success Rate (%)': 'max'}
+        with pytest.raises(ValueError):
+            parse_objectives(['Makespan:lowest'])
+
+    def test_runner_frontier(self, mixed_priority_tasks):
+        """The runner's frontier is a subset of its results with the default objectives."""
+        runner = ExperimentRunner()
+        scenario = {'name': 'Mixed', 'tasks': mixed_priority_tasks, 'num_machines': 2}
+        for algo in ('EDF', 'SPT', 'FCFS'):
+            runner.run_experiment(scenario, algo, AVAILABLE_ALGORITHMS[algo])
+        frontier = runner.pareto_frontier()
+        assert frontier and all(row in runner.results for row in frontier)
+        assert set(DEFAULT_OBJECTIVES) <= set(frontier[0])
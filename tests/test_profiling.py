@@ -0,0 +1,56 @@
+"""
+Tests for phase-bucketed simulation profiles.
+"""
+
+import pytest
+
+from backend.app.core.algorithms import get_all_algorithms
+from backend.app.core.benchmark import synthetic_workload
+from backend.app.core.profiling import profile_run, PHASES, ENGINE_LOOP
+
+
+@pytest.fixture(scope='module')
+def report():
+    """Profile of DPE (which calls helpers from select_task) on 500 tasks."""
+    scheduler = get_all_algorithms()['DPE (α=0.5)'](synthetic_workload(500, 4), 4)
+    return profile_run(scheduler)
+
+
+class TestProfileReport:
+    """Test phase buckets, top-N and collapsed stacks."""
+
+    def test_phases_cover_total(self, report):
+        """Every phase is reported and together they add up to the profiled time."""
+        assert list(report.phases) == [name for name, _ in PHASES] + [ENGINE_LOOP]
+        assert sum(report.phases.values()) == pytest.approx(report.total, rel=1e-6)
+
+    def test_engine_phases_measured(self, report):
+        """Event pops, selection, filtering, logging and results all take time."""
+        for phase in ('event pop', 'select_task', 'compatibility filtering',
+                      'logging', 'result building'):
+            assert report.phases[phase] > 0
+
+    def test_no_logging_without_logs(self):
+        """With the event log disabled the logging phase is empty."""
+        scheduler = get_all_algorithms()['EDF'](synthetic_workload(200, 2), 2)
+        scheduler.record_logs = False
+        assert profile_run(scheduler).phases['logging'] == 0
+
+    def test_top_sorted_by_self_time(self, report):
+        """The top table is ordered by self time and capped at n."""
+        rows = report.top(5)
+        assert len(rows) == 5
+        assert [r['tottime'] for r in rows] == sorted((r['tottime'] for r in rows), reverse=True)
+
+    def test_collapsed_stacks(self, report, tmp_path):
+        """Stacks start at run/get_results and their self times sum to the total."""
+        stacks = report.collapsed_stacks(min_seconds=0)
+        assert all(s.split(';')[0] in ('simulator.run', 'simulator.get_results') for s in stacks)
+        assert sum(stacks.values()) == pytest.approx(report.total, rel=0.01)
+
+        path = tmp_path / 'out.folded'
+        count = report.write_collapsed(str(path))
+        lines = path.read_text().splitlines()
+        assert len(lines) == count
+        stack, micros = lines[0].rsplit(' ', 1)
+        assert stack and int(micros) > 0
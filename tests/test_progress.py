@@ -0,0 +1,113 @@
+"""
+Tests for progress reporting.
+"""
+
+import io
+import logging
+import threading
+
+import pytest
+
+from backend.app.core.progress import (
+    Progress, BarProgress, VerboseProgress, make_progress, format_duration
+)
+from backend.app.core.runner import ExperimentRunner
+from backend.app.core.scenarios import get_scenarios
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBarProgress:
+    """Test the throttled bar."""
+
+    def test_throttled_redraws(self):
+        """Steps inside the interval are not drawn; the last step always is."""
+        clock, stream = FakeClock(), io.StringIO()
+        bar = BarProgress(stream, min_interval=1.0, clock=clock)
+        bar.start(100)
+        for _ in range(100):
+            clock.now += 0.02
+            bar.step('x')
+        lines = stream.getvalue().splitlines()
+        # Start, one redraw after a second of steps, and the final 100/100
+        assert len(lines) == 3
+        assert lines[-1].startswith('[' + '█' * 30 + '] 100/100 100%')
+        assert '50.0 exp/s' in lines[-1]
+
+    def test_rate_and_eta_skip_restored(self):
+        """Restored experiments count as done but not towards the rate."""
+        clock = FakeClock()
+        bar = BarProgress(io.StringIO(), clock=clock)
+        bar.start(10)
+        for _ in range(4):
+            bar.step('restored', skipped=True)
+        clock.now = 2.0
+        bar.step('ran')
+        bar.step('ran')
+        assert bar.done == 6
+        assert bar.rate == pytest.approx(1.0)
+        assert bar.eta == pytest.approx(4.0)
+        assert 'ETA 0:04' in bar.render()
+
+    def test_finish_reports_total(self):
+        """An interrupted run draws its last state before the summary line."""
+        clock, stream = FakeClock(), io.StringIO()
+        bar = BarProgress(stream, min_interval=60, clock=clock)
+        bar.start(5)
+        bar.step('x')
+        clock.now = 65
+        bar.finish()
+        lines = stream.getvalue().splitlines()
+        assert lines[-2].startswith('[') and ' 1/5 ' in lines[-2]
+        assert lines[-1] == '1 experiments in 1:05'
+
+    def test_threads(self):
+        """Concurrent steps are all counted."""
+        bar = BarProgress(io.StringIO(), min_interval=0)
+        bar.start(800)
+        threads = [threading.Thread(target=lambda: [bar.step('x') for _ in range(100)])
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert bar.done == 800
+
+
+class TestLevels:
+    """Test silent and verbose reporting in the runner."""
+
+    def test_make_progress(self):
+        """Levels map to reporters; unknown levels are errors."""
+        assert type(make_progress('silent')) is Progress
+        assert isinstance(make_progress('bar', io.StringIO()), BarProgress)
+        assert isinstance(make_progress('verbose'), VerboseProgress)
+        with pytest.raises(ValueError):
+            make_progress('loud')
+
+    def test_runner_silent_by_default(self, caplog):
+        """A runner without a reporter logs nothing per experiment."""
+        with caplog.at_level(logging.INFO, logger='backend.app.core'):
+            ExperimentRunner().run_experiments(get_scenarios(['challenge'])[:2], ['EDF'])
+        assert caplog.records == []
+
+    def test_runner_verbose(self, caplog):
+        """Verbose reporting logs a banner per scenario and a summary per experiment."""
+        scenarios = get_scenarios(['challenge'])[:2]
+        with caplog.at_level(logging.INFO, logger='backend.app.core'):
+            ExperimentRunner(progress=VerboseProgress()).run_experiments(scenarios, ['EDF', 'SPT'])
+        messages = [r.getMessage() for r in caplog.records]
+        assert sum(m.startswith('SCENARIO: ') for m in messages) == 2
+        assert sum('🔬 Ran: ' in m for m in messages) == 4
+        assert f"[4/4] 🔬 Ran: SPT on {scenarios[1]['name']}" in '\n'.join(messages)
+
+    def test_format_duration(self):
+        """Durations print as M:SS, or H:MM:SS from an hour."""
+        assert format_duration(5) == '0:05'
+        assert format_duration(3725) == '1:02:05'
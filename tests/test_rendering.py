@@ -0,0 +1,367 @@
+"""
+Tests for Gantt chart rendering: batch generation, drawing modes, and the
+render cache and cache keys behind the Gantt endpoint.
+"""
+
+import asyncio
+import json
+import os
+import signal
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import PolyCollection
+
+from backend.app.core import visualizer
+from backend.app.core.simulator import Task, Priority
+from backend.app.core.rendering import GanttRenderer, RenderCache, render_key
+
+
+def _scheduled_tasks():
+    tasks = [
+        Task(id=1, arrival_time=0, processing_time=2, priority=Priority.HIGH, deadline=5),
+        Task(id=2, arrival_time=0, processing_time=3, priority=Priority.LOW, deadline=4),
+    ]
+    for machine, t in enumerate(tasks):
+        t.start_time = 0.0
+        t.completion_time = t.processing_time
+        t.machine_id = machine
+    return tasks
+
+
+def _row_of_tasks(count, width=1.0):
+    """count back-to-back scheduled tasks on machine 0, every third one late."""
+    tasks = []
+    for i in range(count):
+        t = Task(id=i, arrival_time=0, processing_time=width, priority=Priority.HIGH,
+                 deadline=(i + 1) * width if i % 3 else i * width)
+        t.start_time, t.completion_time, t.machine_id = i * width, (i + 1) * width, 0
+        tasks.append(t)
+    return tasks
+
+
+def _draw(tasks, **options):
+    """Draw a Gantt chart without saving; returns its axes (figure closed by the caller)."""
+    fig = visualizer.SchedulingVisualizer(output_dir=None).create_gantt_chart(
+        tasks, 'EDF', 'S', num_machines=2, save=False, **options)
+    return fig.axes[0]
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Release figures drawn by a test."""
+    yield
+    plt.close('all')
+
+
+class TestRenderCache:
+    """Test size-bounded LRU behaviour."""
+
+    def test_get_and_put(self):
+        """Stored images are returned and counted as hits."""
+        cache = RenderCache(max_bytes=100)
+        assert cache.get('a') is None
+        cache.put('a', b'x' * 10)
+        assert cache.get('a') == b'x' * 10
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.size == 10
+
+    def test_evicts_least_recently_used(self):
+        """Exceeding the budget evicts the entry used longest ago."""
+        cache = RenderCache(max_bytes=30)
+        cache.put('a', b'a' * 10)
+        cache.put('b', b'b' * 10)
+        cache.put('c', b'c' * 10)
+        cache.get('a')  # 'b' is now the oldest
+        cache.put('d', b'd' * 10)
+        assert 'b' not in cache
+        assert all(key in cache for key in 'acd')
+        assert cache.size == 30
+
+    def test_replacing_entry_updates_size(self):
+        """Putting an existing key replaces it without double counting."""
+        cache = RenderCache(max_bytes=100)
+        cache.put('a', b'a' * 10)
+        cache.put('a', b'a' * 20)
+        assert len(cache) == 1
+        assert cache.size == 20
+
+    def test_oversized_image_not_cached(self):
+        """Images larger than the whole budget are skipped."""
+        cache = RenderCache(max_bytes=5)
+        cache.put('a', b'a' * 10)
+        assert 'a' not in cache
+        assert cache.size == 0
+
+    def test_clear(self):
+        """clear() empties the cache."""
+        cache = RenderCache()
+        cache.put('a', b'a')
+        cache.clear()
+        assert len(cache) == 0 and cache.size == 0
+
+
+class TestRenderKey:
+    """Test what the cache key depends on."""
+
+    def test_same_schedule_same_key(self):
+        """Identical schedules and options share a key."""
+        assert (render_key(_scheduled_tasks(), 2, 'EDF', 'S', 'png', {'mode': 'auto'})
+                == render_key(_scheduled_tasks(), 2, 'EDF', 'S', 'png', {'mode': 'auto'}))
+
+    def test_schedule_changes_key(self):
+        """A different machine assignment produces a different key."""
+        tasks = _scheduled_tasks()
+        before = render_key(tasks, 2, 'EDF', 'S', 'png', {})
+        tasks[0].machine_id = 1
+        assert render_key(tasks, 2, 'EDF', 'S', 'png', {}) != before
+
+    def test_options_change_key(self):
+        """Format and render options are part of the key."""
+        tasks = _scheduled_tasks()
+        keys = {
+            render_key(tasks, 2, 'EDF', 'S', 'png', {}),
+            render_key(tasks, 2, 'EDF', 'S', 'svg', {}),
+            render_key(tasks, 2, 'EDF', 'S', 'png', {'mode': 'lod'}),
+            render_key(tasks, 2, 'EDF', 'S', 'png', {'time_window': (0, 1)}),
+        }
+        assert len(keys) == 4
+
+
+class TestGanttRenderer:
+    """Test the API's dedicated render process."""
+
+    def test_renders_and_caches(self):
+        """A second identical request is answered from the cache."""
+        renderer = GanttRenderer()
+        try:
+            first = asyncio.run(renderer.render(_scheduled_tasks(), 2, 'EDF', 'S',
+                                                options={'profile': 'draft'}))
+            second = asyncio.run(renderer.render(_scheduled_tasks(), 2, 'EDF', 'S',
+                                                 options={'profile': 'draft'}))
+        finally:
+            renderer.shutdown()
+        assert first[0].startswith(b'\x89PNG') and not first[1]
+        assert second == (first[0], True)
+
+    def test_recovers_from_dead_worker(self):
+        """A killed render process is replaced instead of failing every later render."""
+        renderer = GanttRenderer()
+        try:
+            asyncio.run(renderer.render(_scheduled_tasks(), 2, 'EDF', 'S', options={'profile': 'draft'}))
+            for pid in list(renderer._executor._processes):
+                os.kill(pid, signal.SIGKILL)
+            image, cached = asyncio.run(renderer.render(_scheduled_tasks(), 2, 'EDF', 'S', 'svg',
+                                                        options={'profile': 'draft'}))
+        finally:
+            renderer.shutdown()
+        assert b'<svg' in image and not cached
+
+
+class TestGenerateAllGanttCharts:
+    """Test batch Gantt rendering in a process pool and in-process."""
+
+    @pytest.fixture
+    def small_batch(self, monkeypatch):
+        """One small scenario and two algorithms instead of the full catalogue."""
+        scenario = {'name': 'Tiny: Pair', 'num_machines': 2, 'tasks': [
+            Task(id=1, arrival_time=0, processing_time=2, priority=Priority.HIGH, deadline=5),
+            Task(id=2, arrival_time=0, processing_time=3, priority=Priority.LOW, deadline=4),
+            Task(id=3, arrival_time=1, processing_time=1, priority=Priority.LOW, deadline=3),
+        ]}
+        monkeypatch.setattr(visualizer, 'get_all_scenarios', lambda: [scenario])
+        monkeypatch.setattr(visualizer, 'GANTT_ALGORITHMS', ['EDF', 'SPT'])
+
+    @staticmethod
+    def render(output_dir, workers):
+        """Render the batch with the draft profile; returns (timings, files, manifest)."""
+        timings = visualizer.generate_all_gantt_charts(str(output_dir), workers=workers,
+                                                       schedules_csv=None, profile='draft')
+        files = sorted(p.name for p in output_dir.iterdir() if p.suffix == '.png')
+        manifest = json.loads((output_dir / '.manifest.json').read_text())
+        return timings, files, manifest
+
+    def test_pool_and_serial_write_the_same_charts(self, small_batch, tmp_path):
+        """workers=2 and workers=1 produce the same files and manifest entries."""
+        pooled = self.render(tmp_path / 'pool', workers=2)
+        serial = self.render(tmp_path / 'serial', workers=1)
+
+        assert pooled[1] == serial[1] == ['Tiny_Pair_EDF_gantt.png', 'Tiny_Pair_SPT_gantt.png']
+        assert pooled[2] == serial[2]
+        assert sorted(t[:2] for t in pooled[0]) == sorted(t[:2] for t in serial[0])
+        for name in serial[1]:
+            assert (tmp_path / 'pool' / name).stat().st_size > 0
+
+    def test_unchanged_charts_are_skipped(self, small_batch, tmp_path):
+        """A second run finds every chart current in the manifest."""
+        self.render(tmp_path, workers=1)
+        timings, files, _ = self.render(tmp_path, workers=2)
+        assert timings == []
+        assert len(files) == 2
+
+    def test_plotting_code_change_redraws(self, small_batch, tmp_path, monkeypatch):
+        """Charts drawn by different plotting code are no longer current."""
+        self.render(tmp_path, workers=1)
+        monkeypatch.setattr(visualizer, 'PLOT_VERSION', 'edited')
+        timings, _, _ = self.render(tmp_path, workers=1)
+        assert len(timings) == 2
+
+    def test_plot_version_follows_source(self):
+        """PLOT_VERSION is derived from the plotting source files."""
+        from pathlib import Path
+        from backend.app.core.manifest import fingerprint, file_digest
+        source = Path(visualizer.__file__)
+        assert visualizer.PLOT_VERSION == fingerprint(
+            file_digest(source), file_digest(source.with_name('aggregates.py')))
+
+
+class TestGanttModes:
+    """Test the patch, collection and level-of-detail drawing modes."""
+
+    def test_collections_draw_one_polygon_per_scheduled_task(self):
+        """All bars share one PolyCollection; unscheduled tasks are left out."""
+        tasks = _row_of_tasks(5) + [Task(id=99, arrival_time=0, processing_time=1,
+                                         priority=Priority.LOW, deadline=9)]
+        ax = _draw(tasks, mode='collections')
+
+        bars = [c for c in ax.collections if isinstance(c, PolyCollection)]
+        assert len(bars) == 1
+        assert len(bars[0].get_paths()) == 5
+        assert not ax.patches
+
+    def test_patches_draw_one_rectangle_per_task(self):
+        """The patch mode adds a Rectangle per scheduled task."""
+        ax = _draw(_row_of_tasks(5), mode='patches')
+        assert len(ax.patches) == 5
+        assert not any(isinstance(c, PolyCollection) for c in ax.collections)
+
+    def test_auto_switches_to_collections_above_threshold(self):
+        """'auto' keeps patches up to COLLECTION_THRESHOLD tasks and batches above it."""
+        at = _draw(_row_of_tasks(visualizer.COLLECTION_THRESHOLD), mode='auto')
+        above = _draw(_row_of_tasks(visualizer.COLLECTION_THRESHOLD + 1), mode='auto')
+
+        assert len(at.patches) == visualizer.COLLECTION_THRESHOLD
+        assert not above.patches
+        assert [len(c.get_paths()) for c in above.collections
+                if isinstance(c, PolyCollection)] == [visualizer.COLLECTION_THRESHOLD + 1]
+
+    def test_auto_switches_to_lod_above_tasks_per_pixel(self):
+        """'auto' draws the aggregated image once tasks outnumber lod_threshold × pixels."""
+        tasks = _row_of_tasks(20)
+        fig, ax = plt.subplots(figsize=(10, 3))
+        pixels = ax.get_window_extent().width
+        plt.close(fig)
+
+        detailed = _draw(tasks, mode='auto', lod_threshold=20 / pixels * 1.01)
+        aggregated = _draw(tasks, mode='auto', lod_threshold=20 / pixels * 0.99)
+
+        assert not detailed.images and len(detailed.patches) == 20
+        assert len(aggregated.images) == 1 and not aggregated.patches
+
+    def test_unknown_mode(self):
+        """Unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            _draw(_row_of_tasks(2), mode='bogus')
+
+
+class TestLevelOfDetail:
+    """Test the aggregated busy-fraction view."""
+
+    @staticmethod
+    def schedule():
+        """M0 busy over [0, 1) and [2, 4) (the second late); M1 busy over [5, 10)."""
+        tasks = _row_of_tasks(3)[1:]  # ids 1 (met) and 2 (missed)
+        tasks[0].start_time, tasks[0].completion_time = 0.0, 1.0
+        tasks[1].start_time, tasks[1].completion_time = 2.0, 4.0
+        tasks[1].deadline = 3.0
+        other = Task(id=3, arrival_time=0, processing_time=5, priority=Priority.LOW, deadline=20)
+        other.start_time, other.completion_time, other.machine_id = 5.0, 10.0, 1
+        return tasks + [other]
+
+    def test_busy_fractions_and_misses(self):
+        """Each bucket holds the share of its width the machine was busy."""
+        busy, misses = visualizer.SchedulingVisualizer._lod_bins(
+            self.schedule(), 2, np.linspace(0, 10, 5))
+
+        np.testing.assert_allclose(busy, [[0.6, 0.6, 0.0, 0.0], [0.0, 0.0, 1.0, 1.0]])
+        np.testing.assert_array_equal(misses, [[0, 1, 0, 0], [0, 0, 0, 0]])
+
+    def test_image_has_one_row_per_machine(self):
+        """The view is one image spanning the time axis, one row per machine."""
+        ax = _draw(self.schedule(), mode='lod')
+
+        image, = ax.images
+        assert image.get_array().shape[0] == 2
+        assert tuple(image.get_extent()) == (0, 12.0, -0.5, 1.5)
+
+    def test_buckets_follow_output_resolution(self):
+        """A 72-dpi draft gets one bucket per output pixel, not per 300-dpi pixel."""
+        draft = _draw(self.schedule(), mode='lod', profile='draft')
+        publication = _draw(self.schedule(), mode='lod')
+
+        columns = draft.images[0].get_array().shape[1]
+        assert draft.figure.dpi == 72
+        assert columns <= 10 * 72
+        assert publication.images[0].get_array().shape[1] > 3 * columns
+
+    def test_auto_lod_threshold_uses_output_pixels(self):
+        """Tasks per pixel are counted at the profile's dpi."""
+        tasks = _row_of_tasks(1000)
+        draft = _draw(tasks, mode='auto', profile='draft')
+        publication = _draw(tasks, mode='auto')
+
+        assert len(draft.images) == 1
+        assert not publication.images
+
+
+class TestTimeWindow:
+    """Test zooming into part of the schedule."""
+
+    def test_clips_axis_and_filters_tasks(self):
+        """Only tasks overlapping the window are drawn, on the window's x range."""
+        ax = _draw(_row_of_tasks(10), mode='patches', time_window=(2, 5))
+
+        assert ax.get_xlim() == (2, 5)
+        assert sorted(p.get_x() for p in ax.patches) == [2, 3, 4]
+        assert '[t=2–5]' in ax.get_title()
+
+    def test_partial_overlap_is_kept(self):
+        """Tasks straddling a window edge stay; tasks touching it do not."""
+        ax = _draw(_row_of_tasks(10), mode='patches', time_window=(2.5, 4.5))
+        assert sorted(p.get_x() for p in ax.patches) == [2, 3, 4]
+
+    def test_window_in_file_name(self):
+        """Zoomed charts get their own file name."""
+        name = visualizer.SchedulingVisualizer.gantt_filename('EDF', 'S', (2, 5))
+        assert name == 'S_EDF_t2-5_gantt.png'
+
+
+class TestFittingLabels:
+    """Test that collection mode only labels bars wide enough for their ID."""
+
+    def test_narrow_bars_are_unlabeled(self):
+        """A wide bar gets its label; a sliver next to it does not."""
+        tasks = _row_of_tasks(2)
+        tasks[0].start_time, tasks[0].completion_time = 0.0, 50.0
+        tasks[1].start_time, tasks[1].completion_time = 50.0, 50.01
+        ax = _draw(tasks, mode='collections')
+
+        assert [t.get_text() for t in ax.texts] == ['T0']
+
+    def test_fit_is_judged_at_output_resolution(self):
+        """A bar that fits its label at 300 dpi fits it at 72 dpi too, on the same axes."""
+        from backend.app.core.visualizer import RenderProfile
+        low = RenderProfile('low', 72, tight_bbox=False, simplified=False)
+        tasks = _row_of_tasks(2)
+        tasks[0].start_time, tasks[0].completion_time = 0.0, 50.0
+        tasks[1].start_time, tasks[1].completion_time = 50.0, 50.01
+        ax = _draw(tasks, mode='collections', profile=low)
+
+        assert ax.figure.dpi == 72
+        assert [t.get_text() for t in ax.texts] == ['T0']
+
+    def test_simplified_profile_draws_no_labels(self):
+        """The draft profile skips labels altogether."""
+        ax = _draw(_row_of_tasks(3, width=20.0), mode='collections', profile='draft')
+        assert not ax.texts
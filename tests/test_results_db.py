@@ -0,0 +1,163 @@
+"""
+Tests for the SQLite results database.
+"""
+
+import csv
+
+import pytest
+
+from backend.app.core.runner import ExperimentRunner
+from backend.app.core.scenarios import get_scenarios
+from backend.app.core.results_db import (
+    ResultsDB, parse_filter, parse_aggregate, export_csv
+)
+
+ALGORITHMS = ['EDF', 'DPE (α=0.3)', 'DPE (α=0.7)']
+
+
+@pytest.fixture(scope='module')
+def runner():
+    runner = ExperimentRunner()
+    runner.run_experiments(get_scenarios(['challenge']), ALGORITHMS)
+    runner.calculate_composite_scores()
+    return runner
+
+
+@pytest.fixture
+def db(tmp_path, runner):
+    with ResultsDB(str(tmp_path / 'results.db')) as db:
+        db.add_results('results/run.csv', runner.results)
+        yield db
+
+
+class TestResultsDB:
+    """Test storing and querying results."""
+
+    def test_rows_and_params(self, db, runner):
+        """Every result is stored with its metrics; DPE labels yield an alpha parameter."""
+        assert len(db) == len(runner.results)
+        assert db.param_names() == ['alpha']
+        assert set(runner.results[0]) - {'Scenario', 'Algorithm'} == set(db.metrics)
+        labels, rows = db.query()
+        assert labels == list(runner.results[0])
+        assert [dict(zip(labels, r)) for r in rows] == runner.results
+
+    def test_aggregates_match_python(self, db, runner):
+        """Grouped means computed in SQL equal the ones computed from the rows."""
+        labels, rows = db.query(group_by=['Algorithm'],
+                                aggregates=['count', 'mean:Total Success Rate (%)'])
+        assert labels == ['Algorithm', 'count', 'mean(Total Success Rate (%))']
+        for algorithm, count, mean in rows:
+            values = [r['Total Success Rate (%)'] for r in runner.results
+                      if r['Algorithm'] == algorithm]
+            assert count == len(values)
+            assert mean == pytest.approx(sum(values) / len(values))
+
+    def test_parameter_filter_and_group(self, db):
+        """Parameters filter and group like columns, through the (name, value) index."""
+        labels, rows = db.query(filters=[('alpha', '>', 0.5)], group_by=['Base Algorithm', 'alpha'])
+        assert rows == [('DPE', 0.7, len(get_scenarios(['challenge'])))]
+        sql, args, _ = db.build_query(filters=[('alpha', '=', 0.3)], aggregates=['count'])
+        assert any('params_value' in step for step in db.explain(sql, args))
+        sql, args, _ = db.build_query(filters=[('Scenario', '=', 'x')])
+        assert any('results_scenario' in step for step in db.explain(sql, args))
+
+    def test_order_limit_and_glob(self, db):
+        """Sorting, limits and wildcard matches run in SQL."""
+        _, rows = db.query(filters=[('Algorithm', 'glob', 'DPE*')], columns=['Algorithm', 'Makespan'],
+                           order_by='Makespan', descending=True, limit=3)
+        assert len(rows) == 3 and all(r[0].startswith('DPE') for r in rows)
+        assert [r[1] for r in rows] == sorted((r[1] for r in rows), reverse=True)
+
+    def test_rewriting_a_source_replaces_it(self, db, runner):
+        """Writing a source again replaces its rows; other sources are kept."""
+        db.add_results('results/run.csv', runner.results[:2])
+        db.add_results('results/other.csv', runner.results[:1])
+        assert len(db) == 3
+        assert sorted((s, n) for s, _, n in db.sources()) == [('results/other.csv', 1),
+                                                             ('results/run.csv', 2)]
+        _, [(count,)] = db.query(filters=[('alpha', '>=', 0)], aggregates=['count'])
+        assert count == sum('α' in r['Algorithm'] for r in runner.results[:2])
+
+    def test_new_metric_column(self, db):
+        """Rows with a new metric add its column; older rows read NULL."""
+        db.add_results('extra.csv', [{'Scenario': 'S', 'Algorithm': 'EDF', 'Energy (J)': 4.5}])
+        assert db.metrics[-1] == 'Energy (J)'
+        _, rows = db.query(columns=['Source', 'Energy (J)'], filters=[('Energy (J)', '>', 0)])
+        assert rows == [('extra.csv', 4.5)]
+        _, [(count,)] = db.query(aggregates=['count:Energy (J)'])
+        assert count == 1
+
+    def test_unknown_column(self, db):
+        """Unknown names are reported with the available columns."""
+        with pytest.raises(ValueError, match='Unknown column'):
+            db.query(filters=[('Nope', '=', 1)])
+
+    def test_reopen(self, tmp_path, runner):
+        """Metric columns and parameters survive reopening the file."""
+        path = str(tmp_path / 'results.db')
+        with ResultsDB(path) as db:
+            db.add_results('a.csv', runner.results)
+        with ResultsDB(path) as db:
+            assert len(db) == len(runner.results)
+            assert 'Makespan' in db.metrics and db.param_names() == ['alpha']
+
+
+class TestImportExport:
+    """Test CSV import and export."""
+
+    def test_import_results_csv(self, tmp_path, runner):
+        """An exported results CSV imports to the same rows the runner held."""
+        path = tmp_path / 'run.csv'
+        runner.export_to_csv(str(path), schedules=False)
+        with ResultsDB(str(tmp_path / 'results.db')) as db:
+            assert db.import_csv(str(path)) == len(runner.results)
+            _, rows = db.query(columns=['Algorithm', 'Makespan'])
+        assert rows == [(r['Algorithm'], r['Makespan']) for r in runner.results]
+
+    def test_import_sweep_csv(self, tmp_path):
+        """Sweep parameter and workload columns are stored as parameters."""
+        path = tmp_path / 'sweep.csv'
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Point', 'Base Algorithm', 'Machines', 'alpha', 'num_tasks', 'load',
+                             'Scenario', 'Algorithm', 'Makespan'])
+            writer.writerow(['k1', 'DPE', 4, 0.25, 100, 0.8, 'Synthetic', 'DPE (α=0.25)', 10])
+            writer.writerow(['k2', 'EDF', 8, '', 100, 0.9, 'Synthetic', 'EDF', 12])
+        with ResultsDB(str(tmp_path / 'results.db')) as db:
+            db.import_csv(str(path))
+            assert db.metrics == ['Makespan']
+            assert db.param_names() == ['alpha', 'load', 'num_tasks']
+            _, rows = db.query(group_by=['Machines', 'load'], aggregates=['max:Makespan'])
+        assert rows == [(4, 0.8, 10.0), (8, 0.9, 12.0)]
+
+    def test_export_csv(self, db, tmp_path):
+        """Query output is written with its labels as the header."""
+        labels, rows = db.query(group_by=['Algorithm'], aggregates=['mean:Makespan'])
+        path = tmp_path / 'out' / 'summary.csv'
+        export_csv(str(path), labels, rows)
+        with open(path, newline='') as f:
+            written = list(csv.reader(f))
+        assert written[0] == ['Algorithm', 'mean(Makespan)']
+        assert len(written) == len(ALGORITHMS) + 1
+
+
+class TestParsing:
+    """Test filter and aggregate specs."""
+
+    def test_parse_filter(self):
+        """Two-character operators win; numeric values become floats."""
+        assert parse_filter('Makespan<=120') == ('Makespan', '<=', 120.0)
+        assert parse_filter('Total Success Rate (%) > 90') == ('Total Success Rate (%)', '>', 90.0)
+        assert parse_filter('Algorithm!=EDF') == ('Algorithm', '!=', 'EDF')
+        for bad in ('Makespan', '<5', 'Makespan='):
+            with pytest.raises(ValueError):
+                parse_filter(bad)
+
+    def test_parse_aggregate(self):
+        """count needs no column; other functions do."""
+        assert parse_aggregate('count') == ('count', None)
+        assert parse_aggregate('MEAN:Makespan') == ('mean', 'Makespan')
+        for bad in ('mean', 'median:Makespan'):
+            with pytest.raises(ValueError):
+                parse_aggregate(bad)
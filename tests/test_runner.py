@@ -0,0 +1,168 @@
+"""
+Tests for the experiment runner's result and schedule persistence.
+"""
+
+import csv
+
+import pytest
+
+from backend.app.core.algorithms import EDF_Scheduler
+from backend.app.core.runner import (
+    ExperimentRunner, SCHEDULE_COLUMNS, load_schedules, schedules_path, sign_test
+)
+from backend.app.core.scenarios import get_scenarios
+from backend.app.core.store import ResultStore
+
+
+class TestSchedulePersistence:
+    """Test that per-run schedules are stored next to the metrics."""
+
+    def _run(self, tasks, tmp_path):
+        runner = ExperimentRunner()
+        scenario = {'name': 'Mixed', 'num_machines': 2, 'tasks': tasks}
+        runner.run_experiment(scenario, 'EDF', EDF_Scheduler)
+        results = tmp_path / 'results.csv'
+        runner.export_to_csv(str(results))
+        return results
+
+    def test_schedules_path(self):
+        """Schedules are written beside the metrics file."""
+        assert schedules_path('results/all.csv') == 'results/all_schedules.csv'
+
+    def test_export_writes_schedule_rows(self, mixed_priority_tasks, tmp_path):
+        """One row per task, with the schedule columns in order."""
+        results = self._run(mixed_priority_tasks, tmp_path)
+        with open(schedules_path(str(results)), newline='') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        assert reader.fieldnames == SCHEDULE_COLUMNS
+        assert len(rows) == len(mixed_priority_tasks)
+        assert {row['Algorithm'] for row in rows} == {'EDF'}
+
+    def test_round_trip_restores_schedule(self, mixed_priority_tasks, tmp_path):
+        """Loaded tasks carry the same assignments and times as a fresh run."""
+        results = self._run(mixed_priority_tasks, tmp_path)
+        stored = load_schedules(schedules_path(str(results)))[('Mixed', 'EDF')]
+
+        EDF_Scheduler(mixed_priority_tasks, 2).run()
+        expected = {t.id: (t.machine_id, t.start_time, t.completion_time)
+                    for t in mixed_priority_tasks}
+        assert stored['num_machines'] == 2
+        assert {t.id: (t.machine_id, t.start_time, t.completion_time)
+                for t in stored['tasks']} == expected
+        assert all(t.priority == orig.priority and t.deadline == orig.deadline
+                   for t, orig in zip(stored['tasks'], mixed_priority_tasks))
+
+    def test_repeated_run_replaces_schedule(self, mixed_priority_tasks):
+        """Running the same pair twice keeps one schedule."""
+        runner = ExperimentRunner()
+        scenario = {'name': 'Mixed', 'num_machines': 2, 'tasks': mixed_priority_tasks}
+        runner.run_experiment(scenario, 'EDF', EDF_Scheduler)
+        runner.run_experiment(scenario, 'EDF', EDF_Scheduler)
+        assert len(runner.schedules) == 1
+        assert len(runner.schedules[('Mixed', 'EDF')]) == len(mixed_priority_tasks)
+
+
+class TestTraces:
+    """Test the binary trace written per experiment."""
+
+    def test_trace_written(self, mixed_priority_tasks, tmp_path):
+        """A traced run leaves one finalized trace file."""
+        runner = ExperimentRunner(trace_dir=str(tmp_path))
+        runner.run_experiment({'name': 'Mixed', 'num_machines': 2, 'tasks': mixed_priority_tasks},
+                              'EDF', EDF_Scheduler)
+        assert [p.name for p in tmp_path.iterdir()] == ['Mixed_EDF.trace']
+
+    def test_failed_run_leaves_no_trace(self, mixed_priority_tasks, tmp_path):
+        """A run that raises removes its partial trace."""
+        class Failing(EDF_Scheduler):
+            def run(self):
+                raise RuntimeError('simulation failed')
+
+        runner = ExperimentRunner(trace_dir=str(tmp_path))
+        with pytest.raises(RuntimeError):
+            runner.run_experiment({'name': 'Mixed', 'num_machines': 2,
+                                   'tasks': mixed_priority_tasks}, 'EDF', Failing)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestRunExperiments:
+    """Test batch runs and paired comparisons."""
+
+    def test_parallel_matches_serial(self):
+        """Worker processes record the same results, in the same order."""
+        scenarios = get_scenarios(['challenge'])
+        serial, parallel = ExperimentRunner(), ExperimentRunner()
+        serial.run_experiments(scenarios, ['EDF', 'DPE (α=0.5)'], workers=1)
+        parallel.run_experiments(scenarios, ['EDF', 'DPE (α=0.5)'], workers=2)
+        assert parallel.results == serial.results
+        assert parallel.schedules == serial.schedules
+        serial.calculate_composite_scores()
+        parallel.calculate_composite_scores()
+        scores = [r['Composite Performance Score (%)'] for r in serial.results]
+        assert [r['Composite Performance Score (%)'] for r in parallel.results] == scores
+        assert any(score > 0 for score in scores)
+
+    def test_scenario_tasks_untouched(self):
+        """Runs schedule fresh records; the shared scenario tasks keep no state."""
+        scenarios = get_scenarios(['challenge'])
+        ExperimentRunner().run_experiments(scenarios, ['EDF', 'SPT'])
+        assert all(t.start_time is None and t.completion_time is None
+                   for s in scenarios for t in s['tasks'])
+
+    def test_unknown_algorithm(self):
+        """Unknown names fail before anything runs."""
+        runner = ExperimentRunner()
+        with pytest.raises(KeyError):
+            runner.run_experiments(get_scenarios(['simple']), ['Nope'])
+        assert runner.results == []
+
+    def test_sign_test(self):
+        """Exact two-sided p-values of the sign test."""
+        assert sign_test(0, 0) == 1.0
+        assert sign_test(5, 5) == 1.0
+        assert sign_test(8, 0) == pytest.approx(2 / 256)
+
+    def test_paired_comparisons(self):
+        """Wins, losses and ties are counted per shared scenario."""
+        runner = ExperimentRunner()
+        runner.results = [
+            {'Scenario': s, 'Algorithm': a, 'Total Success Rate (%)': v}
+            for s, a, v in [('A', 'X', 90), ('A', 'Y', 80), ('B', 'X', 70),
+                            ('B', 'Y', 70), ('C', 'X', 50), ('C', 'Y', 60)]
+        ]
+        [pair] = runner.paired_comparisons()
+        assert (pair['algorithm_a'], pair['algorithm_b']) == ('X', 'Y')
+        assert (pair['wins'], pair['losses'], pair['ties']) == (1, 1, 1)
+
+
+class TestResume:
+    """Test journaled runs picking up where they stopped."""
+
+    ALGORITHMS = ['EDF', 'SPT', 'DPE (α=0.5)']
+
+    def _export(self, runner, path):
+        runner.calculate_composite_scores()
+        runner.export_to_csv(str(path))
+        return path.read_text(), open(schedules_path(str(path))).read()
+
+    def test_resumed_run_matches_fresh_run(self, tmp_path):
+        """Restored rows export exactly like simulated ones, composite scores included."""
+        scenarios = get_scenarios(['challenge'])
+        fresh = ExperimentRunner()
+        fresh.run_experiments(scenarios, self.ALGORITHMS)
+
+        journal = str(tmp_path / 'journal.jsonl')
+        with ResultStore(journal) as store:
+            ExperimentRunner(store=store).run_experiments(scenarios[:2], self.ALGORITHMS)
+        with ResultStore(journal) as store:
+            resumed = ExperimentRunner(store=store)
+            simulated = []
+            simulate = resumed.simulate
+            resumed.simulate = lambda scenario, name, cls: simulated.append(name) or simulate(scenario, name, cls)
+            resumed.run_experiments(scenarios, self.ALGORITHMS)
+            assert len(simulated) == (len(scenarios) - 2) * len(self.ALGORITHMS)
+            assert len(store) == len(scenarios) * len(self.ALGORITHMS)
+
+        assert (self._export(fresh, tmp_path / 'fresh.csv')
+                == self._export(resumed, tmp_path / 'resumed.csv'))
@@ -0,0 +1,103 @@
+"""
+Scaling-complexity tests for the scheduling engine.
+
+Each algorithm is timed at doubling workload sizes and the growth exponent
+(slope of log time vs log size) is compared with the exponent of its
+declared bound over the same sizes. These are timing based, so they are
+marked 'perf' and excluded from the default run:
+
+    pytest -m perf tests/test_scaling.py
+
+Noise handling: sizes are measured round-robin so drift hits all of them
+alike, each size keeps its fastest round, the GC is paused while timing,
+and a fit that exceeds its bound is re-measured before the test fails.
+"""
+
+import math
+
+import pytest
+
+from backend.app.core.algorithms import get_all_algorithms
+from backend.app.core.benchmark import run_case, growth_exponent
+
+COMPLEXITY = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log(n),
+    'n^2': lambda n: n * n,
+}
+
+# Declared bounds with the ready queue bounded (offered load < 1)
+STEADY_STATE_BOUNDS = {name: 'n log n' for name in get_all_algorithms()}
+
+# Overloaded, the ready queue grows with n and every dispatch scans it
+# (compatible_tasks filter + list.remove), so the engine is quadratic today.
+# Tighten these when the ready queue becomes indexed.
+OVERLOAD_BOUNDS = {name: 'n^2' for name in get_all_algorithms()}
+
+STEADY_STATE_SIZES = [1_000, 2_000, 4_000, 8_000]
+OVERLOAD_SIZES = [250, 500, 1_000, 2_000]
+
+# Allowed excess over the bound's own exponent (absorbs residual noise)
+EXPONENT_TOLERANCE = 0.35
+ROUNDS = 3
+ATTEMPTS = 3
+
+
+def measure_exponent(algorithm, sizes, load, machines=4, rounds=ROUNDS):
+    """Fitted growth exponent of Scheduler.run() time over sizes."""
+    best = {n: float('inf') for n in sizes}
+    for _ in range(rounds):
+        for n in sizes:
+            result = run_case(algorithm, n, machines, repeat=1, load=load,
+                              collect_garbage=False)
+            best[n] = min(best[n], result.seconds)
+    return growth_exponent(sizes, [best[n] for n in sizes])
+
+
+def assert_within_bound(algorithm, bound, sizes, load):
+    """Fail only if every attempt's exponent exceeds the bound's."""
+    limit = growth_exponent(sizes, [COMPLEXITY[bound](n) for n in sizes]) + EXPONENT_TOLERANCE
+    measured = []
+    for _ in range(ATTEMPTS):
+        measured.append(measure_exponent(algorithm, sizes, load))
+        if measured[-1] <= limit:
+            return
+    pytest.fail(f"{algorithm} grows like n^{min(measured):.2f} at load {load}, "
+                f"above its declared O({bound}) (limit n^{limit:.2f}); attempts: "
+                + ", ".join(f"{e:.2f}" for e in measured))
+
+
+class TestGrowthExponent:
+    """Test the exponent fit itself (fast, always runs)."""
+
+    @pytest.mark.parametrize('power', [1, 2, 3])
+    def test_recovers_power_law(self, power):
+        """Pure power laws fit to their exponent."""
+        sizes = [100, 200, 400, 800]
+        assert growth_exponent(sizes, [n ** power for n in sizes]) == pytest.approx(power)
+
+    def test_n_log_n_slightly_above_linear(self):
+        """n log n fits between 1 and 1.2 at these sizes."""
+        sizes = STEADY_STATE_SIZES
+        exponent = growth_exponent(sizes, [COMPLEXITY['n log n'](n) for n in sizes])
+        assert 1.0 < exponent < 1.2
+
+    def test_needs_two_sizes(self):
+        """A single size has no slope."""
+        with pytest.raises(ValueError):
+            growth_exponent([10, 10], [1.0, 2.0])
+
+
+@pytest.mark.perf
+class TestScaling:
+    """Test measured growth against each algorithm's declared bound."""
+
+    @pytest.mark.parametrize('algorithm', sorted(STEADY_STATE_BOUNDS))
+    def test_steady_state(self, algorithm):
+        """At 80% load, run time grows no faster than the declared bound."""
+        assert_within_bound(algorithm, STEADY_STATE_BOUNDS[algorithm], STEADY_STATE_SIZES, 0.8)
+
+    @pytest.mark.parametrize('algorithm', sorted(OVERLOAD_BOUNDS))
+    def test_overload(self, algorithm):
+        """At 150% load (growing backlog), run time stays within the declared bound."""
+        assert_within_bound(algorithm, OVERLOAD_BOUNDS[algorithm], OVERLOAD_SIZES, 1.5)
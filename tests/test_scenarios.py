@@ -0,0 +1,71 @@
+"""
+Tests for scenario selection and custom workloads.
+"""
+
+import json
+
+import pytest
+
+from backend.app.core.scenarios import (
+    load_workload, get_scenarios, get_all_scenarios, SCENARIO_CATEGORIES
+)
+from backend.app.core.simulator import Priority
+
+
+class TestLoadWorkload:
+    """Test JSON and CSV workload files."""
+
+    def test_json_with_machines(self, tmp_path):
+        """Object form carries its own machine count; optional fields default."""
+        path = tmp_path / 'customer.json'
+        path.write_text(json.dumps({'num_machines': 3, 'tasks': [
+            {'id': 1, 'arrival_time': 0, 'processing_time': 2, 'priority': 'HIGH', 'deadline': 5},
+            {'id': 2, 'arrival_time': 1, 'processing_time': 3, 'priority': 'low', 'deadline': 9,
+             'cpu_required': 2, 'ram_required': 4},
+        ]}))
+        scenario = load_workload(str(path))
+        assert scenario['name'] == 'customer'
+        assert scenario['num_machines'] == 3
+        assert [t.priority for t in scenario['tasks']] == [Priority.HIGH, Priority.LOW]
+        assert scenario['tasks'][0].cpu_required == 1
+        assert scenario['tasks'][1].ram_required == 4
+
+    def test_csv_and_machine_override(self, tmp_path):
+        """CSV rows parse and an explicit machine count wins."""
+        path = tmp_path / 'tasks.csv'
+        path.write_text('id,arrival_time,processing_time,priority,deadline\n'
+                        '1,0,2,HIGH,5\n2,1,3,LOW,9\n')
+        scenario = load_workload(str(path), num_machines=2)
+        assert len(scenario['tasks']) == 2
+        assert scenario['num_machines'] == 2
+
+    def test_invalid_task(self, tmp_path):
+        """Unknown priorities and missing fields are reported as ValueError."""
+        path = tmp_path / 'bad.json'
+        path.write_text(json.dumps([{'id': 1, 'arrival_time': 0, 'processing_time': 1,
+                                     'priority': 'URGENT', 'deadline': 2}]))
+        with pytest.raises(ValueError):
+            load_workload(str(path))
+
+    def test_object_without_tasks(self, tmp_path):
+        """A JSON object lacking a 'tasks' list is a ValueError, not a KeyError."""
+        path = tmp_path / 'bad.json'
+        path.write_text(json.dumps({'num_machines': 2, 'jobs': []}))
+        with pytest.raises(ValueError, match="no 'tasks' list"):
+            load_workload(str(path))
+
+
+class TestScenarioCategories:
+    """Test selecting scenarios by category."""
+
+    def test_all_categories_match_full_list(self):
+        """Every category together is get_all_scenarios(), in order."""
+        names = [s['name'] for s in get_scenarios(list(SCENARIO_CATEGORIES))]
+        assert names == [s['name'] for s in get_all_scenarios()]
+
+    def test_subset(self):
+        """Only the requested categories are returned."""
+        scenarios = get_scenarios(['extreme'])
+        assert scenarios and all(s['name'].startswith('Extreme') for s in scenarios)
+        with pytest.raises(KeyError):
+            get_scenarios(['bogus'])
@@ -5,7 +5,7 @@ Tests Task, Machine, Event, and Scheduler base class functionality.
 """
 
 import pytest
-from backend.app.core.simulator import Task, Priority, Machine, Event, Scheduler
+from backend.app.core.simulator import Task, Priority, Machine, Event, Scheduler, fresh_tasks
 from typing import List, Optional
 
 
@@ -315,3 +315,51 @@ class TestSchedulerEdgeCases:
         # Check no overlaps (each task starts after previous completes)
         for i in range(1, len(completion_times)):
             assert completion_times[i] >= completion_times[i-1]
+
+    def test_record_logs_disabled(self, mixed_priority_tasks):
+        """Disabling logs returns an empty log but the same schedule."""
+        import copy
+        logged = self.MinimalScheduler(copy.deepcopy(mixed_priority_tasks), num_machines=2)
+        assert logged.run()
+        quiet = self.MinimalScheduler(copy.deepcopy(mixed_priority_tasks), num_machines=2)
+        quiet.record_logs = False
+        assert quiet.run() == []
+        assert ([(t.start_time, t.machine_id) for t in quiet.all_tasks]
+                == [(t.start_time, t.machine_id) for t in logged.all_tasks])
+
+
+class TestTaskSpecs:
+    """Test frozen task definitions and fresh run records."""
+
+    MinimalScheduler = TestSchedulerBase.MinimalScheduler
+
+    def test_spec_is_frozen(self, simple_task):
+        """Specs cannot be modified, so runs can share them."""
+        spec = simple_task.spec
+        with pytest.raises(AttributeError):
+            spec.deadline = 0
+        assert spec.fresh() == simple_task
+
+    def test_fresh_tasks_drop_run_state(self, mixed_priority_tasks):
+        """Fresh records keep the definition but none of a previous run's state."""
+        self.MinimalScheduler(mixed_priority_tasks, num_machines=2).run()
+        fresh = fresh_tasks(mixed_priority_tasks)
+        assert all(t.start_time is None and t.completion_time is None and t.machine_id is None
+                   for t in fresh)
+        assert [t.spec for t in fresh] == [t.spec for t in mixed_priority_tasks]
+        assert not any(a is b for a, b in zip(fresh, mixed_priority_tasks))
+
+    def test_scheduler_accepts_specs(self, mixed_priority_tasks):
+        """Runs over shared specs schedule their own records, identically each time."""
+        specs = [t.spec for t in mixed_priority_tasks]
+        first = self.MinimalScheduler(specs, num_machines=2)
+        first.run()
+        second = self.MinimalScheduler(specs, num_machines=2)
+        second.run()
+        assert all(isinstance(t, Task) for t in first.all_tasks)
+        assert first.all_tasks == second.all_tasks
+        assert all(t.completion_time is not None for t in first.all_tasks)
+
+        reference = self.MinimalScheduler(fresh_tasks(mixed_priority_tasks), num_machines=2)
+        reference.run()
+        assert first.all_tasks == reference.all_tasks
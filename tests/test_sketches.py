@@ -0,0 +1,110 @@
+"""
+Tests for streaming quantile sketches (sketches.py).
+"""
+
+import random
+import pytest
+from backend.app.core.simulator import Task, Priority
+from backend.app.core.algorithms import EDF_Scheduler
+from backend.app.core.sketches import QuantileSketch, LatencyRecorder
+
+
+def exact_quantile(values, q):
+    """Lower-rank quantile matching the sketch's rank convention."""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Test accuracy, merging and memory bounds of QuantileSketch."""
+
+    @pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99])
+    def test_relative_accuracy(self, q):
+        """Estimates stay within the configured relative error."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(2.0, 1.0) for _ in range(5000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.update(values)
+
+        expected = exact_quantile(values, q)
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+    def test_negative_and_zero_values(self):
+        """Lateness-style data with signs and zeros keeps its ordering."""
+        sketch = QuantileSketch()
+        sketch.update([-10.0, -1.0, 0.0, 0.0, 5.0])
+
+        assert sketch.quantile(0.0) == pytest.approx(-10.0, rel=0.01)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(5.0, rel=0.01)
+
+    def test_merge_matches_single_sketch(self):
+        """Merging partial sketches equals sketching all values at once."""
+        rng = random.Random(3)
+        values = [rng.expovariate(0.1) for _ in range(2000)]
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        whole.update(values)
+        left.update(values[:700])
+        right.update(values[700:])
+        left.merge(right)
+
+        assert left.count == whole.count
+        for q in (0.5, 0.95, 0.99):
+            assert left.quantile(q) == whole.quantile(q)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Sketches must share accuracy to merge."""
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_bounded_bins_preserve_tail(self):
+        """Collapsing keeps memory bounded while the upper tail stays accurate."""
+        sketch = QuantileSketch(relative_accuracy=0.01, max_bins=64)
+        values = [10 ** (i / 100) for i in range(-600, 600)]
+        sketch.update(values)
+
+        assert len(sketch._positive) <= 64
+        assert sketch.quantile(0.99) == pytest.approx(exact_quantile(values, 0.99), rel=0.011)
+
+    def test_round_trip_dict(self):
+        """Serialized sketches rebuild to identical estimates."""
+        sketch = QuantileSketch()
+        sketch.update([1.0, 2.0, 3.0, -4.0])
+        rebuilt = QuantileSketch.from_dict(sketch.to_dict())
+        assert rebuilt.quantile(0.75) == sketch.quantile(0.75)
+        assert rebuilt.count == 4
+
+    def test_empty_sketch(self):
+        """Empty sketches report no quantile."""
+        assert QuantileSketch().quantile(0.5) is None
+        assert QuantileSketch().summary()['p99'] is None
+
+
+class TestLatencyRecorder:
+    """Test per-priority latency sketches collected during a run."""
+
+    def test_recorded_during_run(self, mixed_priority_tasks):
+        """Sketches match the response times of the finished schedule."""
+        scheduler = EDF_Scheduler(mixed_priority_tasks, num_machines=2)
+        recorder = scheduler.attach(LatencyRecorder())
+        scheduler.run()
+
+        high = [t for t in mixed_priority_tasks if t.priority == Priority.HIGH]
+        worst = max(t.completion_time - t.arrival_time for t in high)
+        assert recorder.quantile('response_time', 1.0, 'HIGH') == pytest.approx(worst, rel=0.01)
+        assert recorder.sketches['LOW']['lateness'].count == 3
+
+        summary = scheduler.get_results()['latency_percentiles']
+        assert summary['ALL']['response_time']['count'] == len(mixed_priority_tasks)
+        assert set(summary) == {'HIGH', 'LOW', 'ALL'}
+
+    def test_merge_replications(self):
+        """Recorders from separate runs merge into one distribution."""
+        first, second = LatencyRecorder(), LatencyRecorder()
+        task = Task(1, 0.0, 1.0, Priority.LOW, 5.0)
+        first.on_event('COMPLETION', 2.0, task)
+        second.on_event('COMPLETION', 8.0, task)
+        first.merge(second)
+
+        assert first.sketches['LOW']['response_time'].count == 2
+        assert first.quantile('lateness', 1.0) == pytest.approx(3.0, rel=0.01)
@@ -0,0 +1,69 @@
+"""
+Tests for the durable experiment journal.
+"""
+
+import copy
+
+from backend.app.core.store import (
+    ResultStore, experiment_key, journal_path, open_journal, write_atomic
+)
+
+
+def scenario(tasks):
+    return {'name': 'Mixed', 'num_machines': 2, 'tasks': tasks}
+
+
+class TestResultStore:
+    """Test appending, reloading and repairing the journal."""
+
+    def test_round_trip(self, tmp_path):
+        """Appended records are there after reopening, in write order."""
+        path = str(tmp_path / 'journal.jsonl')
+        with ResultStore(path) as store:
+            store.append('a', {'Makespan': 12, 'Algorithm': 'DPE (α=0.5)'}, [{'Task ID': 1}])
+            store.append('b', {'Makespan': 3.25})
+        reopened = ResultStore(path)
+        assert len(reopened) == 2 and 'a' in reopened
+        assert [r['key'] for r in reopened.records()] == ['a', 'b']
+        assert reopened.get('a')['metrics'] == {'Makespan': 12, 'Algorithm': 'DPE (α=0.5)'}
+        assert reopened.get('a')['schedule'] == [{'Task ID': 1}]
+
+    def test_torn_tail_repaired(self, tmp_path):
+        """A half-written last line is dropped and new appends start cleanly."""
+        path = tmp_path / 'journal.jsonl'
+        with ResultStore(str(path)) as store:
+            store.append('a', {'Makespan': 1})
+        with open(path, 'ab') as f:
+            f.write(b'{"key":"b","metr')
+        store = ResultStore(str(path))
+        assert store.repaired == len(b'{"key":"b","metr')
+        assert list(store.records())[0]['key'] == 'a' and len(store) == 1
+        store.append('c', {'Makespan': 2})
+        store.close()
+        assert len(ResultStore(str(path))) == 2
+
+    def test_open_journal_restart(self, tmp_path):
+        """Resuming keeps records; restarting deletes them."""
+        results = str(tmp_path / 'results.csv')
+        assert journal_path(results) == str(tmp_path / 'results_journal.jsonl')
+        with open_journal(results) as store:
+            store.append('a', {})
+        assert len(open_journal(results)) == 1
+        assert len(open_journal(results, resume=False)) == 0
+
+    def test_key_tracks_scenario_contents(self, mixed_priority_tasks):
+        """Changing a task or the algorithm changes the key."""
+        base = experiment_key(scenario(mixed_priority_tasks), 'EDF')
+        edited = copy.deepcopy(mixed_priority_tasks)
+        edited[0].deadline += 1
+        assert experiment_key(scenario(edited), 'EDF') != base
+        assert experiment_key(scenario(mixed_priority_tasks), 'SPT') != base
+        assert experiment_key(scenario(copy.deepcopy(mixed_priority_tasks)), 'EDF') == base
+
+    def test_write_atomic(self, tmp_path):
+        """The target is replaced whole and no temporary file is left."""
+        path = tmp_path / 'out' / 'results.csv'
+        write_atomic(str(path), lambda f: f.write('a,b\n'))
+        write_atomic(str(path), lambda f: f.write('c,d\n'))
+        assert path.read_text() == 'c,d\n'
+        assert [p.name for p in path.parent.iterdir()] == ['results.csv']
@@ -0,0 +1,107 @@
+"""
+Tests for declarative parameter sweeps.
+"""
+
+import csv
+
+import pytest
+
+from backend.app.core.sweep import (
+    expand_values, expand_grid, run_sweep, sweep_columns, completed_keys, KEY_COLUMN
+)
+
+GRID = {
+    'algorithms': ['EDF', {'name': 'DPE', 'params': {'alpha': [0.3, 0.7]}}],
+    'num_machines': [2, 4],
+    'workload': {'num_tasks': 100, 'seed': [0, 1]},
+}
+
+
+def read_rows(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+class TestGrid:
+    """Test grid expansion."""
+
+    def test_inclusive_range(self):
+        """Ranges include stop and avoid float drift."""
+        values = expand_values({'start': 0.05, 'stop': 0.95, 'step': 0.05})
+        assert len(values) == 19
+        assert values[2] == 0.15 and values[-1] == 0.95
+        assert expand_values({'start': 2, 'stop': 8, 'step': 2}) == [2, 4, 6, 8]
+        assert expand_values(3) == [3]
+
+    def test_cartesian_product(self):
+        """Every algorithm variant × machine count × workload is a distinct point."""
+        points = expand_grid(GRID)
+        assert len(points) == 3 * 2 * 2
+        assert len({p.key for p in points}) == len(points)
+        assert {p.label for p in points} == {'EDF', 'DPE (α=0.3)', 'DPE (α=0.7)'}
+
+    @pytest.mark.parametrize('spec', [
+        {'algorithms': ['Nope']},
+        {'algorithms': [{'name': 'EDF', 'params': {'alpha': [0.5]}}]},
+        {'algorithms': ['EDF'], 'workload': {'tasks': 10}},
+        {'algorithms': ['EDF'], 'machines': [2]},
+        {'algorithms': []},
+    ])
+    def test_invalid_specs(self, spec):
+        """Unknown algorithms, parameters and keys are rejected up front."""
+        with pytest.raises(ValueError):
+            expand_grid(spec)
+
+
+class TestRunSweep:
+    """Test streaming and resuming."""
+
+    def test_rows_cover_grid(self, tmp_path):
+        """Each point gets one row with its parameters and metrics."""
+        path = tmp_path / 'sweep.csv'
+        points = expand_grid(GRID)
+        assert run_sweep(points, str(path), workers=1) == len(points)
+        rows = read_rows(path)
+        assert {r[KEY_COLUMN] for r in rows} == {p.key for p in points}
+        dpe = [r for r in rows if r['Base Algorithm'] == 'DPE']
+        assert {r['alpha'] for r in dpe} == {'0.3', '0.7'}
+        assert all(r['Total Tasks'] == '100' for r in rows)
+
+    def test_resume_skips_finished_points(self, tmp_path):
+        """A second run only adds the points missing from the file."""
+        path = tmp_path / 'sweep.csv'
+        points = expand_grid(GRID)
+        run_sweep(points[:5], str(path), workers=1)
+        seen = []
+        written = run_sweep(points, str(path), workers=1, on_row=lambda row, i, n: seen.append(n))
+        assert written == len(points) - 5
+        assert seen[-1] == len(points) - 5
+        assert len(read_rows(path)) == len(points)
+
+    def test_truncated_row_reruns(self, tmp_path):
+        """A row cut off mid-write is dropped and its point runs again."""
+        path = tmp_path / 'sweep.csv'
+        points = expand_grid(GRID)
+        run_sweep(points[:2], str(path), workers=1)
+        text = path.read_text()
+        path.write_text(text[:-20])
+        assert len(completed_keys(str(path), sweep_columns(points))) == 1
+        run_sweep(points[:2], str(path), workers=1)
+        assert len(read_rows(path)) == 2
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Worker processes produce the same rows as an in-process run."""
+        points = expand_grid(dict(GRID, num_machines=[2]))
+        run_sweep(points, str(tmp_path / 'serial.csv'), workers=1)
+        run_sweep(points, str(tmp_path / 'parallel.csv'), workers=2)
+        def by_key(name):
+            return {r[KEY_COLUMN]: r for r in read_rows(tmp_path / name)}
+        assert by_key('serial.csv') == by_key('parallel.csv')
+
+    def test_other_grid_rejected(self, tmp_path):
+        """Resuming into a file written for different columns fails."""
+        path = tmp_path / 'sweep.csv'
+        run_sweep(expand_grid({'algorithms': ['EDF'], 'workload': {'num_tasks': 50}}),
+                  str(path), workers=1)
+        with pytest.raises(ValueError):
+            run_sweep(expand_grid(GRID), str(path), workers=1)
@@ -0,0 +1,131 @@
+"""
+Tests for incremental utilization and backlog timelines (timelines.py).
+"""
+
+import pytest
+from backend.app.core.simulator import Task, Priority
+from backend.app.core.algorithms import EDF_Scheduler
+from backend.app.core.intervals import ScheduleIndex
+from backend.app.core.timelines import StepTimeline, TimelineRecorder
+
+
+class TestStepTimeline:
+    """Test the piecewise-constant series."""
+
+    def test_steps_and_lookup(self):
+        """Values hold from each change point until the next."""
+        timeline = StepTimeline()
+        timeline.add(2.0, 1)
+        timeline.add(5.0, 2)
+        timeline.add(8.0, -3)
+
+        assert timeline.value_at(1.0) == 0
+        assert timeline.value_at(2.0) == 1
+        assert timeline.value_at(6.0) == 3
+        assert timeline.value_at(9.0) == 0
+
+    def test_same_instant_changes_collapse(self):
+        """Changes at one instant produce a single step; no-ops are dropped."""
+        timeline = StepTimeline()
+        timeline.add(1.0, 1)
+        timeline.add(1.0, 1)
+        timeline.add(3.0, 1)
+        timeline.add(3.0, -1)
+
+        assert timeline.to_dict() == {'times': [0.0, 1.0], 'values': [0, 2]}
+
+    def test_resample_time_weighted(self):
+        """Buckets hold the time-weighted mean of the series."""
+        timeline = StepTimeline()
+        timeline.set(1.0, 2)
+        timeline.set(3.0, 0)
+        timeline.close(4.0)
+
+        sampled = timeline.resample(2.0)
+        assert sampled['times'] == [0.0, 2.0]
+        assert sampled['values'] == pytest.approx([1.0, 1.0])
+
+    def test_resample_rejects_bad_width(self):
+        """Bucket width must be positive."""
+        with pytest.raises(ValueError):
+            StepTimeline().resample(0)
+
+
+class TestTimelineRecorder:
+    """Test timelines recorded during a simulation."""
+
+    @pytest.fixture
+    def recorded(self, mixed_priority_tasks):
+        scheduler = EDF_Scheduler(mixed_priority_tasks, num_machines=2)
+        recorder = scheduler.attach(TimelineRecorder())
+        scheduler.run()
+        return scheduler, recorder
+
+    def test_curves_return_to_zero(self, recorded):
+        """Every curve is back at zero once all tasks complete."""
+        _, recorder = recorded
+        for name, timeline in recorder.timelines.items():
+            assert timeline.current == 0, name
+
+    def test_busy_machines_match_schedule(self, recorded):
+        """Busy-machine curve agrees with the finished schedule."""
+        scheduler, recorder = recorded
+        index = ScheduleIndex.from_scheduler(scheduler)
+        for t in [0.5, 3.0, 7.5, 12.0, 20.0]:
+            assert recorder.busy_machines.value_at(t) == index.busy_machines_at(t)
+
+    def test_priority_queues_sum_to_total(self, recorded):
+        """Per-priority backlog curves add up to the overall backlog."""
+        _, recorder = recorded
+        for t in [0.0, 2.0, 4.0, 6.0]:
+            per_priority = sum(tl.value_at(t) for tl in recorder.ready_by_priority.values())
+            assert per_priority == recorder.ready_queue.value_at(t)
+
+    def test_resources_in_use(self):
+        """CPU and RAM curves track the requirements of running tasks."""
+        tasks = [Task(1, 0.0, 4.0, Priority.HIGH, 10.0, cpu_required=3, ram_required=6)]
+        scheduler = EDF_Scheduler(tasks, num_machines=1)
+        recorder = scheduler.attach(TimelineRecorder())
+        scheduler.run()
+
+        assert recorder.cpu_in_use.value_at(2.0) == 3
+        assert recorder.ram_in_use.value_at(2.0) == 6
+        assert recorder.cpu_in_use.value_at(4.0) == 0
+
+    def test_exported_in_results(self, mixed_priority_tasks):
+        """Bucketed curves appear under 'timelines' in get_results()."""
+        scheduler = EDF_Scheduler(mixed_priority_tasks, num_machines=2)
+        scheduler.attach(TimelineRecorder(bucket_width=5.0))
+        scheduler.run()
+        timelines = scheduler.get_results()['timelines']
+
+        assert set(timelines) == {'busy_machines', 'ready_queue', 'ready_queue_HIGH',
+                                  'ready_queue_LOW', 'cpu_in_use', 'ram_in_use'}
+        assert timelines['busy_machines']['times'][:2] == [0.0, 5.0]
+
+
+class TestTimelineBuckets:
+    """Test validation of bucketed timelines requested through POST /simulate."""
+
+    @staticmethod
+    def payload(width):
+        """Two tasks over a 1e5-long horizon with curves bucketed by width."""
+        tasks = [{'id': i, 'arrival_time': 0.0, 'processing_time': 5e4,
+                  'priority': 'HIGH', 'deadline': 1e6} for i in range(2)]
+        return {'algorithm': 'EDF', 'num_machines': 1, 'tasks': tasks,
+                'timelines': True, 'timeline_bucket_width': width}
+
+    @pytest.mark.parametrize('width', [0, -1.0])
+    def test_rejects_non_positive_width(self, api_client, width):
+        """Zero and negative widths fail validation instead of the simulation."""
+        assert api_client.post('/simulate', json=self.payload(width)).status_code == 422
+
+    def test_rejects_too_many_buckets(self, api_client):
+        """A width that would produce more than MAX_TIMELINE_BUCKETS buckets is refused."""
+        assert api_client.post('/simulate', json=self.payload(0.01)).status_code == 422
+
+    def test_accepts_reasonable_width(self, api_client):
+        """Widths within the cap return bucketed curves."""
+        response = api_client.post('/simulate', json=self.payload(1e3))
+        assert response.status_code == 200
+        assert len(response.json()['timelines']['busy_machines']['times']) == 100
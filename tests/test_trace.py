@@ -0,0 +1,114 @@
+"""
+Tests for binary schedule traces (trace.py).
+"""
+
+import numpy as np
+import pytest
+from backend.app.core.algorithms import EDF_Scheduler
+from backend.app.core.trace import TraceWriter, TraceReader, EVENT_CODES
+
+
+@pytest.fixture
+def traced_run(tmp_path, mixed_priority_tasks):
+    """Run EDF with a trace writer attached and return (tasks, trace path)."""
+    path = tmp_path / "edf.trace"
+    scheduler = EDF_Scheduler(mixed_priority_tasks, num_machines=2)
+    scheduler.attach(TraceWriter(path, metadata={'scenario': 'fixture'}, buffer_size=4))
+    scheduler.run()
+    return mixed_priority_tasks, path
+
+
+class TestTraceRoundTrip:
+    """Test writing and memory-mapped reading of traces."""
+
+    def test_event_counts(self, traced_run):
+        """Every task produces one ARRIVAL, START and COMPLETION event."""
+        tasks, path = traced_run
+        reader = TraceReader(path)
+
+        assert len(reader.events) == 3 * len(tasks)
+        for code in EVENT_CODES.values():
+            assert np.sum(reader.events['event'] == code) == len(tasks)
+
+    def test_events_sorted_by_time(self, traced_run):
+        """Events are stored in simulation order."""
+        _, path = traced_run
+        times = TraceReader(path).events['time']
+        assert np.all(np.diff(times) >= 0)
+
+    def test_metadata(self, traced_run):
+        """Writer metadata and scheduler defaults are stored."""
+        _, path = traced_run
+        reader = TraceReader(path)
+        assert reader.metadata['scenario'] == 'fixture'
+        assert reader.metadata['num_machines'] == 2
+        assert reader.metadata['algorithm'] == 'EDF_Scheduler'
+
+    def test_task_table_round_trip(self, traced_run):
+        """Rebuilt tasks carry the recorded schedule."""
+        tasks, path = traced_run
+        rebuilt = {t.id: t for t in TraceReader(path).to_tasks()}
+
+        for task in tasks:
+            copy = rebuilt[task.id]
+            assert copy.priority == task.priority
+            assert copy.start_time == task.start_time
+            assert copy.completion_time == task.completion_time
+            assert copy.machine_id == task.machine_id
+
+    def test_window_is_view(self, traced_run):
+        """Time-window slices share memory with the mapped event table."""
+        _, path = traced_run
+        reader = TraceReader(path)
+        window = reader.window(2.0, 6.0)
+
+        assert np.all((window['time'] >= 2.0) & (window['time'] < 6.0))
+        assert np.shares_memory(window, reader.events)
+
+    def test_machine_events(self, traced_run):
+        """Machine filter returns only START/COMPLETION rows on that machine."""
+        tasks, path = traced_run
+        events = TraceReader(path).machine_events(0)
+        on_machine = [t for t in tasks if t.machine_id == 0]
+
+        assert len(events) == 2 * len(on_machine)
+        assert set(events['task']) == {t.id for t in on_machine}
+
+    def test_extra_table(self, tmp_path):
+        """Additional structured tables are stored and mapped by name."""
+        path = tmp_path / "extra.trace"
+        writer = TraceWriter(path)
+        extra = np.array([(1.0, 2)], dtype=[('t', '<f8'), ('n', '<i4')])
+        writer.add_table('extra', extra)
+        writer.close([])
+
+        reader = TraceReader(path)
+        assert 'extra' in reader.table_names
+        assert reader.table('extra')['n'][0] == 2
+        assert len(reader.events) == 0
+
+    def test_failed_run_leaves_no_trace(self, tmp_path):
+        """A run that raises inside the context closes and removes the partial file."""
+        path = tmp_path / "failed.trace"
+        with pytest.raises(RuntimeError):
+            with TraceWriter(path, buffer_size=1) as writer:
+                writer.record(0.0, 'ARRIVAL', 1)
+                raise RuntimeError('simulation failed')
+
+        assert writer._file.closed
+        assert not path.exists()
+
+    def test_context_finalizes_trace(self, tmp_path):
+        """Leaving the context normally writes a readable trace."""
+        path = tmp_path / "ok.trace"
+        with TraceWriter(path) as writer:
+            writer.record(0.0, 'ARRIVAL', 1)
+
+        assert len(TraceReader(path).events) == 1
+
+    def test_rejects_non_trace(self, tmp_path):
+        """Reading a file without the trace header fails clearly."""
+        path = tmp_path / "bogus.trace"
+        path.write_bytes(b'x' * 128)
+        with pytest.raises(ValueError):
+            TraceReader(path)
@@ -0,0 +1,151 @@
+"""
+Tests for windowed online metrics (windows.py).
+"""
+
+import json
+import pytest
+from backend.app.core.simulator import Task, Priority
+from backend.app.core.algorithms import FCFS_Scheduler
+from backend.app.core.windows import TumblingWindowAggregator, SlidingWindowAggregator
+from backend.app.core.trace import TraceWriter, TraceReader
+
+
+@pytest.fixture
+def sequential_tasks():
+    """Four unit tasks on one machine completing at t=1, 2, 3, 4; task 3 is late."""
+    return [
+        Task(1, 0.0, 1.0, Priority.HIGH, 10.0),
+        Task(2, 0.0, 1.0, Priority.LOW, 10.0),
+        Task(3, 0.0, 1.0, Priority.LOW, 2.0),
+        Task(4, 0.0, 1.0, Priority.HIGH, 10.0),
+    ]
+
+
+class TestTumblingWindows:
+    """Test non-overlapping windows."""
+
+    def test_counts_and_ratios(self, sequential_tasks):
+        """Each window reports completions, throughput and hit ratios."""
+        scheduler = FCFS_Scheduler(sequential_tasks, num_machines=1)
+        aggregator = scheduler.attach(TumblingWindowAggregator(2.0))
+        scheduler.run()
+
+        first, second, third = aggregator.windows
+        assert (first['start'], first['end'], first['completions']) == (0.0, 2.0, 1)
+        assert second['completions'] == 2
+        assert second['throughput'] == pytest.approx(1.0)
+        assert second['low_hit_ratio'] == pytest.approx(0.5)
+        assert second['high_completions'] == 0
+        assert second['high_hit_ratio'] is None
+        assert third['completions'] == 1
+        assert sum(w['completions'] for w in aggregator.windows) == 4
+
+    def test_streams_windows_as_they_close(self, sequential_tasks):
+        """The callback sees each window and results mirror the emitted rows."""
+        streamed = []
+        scheduler = FCFS_Scheduler(sequential_tasks, num_machines=1)
+        scheduler.attach(TumblingWindowAggregator(1.5, on_window=streamed.append))
+        scheduler.run()
+
+        assert streamed == scheduler.get_results()['tumbling_windows']
+
+    def test_rejects_non_positive_width(self):
+        """Window width must be positive."""
+        with pytest.raises(ValueError):
+            TumblingWindowAggregator(0)
+
+
+class TestSlidingWindows:
+    """Test trailing windows sampled at a fixed step."""
+
+    def test_trailing_window(self, sequential_tasks):
+        """Samples cover [t - width, t) and evict old completions."""
+        scheduler = FCFS_Scheduler(sequential_tasks, num_machines=1)
+        aggregator = scheduler.attach(SlidingWindowAggregator(2.0, step=1.0))
+        scheduler.run()
+
+        by_end = {w['end']: w for w in aggregator.windows}
+        assert by_end[2.0]['completions'] == 1   # t=1
+        assert by_end[3.0]['completions'] == 2   # t=1, 2
+        assert by_end[4.0]['completions'] == 2   # t=2, 3
+        assert by_end[4.0]['deadline_hit_ratio'] == pytest.approx(0.5)
+        assert by_end[5.0]['completions'] == 2   # t=3, 4
+        assert by_end[5.0]['mean_lateness'] == pytest.approx((1.0 - 6.0) / 2)
+
+    def test_stored_in_trace(self, tmp_path, sequential_tasks):
+        """An attached TraceWriter stores the window series as a table."""
+        path = tmp_path / "windows.trace"
+        scheduler = FCFS_Scheduler(sequential_tasks, num_machines=1)
+        scheduler.attach(TraceWriter(path))
+        aggregator = scheduler.attach(SlidingWindowAggregator(2.0, step=1.0))
+        scheduler.run()
+
+        table = TraceReader(path).table('sliding_windows')
+        assert len(table) == len(aggregator.windows)
+        assert list(table['completions']) == [w['completions'] for w in aggregator.windows]
+
+
+class TestWindowStream:
+    """Test the POST /simulate/windows endpoint."""
+
+    @staticmethod
+    def payload(**overrides):
+        """Request for ten unit tasks on one machine."""
+        tasks = [{'id': i, 'arrival_time': 0.0, 'processing_time': 1.0,
+                  'priority': 'HIGH', 'deadline': 20.0} for i in range(10)]
+        return {'algorithm': 'FCFS', 'num_machines': 1, 'tasks': tasks, **overrides}
+
+    def test_streams_one_line_per_window(self, api_client):
+        """Windows arrive as newline-delimited JSON."""
+        response = api_client.post('/simulate/windows', json=self.payload(window_width=2.0))
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert response.status_code == 200
+        assert sum(r['completions'] for r in rows) == 10
+
+    def test_rejects_too_many_windows(self, api_client):
+        """A width that would produce more than MAX_STREAM_WINDOWS windows is refused."""
+        response = api_client.post('/simulate/windows', json=self.payload(window_width=1e-6))
+
+        assert response.status_code == 422
+
+    def test_reports_simulation_errors(self, api_client, monkeypatch):
+        """A failing simulation ends the stream with an error record."""
+        from backend.app.api import routes
+        build = routes._build_scheduler
+
+        def fail():
+            raise RuntimeError('boom')
+
+        def failing(request):
+            scheduler = build(request)
+            scheduler.run = fail
+            return scheduler
+
+        monkeypatch.setattr(routes, '_build_scheduler', failing)
+        response = api_client.post('/simulate/windows', json=self.payload(window_width=2.0))
+
+        assert [json.loads(line) for line in response.text.splitlines()] == [{'error': 'boom'}]
+
+    def test_closing_the_stream_stops_the_simulation(self, monkeypatch):
+        """The simulation thread exits once the client stops reading."""
+        import threading
+        from backend.app.api import routes
+        from backend.app.models import schemas
+        threads = []
+
+        class RecordingThread(threading.Thread):
+            def start(self):
+                threads.append(self)
+                super().start()
+
+        monkeypatch.setattr(routes, 'STREAM_BUFFER', 1)
+        monkeypatch.setattr(routes.threading, 'Thread', RecordingThread)
+        monkeypatch.setattr(routes, 'StreamingResponse', lambda content, media_type: content)
+        request = schemas.WindowedMetricsRequest(**self.payload(window_width=1.0))
+        stream = routes.stream_windowed_metrics(request)
+        next(stream)
+        stream.close()
+
+        threads[0].join(timeout=5)
+        assert not threads[0].is_alive()